@@ -10,14 +10,18 @@ import time
 import math
 from collections import defaultdict
 import threading
+import multiprocessing
 import folium
 from folium.plugins import MarkerCluster
 import webbrowser
 import tempfile
 import traceback
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import pickle
-from sklearn.cluster import KMeans
+
+from ga_vns_solver import solve, find_point_index
+from route_optimization import optimize_route_aco, RouteCostCache
+from multi_start import solution_metrics, make_run_result, iter_parallel_runs, spawn_run_seeds, split_time_budget
+from checkpoint import MultiStartCheckpoint, data_fingerprint
 
 class TPSClusteringApp:
     def __init__(self, root):
@@ -95,6 +99,10 @@ class TPSClusteringApp:
         self.aco_ants_var = tk.IntVar(value=10)
         ttk.Entry(param_frame, textvariable=self.aco_ants_var, width=10).grid(row=4, column=3, padx=5, pady=5, sticky="w")
         
+        # MAX-MIN Ant System: konvergen dalam iterasi lebih sedikit
+        self.aco_mmas_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(param_frame, text="ACO MAX-MIN (MMAS)", variable=self.aco_mmas_var).grid(row=6, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        
         # Titik awal dan akhir rute
         route_endpoints_frame = ttk.LabelFrame(param_frame, text="Titik Awal & Akhir Rute")
         route_endpoints_frame.grid(row=5, column=0, columnspan=4, padx=5, pady=5, sticky="we")
@@ -142,6 +150,21 @@ class TPSClusteringApp:
         self.max_no_improvement_var = tk.IntVar(value=3)
         ttk.Entry(multi_frame, textvariable=self.max_no_improvement_var, width=10).grid(row=2, column=1, padx=5, pady=5, sticky="w")
         
+        # Batas waktu total multi-start (0 = tanpa batas)
+        ttk.Label(multi_frame, text="Batas Waktu (detik):").grid(row=2, column=2, padx=5, pady=5, sticky="w")
+        self.time_limit_var = tk.DoubleVar(value=0)
+        ttk.Entry(multi_frame, textvariable=self.time_limit_var, width=10).grid(row=2, column=3, padx=5, pady=5, sticky="w")
+        
+        # Island model: run paralel bertukar solusi terbaik secara berkala (ring migration)
+        ttk.Label(multi_frame, text="Island Model (Migrasi):").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        self.island_model_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(multi_frame, variable=self.island_model_var).grid(row=3, column=1, padx=5, pady=5, sticky="w")
+        
+        # Checkpoint berkala; multi-start yang terputus dilanjutkan tanpa mengulang run yang selesai
+        ttk.Label(multi_frame, text="Checkpoint & Resume:").grid(row=3, column=2, padx=5, pady=5, sticky="w")
+        self.checkpoint_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(multi_frame, variable=self.checkpoint_var).grid(row=3, column=3, padx=5, pady=5, sticky="w")
+        
         # Parameter Armada
         fleet_frame = ttk.LabelFrame(middle_frame, text="Parameter Armada Pengangkutan")
         fleet_frame.pack(fill="x", padx=5, pady=5)
@@ -335,169 +358,79 @@ class TPSClusteringApp:
         """
         Optimize route using Ant Colony Optimization with optional fixed start and end points
         """
-        # Handle special cases of empty or very small clusters
-        if len(cluster) == 0:
-            if start_idx is not None and end_idx is not None:
-                # Jika tidak ada TPS, cukup rute dari Garasi ke TPA
-                return [start_idx, end_idx], distance_matrix[start_idx][end_idx]
-            return cluster, 0
-        elif len(cluster) == 1:
-            if start_idx is not None and end_idx is not None:
-                # Jika hanya ada 1 TPS, buat rute Garasi -> TPS -> TPA
-                tps_idx = cluster[0]
-                route = [start_idx, tps_idx, end_idx]
-                distance = distance_matrix[start_idx][tps_idx] + distance_matrix[tps_idx][end_idx]
-                return route, distance
-            return cluster, 0
-        elif len(cluster) == 2:
-            if start_idx is not None and end_idx is not None:
-                # Jika ada 2 TPS, coba 2 kemungkinan urutan dan pilih yang terbaik
-                tps1, tps2 = cluster
-                route1 = [start_idx, tps1, tps2, end_idx]
-                dist1 = (distance_matrix[start_idx][tps1] + 
-                        distance_matrix[tps1][tps2] + 
-                        distance_matrix[tps2][end_idx])
-                        
-                route2 = [start_idx, tps2, tps1, end_idx]
-                dist2 = (distance_matrix[start_idx][tps2] + 
-                        distance_matrix[tps2][tps1] + 
-                        distance_matrix[tps1][end_idx])
-                        
-                return route1 if dist1 <= dist2 else route2, min(dist1, dist2)
-            else:
-                # Tanpa titik awal/akhir, hanya optimasi 2 TPS
-                dist = distance_matrix[cluster[0]][cluster[1]]
-                return cluster, dist
-        
-        # Flag untuk menandakan apakah menggunakan titik awal/akhir
-        use_fixed_points = start_idx is not None and end_idx is not None
+        return optimize_route_aco(
+            cluster, distance_matrix, start_idx=start_idx, end_idx=end_idx,
+            num_ants=num_ants, num_iterations=num_iterations,
+            alpha=alpha, beta=beta, update_progress=update_progress
+        )
+    
+    def _solver_params(self, population_size, max_iterations, mutation_rate, crossover_rate, distance_penalty,
+                       optimize_routes, aco_ants, aco_iterations, aco_variant, debug_mode, progress_text=None,
+                       time_limit_seconds=None, checkpoint_path=None):
+        """Parameter solver GA-VNS dari input UI, termasuk indeks Garasi/TPA"""
+        # Cek apakah menggunakan fixed endpoints
+        start_idx = None
+        end_idx = None
+        exclude_indices = None
         
-        # Susun node untuk optimasi
-        if use_fixed_points:
-            # Jika menggunakan titik awal/akhir, tambahkan ke dalam nodes
-            all_nodes = [start_idx] + cluster + [end_idx]
-        else:
-            # Jika tidak, hanya gunakan TPS saja
-            all_nodes = cluster.copy()
-        
-        # Ekstrak submatriks jarak untuk nodes yang relevan
-        route_size = len(all_nodes)
-        sub_matrix = np.zeros((route_size, route_size))
-        for i in range(route_size):
-            for j in range(route_size):
-                sub_matrix[i][j] = distance_matrix[all_nodes[i]][all_nodes[j]]
-        
-        # Parameter ACO
-        evaporation_rate = 0.1
-        Q = 100  # Pheromone deposit factor
-        
-        # Inisialisasi matriks feromon
-        pheromone = np.ones((route_size, route_size))
-        
-        # Variabel untuk melacak solusi terbaik
-        best_route_indices = list(range(route_size))
-        best_distance = float('inf')
-        
-        # Progress tracking
-        progress_increment = 100.0 / num_iterations if num_iterations > 0 else 0
-        
-        # Loop utama ACO
-        for iteration in range(num_iterations):
-            all_routes = []
-            all_distances = []
-            
-            # Setiap semut membangun solusi
-            for ant in range(num_ants):
-                if use_fixed_points:
-                    # Jika gunakan fixed points, selalu mulai dari titik awal (Garasi)
-                    current_idx = 0  # Indeks 0 adalah start_idx di all_nodes
-                    # TPS (bukan Garasi/TPA) yang belum dikunjungi
-                    unvisited = list(range(1, route_size-1))  # Skip indeks 0 (start) dan terakhir (end)
+        if self.use_fixed_endpoints_var.get():
+            names = self.data_info['names']
+            start_point_name = self.start_point_var.get()
+            end_point_name = self.end_point_var.get()
+            
+            start_idx = find_point_index(names, start_point_name)
+            end_idx = find_point_index(names, end_point_name)
+            
+            if optimize_routes and progress_text is not None:
+                if start_idx is not None:
+                    progress_text.insert("end", f"Titik awal rute (Garasi): {names[start_idx]} (index {start_idx})\n")
                 else:
-                    # Tanpa fixed points, mulai dari TPS acak
-                    current_idx = random.randint(0, route_size-1)
-                    unvisited = list(range(route_size))
-                    unvisited.remove(current_idx)
-                
-                # Membangun rute
-                route = [current_idx]
-                total_distance = 0
-                
-                # Pilih TPS berikutnya sampai semua dikunjungi
-                while unvisited:
-                    # Hitung probabilitas transisi
-                    probabilities = []
-                    for next_idx in unvisited:
-                        # Level feromon
-                        tau = pheromone[current_idx][next_idx] ** alpha
-                        # Informasi heuristik (inverse jarak)
-                        dist_val = sub_matrix[current_idx][next_idx]
-                        eta = (1.0 / dist_val) ** beta if dist_val > 0 else 0
-                        probabilities.append(tau * eta)
-                    
-                    # Normalisasi probabilitas
-                    total = sum(probabilities)
-                    if total > 0:
-                        probabilities = [p/total for p in probabilities]
-                    else:
-                        probabilities = [1.0/len(unvisited)] * len(unvisited)
-                    
-                    # Pilih node berikutnya
-                    if len(unvisited) > 0:
-                        next_idx = np.random.choice(unvisited, p=probabilities)
-                        
-                        # Tambahkan ke rute
-                        route.append(next_idx)
-                        total_distance += sub_matrix[current_idx][next_idx]
-                        current_idx = next_idx
-                        unvisited.remove(next_idx)
-                
-                # Jika menggunakan fixed endpoints, tambahkan titik akhir (TPA)
-                if use_fixed_points:
-                    # Tambahkan titik akhir (TPA) ke rute
-                    route.append(route_size-1)  # Indeks terakhir adalah end_idx
-                    total_distance += sub_matrix[current_idx][route_size-1]
-                
-                # Simpan rute ini
-                all_routes.append(route)
-                all_distances.append(total_distance)
-                
-                # Update solusi terbaik
-                if total_distance < best_distance:
-                    best_route_indices = route.copy()
-                    best_distance = total_distance
-            
-            # Evaporasi feromon
-            pheromone *= (1 - evaporation_rate)
-            
-            # Update feromon berdasarkan rute-rute yang dibangun
-            for route, dist in zip(all_routes, all_distances):
-                deposit = Q / dist if dist > 0 else 0
-                for i in range(len(route)-1):
-                    pheromone[route[i]][route[i+1]] += deposit
-            
-            # Update progress jika callback disediakan
-            if update_progress:
-                current_progress = (iteration + 1) * progress_increment
-                update_progress(current_progress, f"ACO Iterasi {iteration+1}/{num_iterations}")
-        
-        # Konversi indeks rute ke indeks node asli
-        best_route = [all_nodes[i] for i in best_route_indices]
-        
-        return best_route, best_distance
+                    progress_text.insert("end", f"PERINGATAN: Titik awal '{start_point_name}' tidak ditemukan dalam data!\n")
+                
+                if end_idx is not None:
+                    progress_text.insert("end", f"Titik akhir rute (TPA): {names[end_idx]} (index {end_idx})\n")
+                else:
+                    progress_text.insert("end", f"PERINGATAN: Titik akhir '{end_point_name}' tidak ditemukan dalam data!\n")
+            
+            if start_idx is None or end_idx is None:
+                start_idx = None
+                end_idx = None
+            
+            # Daftar nama yang akan diabaikan pada cluster akhir
+            ignore_names = ["Garasi", "TPA", "TPA Troketon"]
+            exclude_indices = [
+                i for i, name in enumerate(names)
+                if isinstance(name, str) and any(ignore.lower() in name.lower() for ignore in ignore_names)
+            ]
+        
+        return {
+            'population_size': population_size,
+            'max_iterations': max_iterations,
+            'mutation_rate': mutation_rate,
+            'crossover_rate': crossover_rate,
+            'distance_penalty': distance_penalty,
+            'optimize_routes': optimize_routes,
+            'aco_ants': aco_ants,
+            'aco_iterations': aco_iterations,
+            'aco_variant': aco_variant,
+            'debug_mode': debug_mode,
+            'start_idx': start_idx,
+            'end_idx': end_idx,
+            'exclude_indices': exclude_indices,
+            'time_limit_seconds': time_limit_seconds,
+            'checkpoint_path': checkpoint_path
+        }
     
     def ga_vns_clustering(self, distance_matrix, volumes, min_capacity, max_capacity, 
                         population_size=75, max_iterations=200, mutation_rate=0.2, crossover_rate=0.8,
                         distance_penalty=1.0, optimize_routes=True, 
-                        aco_ants=10, aco_iterations=50, debug_mode=True):
+                        aco_ants=10, aco_iterations=50, debug_mode=True, route_cache=None, aco_variant="as", rng=None,
+                        time_limit_seconds=None, checkpoint_path=None):
         """
         Improved GA-VNS hybrid algorithm for TPS clustering with route optimization.
-        Genetic Algorithm (GA) is used as the primary search method with Variable Neighborhood
-        Search (VNS) applied to refine promising solutions.
+        The algorithm itself lives in ga_vns_solver; this method only wires it to the UI.
+        Status run terakhir (stopped, time_limit_hit) disimpan di self.last_run_status.
         """
-        n_points = len(volumes)
-        debug_info = []
-        
         # Store distance matrix for later use
         self.distance_matrix = distance_matrix
         
@@ -520,1307 +453,31 @@ class TPSClusteringApp:
         progress_scrollbar.pack(side="right", fill="y")
         progress_text.config(yscrollcommand=progress_scrollbar.set)
         
-        # Function to update detailed progress
-        def update_detail_progress(percentage, message=None):
-            self.detail_progress_var.set(percentage)
-            if message:
-                self.progress_label.config(text=message)
-            self.root.update_idletasks()
-        
-        # Explicit check for size match
-        if distance_matrix.shape[0] != n_points or distance_matrix.shape[1] != n_points:
-            raise ValueError(f"Ukuran matriks jarak ({distance_matrix.shape[0]}x{distance_matrix.shape[1]}) tidak sesuai dengan jumlah TPS ({n_points})")
-        
-        # Calculate required number of clusters based on total volume and capacity
-        total_volume = sum(volumes)
-        min_clusters_needed = math.ceil(total_volume / max_capacity)
-        expected_clusters = max(min_clusters_needed, 1)
-        
-        progress_log = f"Total volume: {total_volume:.2f} m³\n"
-        progress_log += f"Kapasitas minimum cluster: {min_capacity:.2f} m³\n"
-        progress_log += f"Kapasitas maksimum cluster: {max_capacity:.2f} m³\n"
-        progress_log += f"Perkiraan jumlah cluster: {expected_clusters}\n"
-        progress_log += f"Optimasi rute: {'Aktif' if optimize_routes else 'Nonaktif'}\n"
-        progress_log += f"Algoritma rute: ACO\n\n"
-        progress_text.insert("end", progress_log)
-        self.root.update_idletasks()
-        
-        # Update progress
-        self.update_progress(1, "Memulai clustering...")
-        
-        # Helper function to check if a cluster is valid
-        def is_valid_cluster(cluster, check_min_capacity=True):
-            if not cluster:
-                return False
-                
-            # Check capacity constraint
-            cluster_volume = sum(volumes[idx] for idx in cluster)
-            
-            if cluster_volume > max_capacity:
-                return False
-                
-            if check_min_capacity and cluster_volume < min_capacity:
-                return False
-            
-            return True
-        
-        # Helper function to calculate fitness (lower is better)
-        def calculate_fitness(solution):
-            # Check if all TPS are assigned once
-            all_tps = []
-            for cluster in solution:
-                all_tps.extend(cluster)
-            
-            # Penalize missing or duplicate TPS assignments
-            missing_tps = set(range(n_points)) - set(all_tps)
-            duplicate_tps = len(all_tps) - len(set(all_tps))
-            missing_penalty = len(missing_tps) * 1000000
-            duplicate_penalty = duplicate_tps * 1000000
-            
-            # Check capacity constraints
-            capacity_violations = 0
-            for cluster in solution:
-                cluster_volume = sum(volumes[idx] for idx in cluster)
-                if cluster_volume < min_capacity:
-                    # Penalize under capacity
-                    capacity_violations += (min_capacity - cluster_volume) * 10000
-                if cluster_volume > max_capacity:
-                    # Heavily penalize over capacity
-                    capacity_violations += (cluster_volume - max_capacity) * 100000
-            
-            # Calculate total route distance for each cluster using ACO
-            total_route_distance = 0
-            
-            for cluster in solution:
-                if len(cluster) > 1:
-                    # Use TSP/route optimization if enabled
-                    if optimize_routes:
-                        # Simple approximation for fitness calculation 
-                        # (full ACO would be too slow for every fitness evaluation)
-                        if len(cluster) == 2:
-                            cluster_distance = distance_matrix[cluster[0], cluster[1]]
-                        else:
-                            # Use a greedy nearest neighbor for quick evaluation
-                            current = cluster[0]
-                            unvisited = set(cluster[1:])
-                            dist = 0
-                            while unvisited:
-                                # Find nearest neighbor
-                                next_node = min(unvisited, key=lambda x: distance_matrix[current, x])
-                                dist += distance_matrix[current, next_node]
-                                current = next_node
-                                unvisited.remove(next_node)
-                            cluster_distance = dist
-                    else:
-                        # If not optimizing routes, just sum all intra-cluster distances
-                        cluster_distance = 0
-                        for i in range(len(cluster)):
-                            for j in range(i+1, len(cluster)):
-                                cluster_distance += distance_matrix[cluster[i], cluster[j]]
-                    
-                    total_route_distance += cluster_distance
-            
-            # Apply distance penalty weight
-            weighted_distance = total_route_distance * distance_penalty
-            
-            # Total fitness is weighted sum of route distance and penalties
-            total_fitness = weighted_distance + capacity_violations + missing_penalty + duplicate_penalty
-            
-            return total_fitness, total_route_distance, capacity_violations, 0, missing_penalty, duplicate_penalty
-        
-        # Function to create an initial solution with greedy bin packing
-        def create_greedy_solution():
-            # Sort TPS by volume (descending)
-            tps_indices = sorted(range(n_points), key=lambda i: volumes[i], reverse=True)
-            
-            # Initialize clusters
-            solution = []
-            remaining_tps = set(tps_indices)
-            
-            # Process each TPS
-            while remaining_tps:
-                # Create new cluster
-                current_cluster = []
-                current_volume = 0
-                
-                # Start with largest remaining TPS
-                sorted_remaining = sorted(remaining_tps, key=lambda i: volumes[i], reverse=True)
-                first_tps = sorted_remaining[0]
-                current_cluster.append(first_tps)
-                current_volume += volumes[first_tps]
-                remaining_tps.remove(first_tps)
-                
-                # Process remaining TPS by distance
-                while remaining_tps and current_volume < max_capacity:
-                    # Find closest remaining TPS to cluster
-                    closest_tps = None
-                    min_dist = float('inf')
-                    
-                    for tps_idx in remaining_tps:
-                        # Check if adding this TPS exceeds capacity
-                        if current_volume + volumes[tps_idx] > max_capacity:
-                            continue
-                            
-                        # Find minimum distance to any TPS in current cluster
-                        for existing_idx in current_cluster:
-                            dist = distance_matrix[existing_idx, tps_idx]
-                            if dist < min_dist:
-                                min_dist = dist
-                                closest_tps = tps_idx
-                    
-                    if closest_tps is not None:
-                        # Add closest TPS to cluster
-                        current_cluster.append(closest_tps)
-                        current_volume += volumes[closest_tps]
-                        remaining_tps.remove(closest_tps)
-                        
-                        # Break if we reached minimum capacity and still have TPS left
-                        if current_volume >= min_capacity and len(remaining_tps) > 0:
-                            break
-                    else:
-                        # If we can't find any TPS to add, break
-                        break
-                
-                # Add cluster to solution if not empty
-                if current_cluster:
-                    solution.append(current_cluster)
-                    
-                # If we've formed enough clusters but still have TPS, try to add them
-                if len(solution) >= expected_clusters and remaining_tps:
-                    # Try to add remaining TPS to existing clusters
-                    for tps_idx in list(remaining_tps):
-                        added = False
-                        
-                        # Try adding to each cluster
-                        for cluster in solution:
-                            cluster_volume = sum(volumes[idx] for idx in cluster)
-                            
-                            if cluster_volume + volumes[tps_idx] <= max_capacity:
-                                cluster.append(tps_idx)
-                                remaining_tps.remove(tps_idx)
-                                added = True
-                                break
-                        
-                        if not added:
-                            # If can't add to any existing cluster, create a new one
-                            break
-                
-                # Emergency break to prevent infinite loop
-                if not remaining_tps or (len(solution) > 0 and len(current_cluster) == 0):
-                    break
-                    
-            # If we still have remaining TPS, create singleton clusters
-            for tps_idx in remaining_tps:
-                solution.append([tps_idx])
-            
-            return solution
-        
-        # Function to create a random solution
-        def create_random_solution():
-            # Shuffle TPS indices
-            tps_indices = list(range(n_points))
-            random.shuffle(tps_indices)
-            
-            # Initialize solution
-            solution = []
-            current_cluster = []
-            current_volume = 0
-            
-            # Process each TPS
-            for tps_idx in tps_indices:
-                # Check if adding to current cluster would exceed capacity
-                if current_volume + volumes[tps_idx] <= max_capacity:
-                    # Add to current cluster
-                    current_cluster.append(tps_idx)
-                    current_volume += volumes[tps_idx]
-                else:
-                    # If we can't add to current cluster, check if current cluster is valid
-                    if current_cluster and current_volume >= min_capacity:
-                        solution.append(current_cluster)
-                    
-                    # Start new cluster with this TPS
-                    current_cluster = [tps_idx]
-                    current_volume = volumes[tps_idx]
-            
-            # Add last cluster if not empty
-            if current_cluster:
-                solution.append(current_cluster)
-            
-            return solution
-        
-        # Function to create a k-means style solution
-        def create_kmeans_solution(k=expected_clusters):
-            # Choose k random centroids
-            all_indices = list(range(n_points))
-            centroids_indices = random.sample(all_indices, k)
-            
-            # Assign each TPS to nearest centroid
-            clusters = [[] for _ in range(k)]
-            
-            for i in range(n_points):
-                # Find closest centroid
-                min_dist = float('inf')
-                closest_centroid = 0
-                
-                for c, centroid_idx in enumerate(centroids_indices):
-                    dist = distance_matrix[i, centroid_idx]
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_centroid = c
-                
-                # Add to cluster
-                clusters[closest_centroid].append(i)
-            
-            # Fix clusters that violate capacity constraints
-            valid_clusters = []
-            unassigned_tps = []
-            
-            for cluster in clusters:
-                # Check if cluster exceeds capacity
-                cluster_volume = sum(volumes[idx] for idx in cluster)
-                
-                if cluster_volume <= max_capacity:
-                    valid_clusters.append(cluster)
-                else:
-                    # Split cluster if it exceeds capacity
-                    # Sort by volume
-                    cluster.sort(key=lambda idx: volumes[idx], reverse=True)
-                    
-                    # Add TPS until capacity limit
-                    current_cluster = []
-                    current_volume = 0
-                    
-                    for tps_idx in cluster:
-                        if current_volume + volumes[tps_idx] <= max_capacity:
-                            current_cluster.append(tps_idx)
-                            current_volume += volumes[tps_idx]
-                        else:
-                            unassigned_tps.append(tps_idx)
-                    
-                    if current_cluster:
-                        valid_clusters.append(current_cluster)
-            
-            # Handle unassigned TPS
-            if unassigned_tps:
-                # Try to add to existing clusters
-                for tps_idx in list(unassigned_tps):
-                    added = False
-                    
-                    for cluster in valid_clusters:
-                        # Check capacity
-                        cluster_volume = sum(volumes[idx] for idx in cluster)
-                        
-                        if cluster_volume + volumes[tps_idx] <= max_capacity:
-                            cluster.append(tps_idx)
-                            unassigned_tps.remove(tps_idx)
-                            added = True
-                            break
-                    
-                    if not added:
-                        continue
-                
-                # Create new clusters for remaining unassigned TPS
-                if unassigned_tps:
-                    unassigned_tps.sort(key=lambda idx: volumes[idx], reverse=True)
-                    
-                    current_cluster = []
-                    current_volume = 0
-                    
-                    for tps_idx in unassigned_tps:
-                        if current_volume + volumes[tps_idx] <= max_capacity:
-                            current_cluster.append(tps_idx)
-                            current_volume += volumes[tps_idx]
-                        else:
-                            # If can't add due to capacity, create a new cluster
-                            if current_cluster:
-                                valid_clusters.append(current_cluster)
-                            
-                            current_cluster = [tps_idx]
-                            current_volume = volumes[tps_idx]
-                    
-                    # Add the last cluster
-                    if current_cluster:
-                        valid_clusters.append(current_cluster)
-            
-            return valid_clusters
-        
-        # Function to create a PSO-inspired solution
-        def create_pso_solution():
-            # Encode problem as particle position (TPS to cluster assignments)
-            particle_pos = np.random.random(n_points) * expected_clusters
-            cluster_assignments = np.floor(particle_pos).astype(int)
-            
-            # Convert to solution format
-            max_cluster = max(cluster_assignments) if len(cluster_assignments) > 0 else 0
-            solution = [[] for _ in range(max_cluster + 1)]
-            for i, cluster_id in enumerate(cluster_assignments):
-                solution[cluster_id].append(i)
-            
-            # Filter empty clusters
-            solution = [cluster for cluster in solution if cluster]
-            
-            # Split clusters that exceed capacity
-            fixed_solution = []
-            for cluster in solution:
-                cluster_volume = sum(volumes[idx] for idx in cluster)
-                if cluster_volume <= max_capacity:
-                    fixed_solution.append(cluster)
-                else:
-                    # Sort by volume for better packing
-                    sorted_tps = sorted(cluster, key=lambda idx: volumes[idx], reverse=True)
-                    current_cluster = []
-                    current_volume = 0
-                    
-                    for tps_idx in sorted_tps:
-                        if current_volume + volumes[tps_idx] <= max_capacity:
-                            current_cluster.append(tps_idx)
-                            current_volume += volumes[tps_idx]
-                        else:
-                            if current_cluster:
-                                fixed_solution.append(current_cluster)
-                            current_cluster = [tps_idx]
-                            current_volume = volumes[tps_idx]
-                    
-                    if current_cluster:
-                        fixed_solution.append(current_cluster)
-            
-            return fixed_solution
-        
-        # Initialize population - GA FIRST APPROACH
-        self.update_progress(5, "Membuat populasi awal GA...")
-        update_detail_progress(0, "Membuat solusi dengan pendekatan GA...")
-        population = []
-        
-        # Add greedy solution (enhanced initialization for GA)
-        greedy_solution = create_greedy_solution()
-        population.append(greedy_solution)
-        update_detail_progress(20, "Membuat solusi dengan pendekatan k-means...")
-        progress_text.insert("end", "Membuat solusi awal dengan pendekatan greedy...\n")
-        self.root.update_idletasks()
-        
-        # Add K-means solutions with different k values
-        for k in range(max(2, expected_clusters-2), expected_clusters+5):
-            try:
-                kmeans_solution = create_kmeans_solution(k)
-                population.append(kmeans_solution)
-            except Exception as e:
-                progress_text.insert("end", f"Warning: Gagal membuat solusi k-means dengan k={k}: {str(e)}\n")
-        
-        update_detail_progress(40, "Membuat solusi secara acak...")
-        progress_text.insert("end", "Membuat solusi awal dengan pendekatan k-means...\n")
-        self.root.update_idletasks()
-        
-        # Add random solutions
-        while len(population) < population_size * 0.5:  # Reduce number of random solutions for PSO
-            try:
-                random_solution = create_random_solution()
-                population.append(random_solution)
-            except Exception as e:
-                progress_text.insert("end", f"Warning: Gagal membuat solusi acak: {str(e)}\n")
-        
-        # Add PSO-inspired solutions
-        update_detail_progress(60, "Membuat solusi dengan pendekatan PSO...")
-        progress_text.insert("end", "Membuat solusi awal dengan pendekatan PSO...\n")
-        self.root.update_idletasks()
-        
-        for _ in range(min(10, population_size // 5)):
-            try:
-                pso_solution = create_pso_solution()
-                population.append(pso_solution)
-            except Exception as e:
-                progress_text.insert("end", f"Warning: Gagal membuat solusi PSO: {str(e)}\n")
-        
-        update_detail_progress(70, "Membuat solusi tambahan...")
-        progress_text.insert("end", "Membuat solusi awal lainnya...\n")
-        self.root.update_idletasks()
-        
-        # Make sure we have enough solutions for GA
-        while len(population) < population_size:
-            # Clone and mutate existing solutions
-            idx = random.randint(0, len(population)-1)
-            new_solution = [cluster.copy() for cluster in population[idx]]
-            
-            # Apply random mutation
-            if random.random() < 0.5:
-                # Try to merge two clusters
-                if len(new_solution) >= 2:
-                    c1 = random.randint(0, len(new_solution)-1)
-                    c2 = random.randint(0, len(new_solution)-1)
-                    
-                    while c2 == c1 and len(new_solution) > 1:
-                        c2 = random.randint(0, len(new_solution)-1)
-                    
-                    if c1 != c2:
-                        merged = new_solution[c1] + new_solution[c2]
-                        # If merged cluster is valid, use it
-                        if sum(volumes[idx] for idx in merged) <= max_capacity:
-                            # Replace first cluster with merged
-                            new_solution[c1] = merged
-                            # Remove second cluster
-                            new_solution.pop(c2 if c2 < c1 else c1)
-            else:
-                # Try to split a cluster
-                if new_solution:
-                    c = random.randint(0, len(new_solution)-1)
-                    if len(new_solution[c]) >= 2:
-                        # Randomly split
-                        split_point = random.randint(1, len(new_solution[c])-1)
-                        c1 = new_solution[c][:split_point]
-                        c2 = new_solution[c][split_point:]
-                        
-                        # Replace with split clusters
-                        new_solution[c] = c1
-                        new_solution.append(c2)
-            
-            population.append(new_solution)
-            
-            # Ensure we don't go into an infinite loop
-            if len(population) >= population_size * 2:
-                break
-        
-        # Trim population to desired size
-        population = population[:population_size]
-        
-        update_detail_progress(80, "Menyelesaikan populasi awal GA...")
-        
-        # Log initial population
-        progress_text.insert("end", f"Populasi awal GA terbentuk dengan {len(population)} solusi\n")
-        best_initial = min(population, key=lambda sol: calculate_fitness(sol)[0])
-        initial_fitness, initial_distance, _, _, _, _ = calculate_fitness(best_initial)
-        progress_text.insert("end", f"Solusi terbaik awal: {len(best_initial)} cluster, fitness={initial_fitness:.2f}, jarak={initial_distance:.2f}\n\n")
-        self.root.update_idletasks()
-        
-        update_detail_progress(100, "Populasi awal GA selesai dibentuk.")
-        self.update_progress(10, "Mulai iterasi algoritma hybrid GA-VNS...")
-        
-        # Initialize for adaptive parameters
-        adaptive_mutation_rate = mutation_rate  
-        adaptive_crossover_rate = crossover_rate
-        diversity_history = []
-        
-        # Function to calculate population diversity
-        def calculate_diversity(pop):
-            # Handle small populations
-            if len(pop) <= 1:
-                return 0
-            
-            # Calculate similarity between solutions
-            total_dist = 0
-            count = 0
-            
-            # Sample pairs for efficiency (max 50 pairs)
-            max_pairs = min(50, len(pop) * (len(pop) - 1) // 2)
-            if len(pop) > 10:
-                # Sample pairs
-                pairs = []
-                for _ in range(max_pairs):
-                    i, j = random.sample(range(len(pop)), 2)
-                    pairs.append((i, j))
-            else:
-                # For small populations, evaluate all pairs
-                pairs = [(i, j) for i in range(len(pop)) for j in range(i+1, len(pop))]
-            
-            # Process each pair
-            for i, j in pairs:
-                # Convert cluster assignments to TPS sets
-                tps_set_i = set()
-                for cluster in pop[i]:
-                    tps_set_i.update(cluster)
-                    
-                tps_set_j = set()
-                for cluster in pop[j]:
-                    tps_set_j.update(cluster)
-            
-                # Calculate Jaccard distance
-                if tps_set_i and tps_set_j:
-                    intersection = len(tps_set_i.intersection(tps_set_j))
-                    union = len(tps_set_i.union(tps_set_j))
-                    
-                    if union > 0:
-                        similarity = intersection / union
-                        total_dist += (1 - similarity)  # Convert to distance
-                        count += 1
-            
-            # Return average diversity
-            return total_dist / count if count > 0 else 0
-        
-        # Main GA-VNS hybrid algorithm loop
-        best_solution = None
-        best_fitness = float('inf')
-        best_distance = float('inf')
-        
-        stagnation_count = 0
-        last_improvement = 0
-        
-        # Progress calculation for iterations
-        iteration_progress_start = 10
-        iteration_progress_end = 80
-        progress_per_iteration = (iteration_progress_end - iteration_progress_start) / max_iterations
-        
-        for iteration in range(max_iterations):
-            # Update progress
-            current_progress = iteration_progress_start + (iteration * progress_per_iteration)
-            self.update_progress(current_progress, f"Iterasi {iteration+1}/{max_iterations}")
-            update_detail_progress(
-                (iteration * 100) / max_iterations,
-                f"Iterasi {iteration+1}/{max_iterations}"
-            )
-            
-            # Sort population by fitness - GA approach
-            population.sort(key=lambda sol: calculate_fitness(sol)[0])
-            
-            # Store the best solution
-            current_best = population[0]
-            current_fitness, current_distance, cv, dv, mp, dp = calculate_fitness(current_best)
-            
-            # Calculate population diversity and adapt parameters
-            diversity = calculate_diversity(population)
-            diversity_history.append(diversity)
-            
-            # Adaptive parameter tuning based on diversity
-            if len(diversity_history) >= 2:
-                diversity_change = diversity_history[-1] - diversity_history[-2]
-                
-                # If diversity decreasing rapidly, increase mutation to encourage exploration
-                if diversity_change < -0.05:
-                    adaptive_mutation_rate = min(0.9, adaptive_mutation_rate * 1.5)
-                # If diversity stable or increasing, gradually return to base rate
-                else:
-                    adaptive_mutation_rate = mutation_rate + (adaptive_mutation_rate - mutation_rate) * 0.9
-                
-                # Adjust crossover rate inversely to balance exploration/exploitation
-                adaptive_crossover_rate = max(0.5, min(0.95, 1.0 - adaptive_mutation_rate/2))
-            
-            # Log progress
-            if debug_mode and iteration % 10 == 0:
-                log = f"Iterasi {iteration}/{max_iterations} ({(iteration*100/max_iterations):.1f}%): "
-                log += f"Fitness={current_fitness:.2f}, Jarak={current_distance:.2f}, "
-                log += f"Clusters={len(current_best)}, Diversitas={diversity:.4f}\n"
-                log += f"  MutRate={adaptive_mutation_rate:.4f}, CrossRate={adaptive_crossover_rate:.4f}\n"
-                
-                if cv > 0 or dv > 0 or mp > 0 or dp > 0:
-                    log += f"  Pelanggaran: Kapasitas={cv:.2f}, Jarak={dv:.2f}, TPS Hilang={mp:.2f}, TPS Duplikat={dp:.2f}\n"
-                
+        # Progress callback untuk solver headless
+        def on_progress(percentage, message=None, log=None):
+            if percentage is not None:
+                self.update_progress(percentage, message)
+                self.detail_progress_var.set(percentage)
+                if message:
+                    self.progress_label.config(text=message)
+            if log:
                 progress_text.insert("end", log)
-                self.root.update_idletasks()
-                
-                # Add to debug info
-                debug_info.append({
-                    'iteration': iteration,
-                    'fitness': current_fitness,
-                    'distance': current_distance,
-                    'num_clusters': len(current_best),
-                    'diversity': diversity,
-                    'mutation_rate': adaptive_mutation_rate,
-                    'crossover_rate': adaptive_crossover_rate
-                })
-            
-            if current_fitness < best_fitness:
-                best_solution = [cluster.copy() for cluster in current_best]
-                best_fitness = current_fitness
-                best_distance = current_distance
-                last_improvement = iteration
-                stagnation_count = 0
-                
-                # Log improvement
-                progress_text.insert("end", f"✓ Solusi baru terbaik: {len(best_solution)} cluster, fitness={best_fitness:.2f}, jarak={best_distance:.2f}\n")
-                self.root.update_idletasks()
-            else:
-                stagnation_count += 1
-            
-            # Early stopping if no improvement for a while
-            if stagnation_count > max_iterations // 4:
-                progress_text.insert("end", f"\nBerhenti lebih awal karena tidak ada peningkatan selama {stagnation_count} iterasi\n")
-                break
-            
-            # Create new population using GA operations
-            new_population = [population[0]]  # Keep the best solution (elitism)
-            
-            while len(new_population) < population_size:
-                # GA OPERATIONS
-                # Selection (tournament selection)
-                tournament_size = min(3, len(population))
-                parent1 = min(random.sample(population, tournament_size), key=lambda sol: calculate_fitness(sol)[0])
-                parent2 = min(random.sample(population, tournament_size), key=lambda sol: calculate_fitness(sol)[0])
-                
-                # Crossover
-                if random.random() < adaptive_crossover_rate:
-                    # Order clusters by their total volume
-                    parent1_ordered = sorted(parent1, key=lambda c: sum(volumes[idx] for idx in c), reverse=True)
-                    parent2_ordered = sorted(parent2, key=lambda c: sum(volumes[idx] for idx in c), reverse=True)
-                    
-                    # Initialize child with empty clusters
-                    child = []
-                    
-                    # Track assigned TPS
-                    assigned_tps = set()
-                    
-                    # First, randomly select some clusters from parent1
-                    for cluster in parent1_ordered:
-                        if random.random() < 0.5:  # 50% chance to include each cluster
-                            # Only include unassigned TPS
-                            valid_cluster = [idx for idx in cluster if idx not in assigned_tps]
-                            
-                            if valid_cluster:
-                                child.append(valid_cluster)
-                                assigned_tps.update(valid_cluster)
-                    
-                    # Then add clusters from parent2 that don't overlap
-                    for cluster in parent2_ordered:
-                        # Only include unassigned TPS
-                        valid_cluster = [idx for idx in cluster if idx not in assigned_tps]
-                        
-                        if valid_cluster:
-                            # Check if cluster meets minimum capacity
-                            if sum(volumes[idx] for idx in valid_cluster) >= min_capacity / 2:  # Relaxed constraint
-                                child.append(valid_cluster)
-                                assigned_tps.update(valid_cluster)
-                    
-                    # Check for unassigned TPS
-                    unassigned = set(range(n_points)) - assigned_tps
-                    
-                    if unassigned:
-                        # Try to assign remaining TPS to existing clusters
-                        for tps_idx in list(unassigned):
-                            added = False
-                            
-                            # Try to add to existing clusters
-                            for cluster in child:
-                                # Check capacity
-                                cluster_volume = sum(volumes[idx] for idx in cluster)
-                                
-                                if cluster_volume + volumes[tps_idx] <= max_capacity:
-                                    cluster.append(tps_idx)
-                                    unassigned.remove(tps_idx)
-                                    added = True
-                                    break
-                            
-                            if not added:
-                                continue
-                        
-                        # Create new clusters for remaining unassigned TPS
-                        if unassigned:
-                            # Sort by volume for better packing
-                            remaining = sorted(list(unassigned), key=lambda idx: volumes[idx], reverse=True)
-                            
-                            current_cluster = []
-                            current_volume = 0
-                            
-                            for tps_idx in remaining:
-                                if current_volume + volumes[tps_idx] <= max_capacity:
-                                    current_cluster.append(tps_idx)
-                                    current_volume += volumes[tps_idx]
-                                else:
-                                    # If can't add due to capacity, create a new cluster
-                                    if current_cluster:
-                                        child.append(current_cluster)
-                                    
-                                    current_cluster = [tps_idx]
-                                    current_volume = volumes[tps_idx]
-                            
-                            # Add the last cluster if not empty
-                            if current_cluster:
-                                child.append(current_cluster)
-                    
-                    # Remove empty clusters
-                    child = [cluster for cluster in child if cluster]
-                    
-                else:
-                    # No crossover, just copy one parent
-                    if random.random() < 0.5:
-                        child = [cluster.copy() for cluster in parent1]
-                    else:
-                        child = [cluster.copy() for cluster in parent2]
-                
-                # Mutation - GA operation
-                if random.random() < adaptive_mutation_rate:
-                    # Choose mutation type
-                    mutation_type = random.choice(['swap', 'move', 'split', 'merge'])
-                    
-                    if mutation_type == 'swap':
-                        # Swap two random TPS between clusters
-                        if len(child) >= 2:
-                            # Select two random clusters
-                            cluster1_idx = random.randint(0, len(child) - 1)
-                            cluster2_idx = random.randint(0, len(child) - 1)
-                            
-                            # Make sure they're different
-                            while cluster2_idx == cluster1_idx and len(child) > 1:
-                                cluster2_idx = random.randint(0, len(child) - 1)
-                            
-                            if len(child[cluster1_idx]) > 0 and len(child[cluster2_idx]) > 0:
-                                # Select random TPS from each cluster
-                                tps1_idx = random.randint(0, len(child[cluster1_idx]) - 1)
-                                tps2_idx = random.randint(0, len(child[cluster2_idx]) - 1)
-                                
-                                # Get TPS values
-                                tps1 = child[cluster1_idx][tps1_idx]
-                                tps2 = child[cluster2_idx][tps2_idx]
-                                
-                                # Check if swap would be valid
-                                vol1 = sum(volumes[idx] for idx in child[cluster1_idx] if idx != tps1)
-                                vol2 = sum(volumes[idx] for idx in child[cluster2_idx] if idx != tps2)
-                                
-                                new_vol1 = vol1 + volumes[tps2]
-                                new_vol2 = vol2 + volumes[tps1]
-                                
-                                if new_vol1 <= max_capacity and new_vol2 <= max_capacity:
-                                    # Perform swap
-                                    child[cluster1_idx][tps1_idx] = tps2
-                                    child[cluster2_idx][tps2_idx] = tps1
-                    
-                    elif mutation_type == 'move':
-                        # Move a random TPS from one cluster to another
-                        if len(child) >= 2:
-                            # Select source and destination clusters
-                            from_cluster_idx = random.randint(0, len(child) - 1)
-                            to_cluster_idx = random.randint(0, len(child) - 1)
-                            
-                            # Make sure they're different
-                            while to_cluster_idx == from_cluster_idx and len(child) > 1:
-                                to_cluster_idx = random.randint(0, len(child) - 1)
-                            
-                            # Make sure source cluster has more than one TPS
-                            if len(child[from_cluster_idx]) > 1:
-                                # Select a random TPS to move
-                                tps_idx = random.randint(0, len(child[from_cluster_idx]) - 1)
-                                tps = child[from_cluster_idx][tps_idx]
-                                
-                                # Check if move would be valid
-                                to_vol = sum(volumes[idx] for idx in child[to_cluster_idx])
-                                from_vol = sum(volumes[idx] for idx in child[from_cluster_idx])
-                                
-                                new_to_vol = to_vol + volumes[tps]
-                                new_from_vol = from_vol - volumes[tps]
-                                
-                                if new_to_vol <= max_capacity and (new_from_vol >= min_capacity or len(child) > expected_clusters):
-                                    # Perform move
-                                    child[from_cluster_idx].pop(tps_idx)
-                                    child[to_cluster_idx].append(tps)
-                                    
-                                    # Remove empty clusters
-                                    if not child[from_cluster_idx]:
-                                        child.pop(from_cluster_idx)
-                    
-                    elif mutation_type == 'split':
-                        # Split a cluster
-                        if child:
-                            # Choose a cluster to split (prefer larger ones)
-                            cluster_weights = [len(cluster) for cluster in child]
-                            total_weight = sum(cluster_weights)
-                            
-                            if total_weight > 0:
-                                probs = [w/total_weight for w in cluster_weights]
-                                cluster_idx = random.choices(range(len(child)), weights=probs)[0]
-                                
-                                # Only split if cluster has more than one TPS
-                                if len(child[cluster_idx]) > 3:
-                                    # Randomly split
-                                    split_point = random.randint(1, len(child[cluster_idx]) - 1)
-                                    
-                                    # Create two new clusters
-                                    cluster1 = child[cluster_idx][:split_point]
-                                    cluster2 = child[cluster_idx][split_point:]
-                                    
-                                    # Check if both parts are valid
-                                    vol1 = sum(volumes[idx] for idx in cluster1)
-                                    vol2 = sum(volumes[idx] for idx in cluster2)
-                                    
-                                    # If both are valid or we're below expected clusters, perform split
-                                    if (vol1 >= min_capacity and vol2 >= min_capacity) or len(child) < expected_clusters:
-                                        # Replace original with first part
-                                        child[cluster_idx] = cluster1
-                                        # Add second part as new cluster
-                                        child.append(cluster2)
-                    
-                    elif mutation_type == 'merge':
-                        # Merge two clusters
-                        if len(child) >= 2:
-                            # Select two random clusters
-                            cluster1_idx = random.randint(0, len(child) - 1)
-                            cluster2_idx = random.randint(0, len(child) - 1)
-                            
-                            # Make sure they're different
-                            while cluster2_idx == cluster1_idx and len(child) > 1:
-                                cluster2_idx = random.randint(0, len(child) - 1)
-                            
-                            if cluster1_idx != cluster2_idx:
-                                # Check if merge would be valid
-                                merged = child[cluster1_idx] + child[cluster2_idx]
-                                merged_vol = sum(volumes[idx] for idx in merged)
-                                
-                                if merged_vol <= max_capacity:
-                                    # Perform merge
-                                    # Replace first cluster with merged
-                                    child[cluster1_idx] = merged
-                                    # Remove second cluster
-                                    child.pop(cluster2_idx if cluster2_idx < cluster1_idx else cluster1_idx)
-                
-                # NOW APPLY VNS AS A REFINEMENT STEP TO PROMISING SOLUTIONS
-                # Apply VNS with probability based on solution quality
-                # Apply more intensive VNS to better solutions
-                apply_vns_prob = 0.3 - (len(new_population) / (population_size * 3))  # Higher prob for early solutions
-                apply_vns_prob = max(0.05, min(0.5, apply_vns_prob))  # Between 5% and 50%
-                
-                if random.random() < apply_vns_prob:
-                    # Define neighborhood structures for VNS
-                    neighborhood_structures = ['swap_tps', 'relocate_tps', 'exchange_tps', 'split_merge']
-                    
-                    # Apply VNS using different neighborhood structures
-                    for neighborhood in neighborhood_structures:
-                        # Create a copy of the current solution
-                        current_solution = [cluster.copy() for cluster in child]
-                        current_fitness, _, _, _, _, _ = calculate_fitness(current_solution)
-                        
-                        if neighborhood == 'swap_tps':
-                            # Swap two TPS between different clusters
-                            if len(current_solution) >= 2:
-                                # Choose two random clusters
-                                idx1 = random.randint(0, len(current_solution) - 1)
-                                idx2 = random.randint(0, len(current_solution) - 1)
-                                
-                                # Ensure they're different clusters
-                                while idx2 == idx1 and len(current_solution) > 1:
-                                    idx2 = random.randint(0, len(current_solution) - 1)
-                                
-                                if len(current_solution[idx1]) > 0 and len(current_solution[idx2]) > 0:
-                                    # Choose a random TPS from each cluster
-                                    tps1_pos = random.randint(0, len(current_solution[idx1]) - 1)
-                                    tps2_pos = random.randint(0, len(current_solution[idx2]) - 1)
-                                    
-                                    # Get TPS IDs
-                                    tps1 = current_solution[idx1][tps1_pos]
-                                    tps2 = current_solution[idx2][tps2_pos]
-                                    
-                                    # Check if swap is valid (capacity constraints)
-                                    cluster1_vol = sum(volumes[idx] for idx in current_solution[idx1])
-                                    cluster2_vol = sum(volumes[idx] for idx in current_solution[idx2])
-                                    
-                                    new_vol1 = cluster1_vol - volumes[tps1] + volumes[tps2]
-                                    new_vol2 = cluster2_vol - volumes[tps2] + volumes[tps1]
-                                    
-                                    if new_vol1 <= max_capacity and new_vol2 <= max_capacity:
-                                        # Perform swap
-                                        current_solution[idx1][tps1_pos] = tps2
-                                        current_solution[idx2][tps2_pos] = tps1
-                        
-                        elif neighborhood == 'relocate_tps':
-                            # Move a TPS from one cluster to another
-                            if len(current_solution) >= 2:
-                                # Choose source cluster
-                                source_idx = random.randint(0, len(current_solution) - 1)
-                                
-                                # Make sure source cluster has at least two TPS
-                                if len(current_solution[source_idx]) >= 2:
-                                    # Choose a random TPS to relocate
-                                    tps_pos = random.randint(0, len(current_solution[source_idx]) - 1)
-                                    tps = current_solution[source_idx][tps_pos]
-                                    
-                                    # Choose destination cluster
-                                    dest_idx = random.randint(0, len(current_solution) - 1)
-                                    while dest_idx == source_idx and len(current_solution) > 1:
-                                        dest_idx = random.randint(0, len(current_solution) - 1)
-                                    
-                                    # Check capacity constraint
-                                    dest_vol = sum(volumes[idx] for idx in current_solution[dest_idx])
-                                    source_vol = sum(volumes[idx] for idx in current_solution[source_idx])
-                                    
-                                    if dest_vol + volumes[tps] <= max_capacity:
-                                        # Check if source cluster will remain valid
-                                        remaining_vol = source_vol - volumes[tps]
-                                        if remaining_vol >= min_capacity or len(current_solution[source_idx]) <= 2:
-                                            # Move TPS
-                                            current_solution[source_idx].remove(tps)
-                                            current_solution[dest_idx].append(tps)
-                                            
-                                            # Remove empty clusters
-                                            if not current_solution[source_idx]:
-                                                current_solution.pop(source_idx)
-                        
-                        elif neighborhood == 'exchange_tps':
-                            # Exchange groups of TPS between clusters
-                            if len(current_solution) >= 2:
-                                # Choose two clusters
-                                idx1 = random.randint(0, len(current_solution) - 1)
-                                idx2 = random.randint(0, len(current_solution) - 1)
-                                
-                                # Ensure they're different clusters
-                                while idx2 == idx1 and len(current_solution) > 1:
-                                    idx2 = random.randint(0, len(current_solution) - 1)
-                                
-                                if len(current_solution[idx1]) >= 2 and len(current_solution[idx2]) >= 2:
-                                    # Choose a subset of TPS from each cluster
-                                    size1 = min(len(current_solution[idx1]) // 2, random.randint(1, 3))
-                                    size2 = min(len(current_solution[idx2]) // 2, random.randint(1, 3))
-                                    
-                                    subset1 = random.sample(current_solution[idx1], size1)
-                                    subset2 = random.sample(current_solution[idx2], size2)
-                                    
-                                    # Calculate volumes
-                                    vol1 = sum(volumes[idx] for idx in current_solution[idx1])
-                                    vol2 = sum(volumes[idx] for idx in current_solution[idx2])
-                                    
-                                    subset1_vol = sum(volumes[idx] for idx in subset1)
-                                    subset2_vol = sum(volumes[idx] for idx in subset2)
-                                    
-                                    # Check capacity constraints
-                                    new_vol1 = vol1 - subset1_vol + subset2_vol
-                                    new_vol2 = vol2 - subset2_vol + subset1_vol
-                                    
-                                    if new_vol1 <= max_capacity and new_vol2 <= max_capacity:
-                                        # Perform exchange
-                                        for tps in subset1:
-                                            current_solution[idx1].remove(tps)
-                                        
-                                        for tps in subset2:
-                                            current_solution[idx2].remove(tps)
-                                        
-                                        current_solution[idx1].extend(subset2)
-                                        current_solution[idx2].extend(subset1)
-                        
-                        elif neighborhood == 'split_merge':
-                            # Randomly choose to split or merge clusters
-                            if random.random() < 0.5 and current_solution:
-                                # Split a cluster
-                                if any(len(cluster) > 3 for cluster in current_solution):
-                                    # Choose a larger cluster
-                                    large_clusters = [i for i, c in enumerate(current_solution) if len(c) > 3]
-                                    idx = random.choice(large_clusters)
-                                    
-                                    # Determine split point
-                                    split_point = random.randint(1, len(current_solution[idx]) - 1)
-                                    
-                                    # Split cluster
-                                    cluster1 = current_solution[idx][:split_point]
-                                    cluster2 = current_solution[idx][split_point:]
-                                    
-                                    # Check validity of split clusters
-                                    vol1 = sum(volumes[idx] for idx in cluster1)
-                                    vol2 = sum(volumes[idx] for idx in cluster2)
-                                    
-                                    if vol1 <= max_capacity and vol2 <= max_capacity:
-                                        if vol1 >= min_capacity and vol2 >= min_capacity:
-                                            # Perform split
-                                            current_solution[idx] = cluster1
-                                            current_solution.append(cluster2)
-                            else:
-                                # Merge clusters
-                                if len(current_solution) >= 2:
-                                    # Choose two random clusters
-                                    idx1 = random.randint(0, len(current_solution) - 1)
-                                    idx2 = random.randint(0, len(current_solution) - 1)
-                                    
-                                    # Ensure they're different clusters
-                                    while idx2 == idx1 and len(current_solution) > 1:
-                                        idx2 = random.randint(0, len(current_solution) - 1)
-                                    
-                                    # Check if merge is valid
-                                    merged = current_solution[idx1] + current_solution[idx2]
-                                    merged_vol = sum(volumes[idx] for idx in merged)
-                                    
-                                    if merged_vol <= max_capacity:
-                                        # Perform merge
-                                        current_solution[idx1] = merged
-                                        if idx1 != idx2:  # safeguard
-                                            current_solution.pop(idx2 if idx2 < idx1 else idx2)
-                        
-                        # Check if the neighborhood move improved the solution
-                        new_fitness, _, _, _, _, _ = calculate_fitness(current_solution)
-                        
-                        if new_fitness < current_fitness:
-                            # Accept improved solution
-                            child = current_solution
-                            break  # Exit VNS early if we found an improvement
-                
-                # Clean up and validate the solution - common to both GA and VNS
-                # Remove empty clusters
-                child = [cluster for cluster in child if cluster]
-                
-                # Check if all TPS are assigned
-                all_assigned_tps = set()
-                for cluster in child:
-                    for idx in cluster:
-                        all_assigned_tps.add(idx)
-                
-                # If not all TPS are assigned, fix the solution
-                if len(all_assigned_tps) < n_points:
-                    missing_tps = set(range(n_points)) - all_assigned_tps
-                    
-                    # Try to add missing TPS to existing clusters
-                    for tps_idx in list(missing_tps):
-                        added = False
-                        
-                        # Try to add to existing clusters
-                        for cluster in child:
-                            # Check capacity
-                            cluster_volume = sum(volumes[idx] for idx in cluster)
-                            
-                            if cluster_volume + volumes[tps_idx] <= max_capacity:
-                                cluster.append(tps_idx)
-                                missing_tps.remove(tps_idx)
-                                added = True
-                                break
-                        
-                        if not added:
-                            continue
-                    
-                    # Create new clusters for remaining missing TPS
-                    if missing_tps:
-                        remaining = sorted(list(missing_tps), key=lambda idx: volumes[idx], reverse=True)
-                        
-                        current_cluster = []
-                        current_volume = 0
-                        
-                        for tps_idx in remaining:
-                            if current_volume + volumes[tps_idx] <= max_capacity:
-                                current_cluster.append(tps_idx)
-                                current_volume += volumes[tps_idx]
-                            else:
-                                # If can't add due to capacity, create a new cluster
-                                if current_cluster:
-                                    child.append(current_cluster)
-                                
-                                current_cluster = [tps_idx]
-                                current_volume = volumes[tps_idx]
-                        
-                        # Add the last cluster if not empty
-                        if current_cluster:
-                            child.append(current_cluster)
-                
-                # Check for duplicate TPS assignments
-                all_tps = []
-                for cluster in child:
-                    all_tps.extend(cluster)
-                
-                if len(all_tps) != len(set(all_tps)):
-                    # Fix duplicates by keeping only first occurrence
-                    seen = set()
-                    for i, cluster in enumerate(child):
-                        new_cluster = []
-                        for tps in cluster:
-                            if tps not in seen:
-                                new_cluster.append(tps)
-                                seen.add(tps)
-                        child[i] = new_cluster
-                    
-                    # Remove empty clusters
-                    child = [cluster for cluster in child if cluster]
-                
-                # Add to new population
-                new_population.append(child)
-                
-                # Break if we've reached population size
-                if len(new_population) >= population_size:
-                    break
-            
-            # If new population is still smaller than desired, add random solutions
-            while len(new_population) < population_size:
-                try:
-                    new_population.append(create_random_solution())
-                except:
-                    # Clone best solution as fallback
-                    new_population.append([cluster.copy() for cluster in population[0]])
-            
-            # Replace population
-            population = new_population[:population_size]
-        
-        # Final logging
-        progress_text.insert("end", f"\nOptimisasi selesai setelah {iteration+1} iterasi\n")
-        progress_text.insert("end", f"Solusi terbaik: {len(best_solution)} cluster dengan jarak total {best_distance:.2f}\n")
-        
-        # Update progress for final ACO route optimization
-        self.update_progress(85, "Melakukan optimasi rute final dengan ACO...")
-        
-        # Optimize routes for final solution (existing code)
-        if optimize_routes:
-            progress_text.insert("end", "\nMelakukan optimasi akhir pada rute dengan ACO...\n")
-            
-            # Cek apakah menggunakan fixed endpoints
-            use_fixed_endpoints = self.use_fixed_endpoints_var.get()
-            start_point_name = self.start_point_var.get() if use_fixed_endpoints else None
-            end_point_name = self.end_point_var.get() if use_fixed_endpoints else None
-            
-            # Cari indeks titik awal dan akhir
-            start_idx = None
-            end_idx = None
-            
-            if use_fixed_endpoints:
-                # Rest of the fixed endpoints code (tidak berubah)
-                # ...
-                names = self.data_info['names']
-                
-                # Coba temukan titik awal (Garasi)
-                if start_point_name in names:
-                    # Match persis
-                    for i, name in enumerate(names):
-                        if name == start_point_name:
-                            start_idx = i
-                            break
-                else:
-                    # Match parsial
-                    for i, name in enumerate(names):
-                        if start_point_name.lower() in name.lower():
-                            start_idx = i
-                            break
-                
-                # Coba temukan titik akhir (TPA)
-                if end_point_name in names:
-                    # Match persis
-                    for i, name in enumerate(names):
-                        if name == end_point_name:
-                            end_idx = i
-                            break
-                else:
-                    # Match parsial
-                    for i, name in enumerate(names):
-                        if end_point_name.lower() in name.lower():
-                            end_idx = i
-                            break
-                
-                # Log hasil
-                if start_idx is not None:
-                    progress_text.insert("end", f"Titik awal rute (Garasi): {names[start_idx]} (index {start_idx})\n")
-                else:
-                    progress_text.insert("end", f"PERINGATAN: Titik awal '{start_point_name}' tidak ditemukan dalam data!\n")
-                    use_fixed_endpoints = False
-                
-                if end_idx is not None:
-                    progress_text.insert("end", f"Titik akhir rute (TPA): {names[end_idx]} (index {end_idx})\n")
-                else:
-                    progress_text.insert("end", f"PERINGATAN: Titik akhir '{end_point_name}' tidak ditemukan dalam data!\n")
-                    use_fixed_endpoints = False
-            
-            # ACO route optimization code (tidak berubah)
-            optimized_solution = []
-            total_improvement = 0
-            
-            # Calculate total clusters for progress tracking
-            total_clusters = len(best_solution)
-            progress_increment = 15.0 / total_clusters if total_clusters > 0 else 0
-            
-            for i, cluster in enumerate(best_solution):
-                # Update progress
-                current_progress = 85 + (i * progress_increment)
-                self.update_progress(current_progress, f"Optimasi ACO untuk cluster {i+1}/{total_clusters}")
-                update_detail_progress(
-                    (i * 100) / total_clusters,
-                    f"Optimasi rute cluster {i+1}/{total_clusters}"
-                )
-                
-                if len(cluster) >= 1:  # Bahkan 1 TPS perlu optimasi dengan titik awal/akhir
-                    # Hitung jarak rute asli
-                    original_dist = 0
-                    
-                    if use_fixed_endpoints and start_idx is not None and end_idx is not None:
-                        # Jarak Garasi -> TPS pertama
-                        original_dist += distance_matrix[start_idx][cluster[0]]
-                        
-                        # Jarak antar TPS
-                        for j in range(len(cluster)-1):
-                            original_dist += distance_matrix[cluster[j]][cluster[j+1]]
-                        
-                        # Jarak TPS terakhir -> TPA
-                        original_dist += distance_matrix[cluster[-1]][end_idx]
-                    else:
-                        # Hanya jarak antar TPS
-                        for j in range(len(cluster)-1):
-                            original_dist += distance_matrix[cluster[j]][cluster[j+1]]
-                    
-                    # Optimasi dengan ACO
-                    optimized_route, route_distance = self.optimize_route_aco(
-                        cluster, distance_matrix, 
-                        start_idx=start_idx if use_fixed_endpoints else None,
-                        end_idx=end_idx if use_fixed_endpoints else None,
-                        num_ants=aco_ants, 
-                        num_iterations=aco_iterations,
-                        update_progress=None  # Don't show nested progress to avoid UI clutter
-                    )
-                    
-                    # Hitung peningkatan
-                    improvement = original_dist - route_distance
-                    
-                    # Gunakan rute optimal jika lebih baik atau jika titik awal/akhir diperlukan
-                    if improvement > 0 or use_fixed_endpoints:
-                        optimized_solution.append(optimized_route)
-                        total_improvement += improvement
-                        
-                        # Pesan log disesuaikan dengan tipe rute
-                        if use_fixed_endpoints and start_idx is not None and end_idx is not None:
-                            # Rute dengan titik awal dan akhir
-                            route_desc = f"Garasi → {len(cluster)} TPS → TPA"
-                        else:
-                            # Rute hanya TPS
-                            route_desc = f"{len(cluster)} TPS"
-                        
-                        progress_text.insert("end", f"Cluster {i+1} ({route_desc}): Peningkatan rute sebesar {improvement:.2f} unit\n")
-                    else:
-                        optimized_solution.append(cluster)
-                else:
-                    optimized_solution.append(cluster)
-            
-            # Use the optimized solution if we have one
-            if optimized_solution:
-                best_solution = optimized_solution
-        
-        # Complete progress
-        self.update_progress(100, "Validasi solusi akhir...")
-        
-        # Validate final solution
-        all_tps = []
-        for cluster in best_solution:
-            all_tps.extend(cluster)
-        
-        missing = set(range(n_points)) - set(all_tps)
-        duplicates = len(all_tps) - len(set(all_tps))
-        
-        if missing:
-            progress_text.insert("end", f"PERINGATAN: {len(missing)} TPS tidak masuk cluster: {missing}\n")
-        
-        if duplicates:
-            progress_text.insert("end", f"PERINGATAN: {duplicates} TPS duplikat dalam cluster\n")
+            self.root.update_idletasks()
         
-        # Check cluster capacities
-        for i, cluster in enumerate(best_solution):
-            cluster_vol = sum(volumes[idx] for idx in cluster)
-            if cluster_vol < min_capacity:
-                progress_text.insert("end", f"PERINGATAN: Cluster {i+1} di bawah kapasitas minimum: {cluster_vol:.2f} m³\n")
-            if cluster_vol > max_capacity:
-                progress_text.insert("end", f"PERINGATAN: Cluster {i+1} melebihi kapasitas maksimum: {cluster_vol:.2f} m³\n")
+        params = self._solver_params(
+            population_size, max_iterations, mutation_rate, crossover_rate, distance_penalty,
+            optimize_routes, aco_ants, aco_iterations, aco_variant, debug_mode, progress_text=progress_text,
+            time_limit_seconds=time_limit_seconds, checkpoint_path=checkpoint_path
+        )
         
-        self.root.update_idletasks()
+        result = solve(distance_matrix, volumes, min_capacity, max_capacity, params,
+                       progress_callback=on_progress, route_cache=route_cache, rng=rng)
+        self.last_run_status = {'stopped': result['stopped'], 'time_limit_hit': result['time_limit_hit']}
         
-        # Filter out Garage and TPA if requested
-        if self.use_fixed_endpoints_var.get():
-            # Filter clusters to remove any occurrence of Garage or TPA
-            filtered_solution = []
-            names = self.data_info['names']
-            
-            # Daftar nama yang akan diabaikan
-            ignore_names = ["Garasi", "TPA", "TPA Troketon"]
-            
-            # Identifikasi indeks yang harus difilter
-            ignore_indices = []
-            for i, name in enumerate(names):
-                if isinstance(name, str) and any(ignore.lower() in name.lower() for ignore in ignore_names):
-                    ignore_indices.append(i)
-            
-            # Filter tiap cluster
-            for cluster in best_solution:
-                filtered_cluster = [idx for idx in cluster if idx not in ignore_indices]
-                if filtered_cluster:  # Hanya tambahkan jika cluster tidak kosong
-                    filtered_solution.append(filtered_cluster)
-            
-            # Gunakan solution yang telah difilter
-            best_solution = filtered_solution
-        
-        # Return the best solution
-        return best_solution if best_solution else [list(range(n_points))], debug_info
+        return result['clusters'], result['debug_info']
     
-    def calculate_solution_metrics(self, clusters, distance_matrix, volumes, optimize_routes=True):
+    def calculate_solution_metrics(self, clusters, distance_matrix, volumes, optimize_routes=True, route_cache=None):
         """Calculate metrics for a clustering solution including Garage-TPA distances"""
-        # Calculate total volume
-        total_volume = sum(volumes)
-        
         # Get Garage and TPA indices if they are used
         use_fixed_endpoints = self.use_fixed_endpoints_var.get()
         start_point_name = self.start_point_var.get() if use_fixed_endpoints else None
@@ -1847,89 +504,11 @@ class TPSClusteringApp:
                     end_idx = i
                     break
         
-        # Calculate cluster metrics
-        cluster_metrics = []
-        total_distance = 0
-        total_route_distance = 0
-        total_complete_route_distance = 0  # Including Garage and TPA
-        
-        for i, cluster in enumerate(clusters):
-            cluster_volume = sum(volumes[idx] for idx in cluster)
-            volume_percentage = (cluster_volume / total_volume) * 100
-            
-            # Calculate intra-cluster distances
-            intra_distances = []
-            for j in range(len(cluster)):
-                for k in range(j+1, len(cluster)):
-                    dist = distance_matrix[cluster[j]][cluster[k]]
-                    intra_distances.append(dist)
-            
-            avg_intra_distance = np.mean(intra_distances) if intra_distances else 0
-            max_intra_distance = np.max(intra_distances) if intra_distances else 0
-            total_distance += sum(intra_distances)
-            
-            # Calculate route distance (TSP only between TPS)
-            route_distance = 0
-            if len(cluster) > 1 and optimize_routes:
-                # Calculate route distance along the ordered cluster
-                for j in range(len(cluster)-1):
-                    route_distance += distance_matrix[cluster[j]][cluster[j+1]]
-            else:
-                route_distance = sum(intra_distances) if intra_distances else 0
-            
-            # Calculate COMPLETE route including Garage and TPA
-            complete_route_distance = route_distance
-            garage_to_first_distance = 0
-            last_to_tpa_distance = 0
-            
-            if use_fixed_endpoints and start_idx is not None and end_idx is not None and len(cluster) > 0:
-                # Add distance from Garage to first TPS
-                garage_to_first_distance = distance_matrix[start_idx][cluster[0]]
-                complete_route_distance += garage_to_first_distance
-                
-                # Add distance from last TPS to TPA
-                last_to_tpa_distance = distance_matrix[cluster[-1]][end_idx]
-                complete_route_distance += last_to_tpa_distance
-            
-            # Add to totals
-            total_route_distance += route_distance
-            total_complete_route_distance += complete_route_distance
-            
-            # Calculate between-node distances for this cluster
-            node_distances = []
-            for j in range(len(cluster)-1):
-                node_distances.append(distance_matrix[cluster[j]][cluster[j+1]])
-            
-            cluster_metrics.append({
-                'cluster_id': i+1,
-                'size': len(cluster),
-                'volume': cluster_volume,
-                'volume_percentage': volume_percentage,
-                'avg_distance': avg_intra_distance,
-                'max_distance': max_intra_distance,
-                'route_distance': route_distance,  # TPS only
-                'garage_to_first': garage_to_first_distance,  # Garage to first TPS
-                'last_to_tpa': last_to_tpa_distance,  # Last TPS to TPA
-                'complete_route_distance': complete_route_distance,  # Total including Garage & TPA
-                'node_distances': node_distances
-            })
-        
-        # Calculate solution metrics
-        solution_metrics = {
-            'num_clusters': len(clusters),
-            'total_distance': total_distance,
-            'total_route_distance': total_route_distance,  # TPS only
-            'total_complete_route_distance': total_complete_route_distance,  # Including Garage & TPA
-            'avg_distance_per_cluster': total_distance / len(clusters) if clusters else 0,
-            'avg_route_distance_per_cluster': total_route_distance / len(clusters) if clusters else 0,
-            'avg_complete_route_distance_per_cluster': total_complete_route_distance / len(clusters) if clusters else 0,
-            'cluster_metrics': cluster_metrics,
-            'use_fixed_endpoints': use_fixed_endpoints,
-            'garage_index': start_idx,
-            'tpa_index': end_idx
-        }
-        
-        return solution_metrics
+        return solution_metrics(
+            clusters, distance_matrix, volumes, optimize_routes,
+            start_idx=start_idx, end_idx=end_idx, use_fixed_endpoints=use_fixed_endpoints,
+            route_cache=route_cache
+        )
     
     def calculate_cluster_centroids(self):
         """Calculate the centroid (middle point) coordinates for each cluster"""
@@ -2130,6 +709,7 @@ class TPSClusteringApp:
             optimize_routes = self.optimize_routes_var.get()
             aco_ants = self.aco_ants_var.get()
             aco_iterations = self.aco_iterations_var.get()
+            aco_variant = "mmas" if self.aco_mmas_var.get() else "as"
             debug_mode = self.debug_var.get()
             
             # Multi-start parameters
@@ -2138,6 +718,9 @@ class TPSClusteringApp:
             num_workers = self.num_workers_var.get()
             adaptive_stop = self.adaptive_stop_var.get()
             max_no_improvement = self.max_no_improvement_var.get()
+            time_limit = self.time_limit_var.get()
+            island_model = self.island_model_var.get()
+            use_checkpoint = self.checkpoint_var.get()
             
             # Validate parameters
             if min_capacity <= 0 or max_capacity <= 0 or distance_penalty < 0:
@@ -2156,6 +739,10 @@ class TPSClusteringApp:
                 messagebox.showerror("Error", "Jumlah worker harus lebih besar dari 0")
                 return
             
+            if time_limit < 0:
+                messagebox.showerror("Error", "Batas waktu tidak boleh negatif (0 = tanpa batas)")
+                return
+            
             self.status_var.set("Memproses data...")
             self.update_progress(2, "Membaca file Excel...")
             
@@ -2248,7 +835,9 @@ class TPSClusteringApp:
             progress_text.insert("end", f"Jumlah run: {num_runs}\n")
             progress_text.insert("end", f"Paralel: {'Ya' if parallel else 'Tidak'}, Workers: {num_workers}\n")
             progress_text.insert("end", f"Adaptive stopping: {'Ya' if adaptive_stop else 'Tidak'}, " +
-                               f"Max tanpa perbaikan: {max_no_improvement}\n\n")
+                               f"Max tanpa perbaikan: {max_no_improvement}\n")
+            progress_text.insert("end", f"Batas waktu: {f'{time_limit:.1f} detik' if time_limit > 0 else 'Tanpa batas'}\n")
+            progress_text.insert("end", f"Island model: {'Ya (hanya mode paralel)' if island_model else 'Tidak'}\n\n")
             progress_text.insert("end", "Menjalankan multi-start...\n" + "-"*50 + "\n\n")
             
             # Show the multi-start tab
@@ -2260,9 +849,9 @@ class TPSClusteringApp:
                 args=(
                     distance_matrix, volumes, min_capacity, max_capacity,
                     population_size, max_iterations, mutation_rate, crossover_rate,
-                    distance_penalty, optimize_routes, aco_ants, aco_iterations,
-                    debug_mode, num_runs, parallel, num_workers, adaptive_stop, max_no_improvement,
-                    progress_text, ms_status_var, ms_progress_var, ms_progress_text_var, 
+                    distance_penalty, optimize_routes, aco_ants, aco_iterations, aco_variant,
+                    debug_mode, num_runs, parallel, num_workers, adaptive_stop, max_no_improvement, time_limit,
+                    island_model, use_checkpoint, progress_text, ms_status_var, ms_progress_var, ms_progress_text_var, 
                     ms_time_var, ms_best_var
                 )
             )
@@ -2285,9 +874,9 @@ class TPSClusteringApp:
     
     def _run_multi_start(self, distance_matrix, volumes, min_capacity, max_capacity,
                          population_size, max_iterations, mutation_rate, crossover_rate,
-                         distance_penalty, optimize_routes, aco_ants, aco_iterations,
-                         debug_mode, num_runs, parallel, num_workers, adaptive_stop, max_no_improvement,
-                         progress_text, ms_status_var, ms_progress_var, ms_progress_text_var, 
+                         distance_penalty, optimize_routes, aco_ants, aco_iterations, aco_variant,
+                         debug_mode, num_runs, parallel, num_workers, adaptive_stop, max_no_improvement, time_limit,
+                         island_model, use_checkpoint, progress_text, ms_status_var, ms_progress_var, ms_progress_text_var, 
                          ms_time_var, ms_best_var):
         """
         Run multi-start optimization for clustering
@@ -2322,10 +911,52 @@ class TPSClusteringApp:
             best_distance = float('inf')
             no_improvement_count = 0
             
+            # Batas waktu seluruh multi-start (0 = tanpa batas); sisa waktu dibagi ke run berikutnya
+            deadline = self.start_time + time_limit if time_limit > 0 else None
+            time_limit_hit = False
+            
+            # Cache biaya rute dipakai bersama oleh semua run (matriks jarak sama)
+            route_cache = RouteCostCache()
+            
+            # Checkpoint di folder sebelah file Excel; hanya dilanjutkan bila konfigurasinya sama
+            checkpoint = None
+            completed_results = {}
+            if use_checkpoint:
+                # Garasi/TPA, batas waktu dan isi data ikut menentukan hasil setiap run
+                endpoint_params = self._solver_params(
+                    population_size, max_iterations, mutation_rate, crossover_rate, distance_penalty,
+                    optimize_routes, aco_ants, aco_iterations, aco_variant, debug_mode
+                )
+                checkpoint = MultiStartCheckpoint(os.path.splitext(self.file_path)[0] + "_checkpoint", {
+                    'num_runs': num_runs, 'n_points': len(volumes),
+                    'data': data_fingerprint(distance_matrix, volumes),
+                    'use_fixed_endpoints': self.use_fixed_endpoints_var.get(),
+                    'start_idx': endpoint_params['start_idx'], 'end_idx': endpoint_params['end_idx'],
+                    'time_limit': time_limit,
+                    'min_capacity': min_capacity, 'max_capacity': max_capacity,
+                    'population_size': population_size, 'max_iterations': max_iterations,
+                    'mutation_rate': mutation_rate, 'crossover_rate': crossover_rate,
+                    'distance_penalty': distance_penalty, 'optimize_routes': optimize_routes,
+                    'aco_ants': aco_ants, 'aco_iterations': aco_iterations, 'aco_variant': aco_variant,
+                    'parallel': parallel, 'island_model': island_model
+                })
+                completed_results = {result['seed']: result for result in checkpoint.results}
+                progress_text.insert("end", f"Folder checkpoint: {checkpoint.directory}\n")
+                if checkpoint.resumed:
+                    progress_text.insert("end", f"Melanjutkan multi-start dari checkpoint: " +
+                                       f"{len(completed_results)}/{num_runs} run sudah selesai\n")
+            
+            # Setiap run memakai generator acak sendiri dari SeedSequence.spawn
+            # (seed dasar dari checkpoint dipakai ulang agar run lanjutan identik)
+            seed_entropy, run_seeds = spawn_run_seeds(num_runs, checkpoint.seed_entropy if checkpoint else None)
+            progress_text.insert("end", f"Seed dasar multi-start: {seed_entropy}\n")
+            if checkpoint is not None:
+                checkpoint.start(seed_entropy)
+            
             # Function to run a single optimization
-            def run_single(seed):
-                # Set random seed
-                np.random.seed(seed)
+            def run_single(seed, time_limit_seconds=None, checkpoint_path=None):
+                # Generator acak khusus run ini
+                rng = np.random.default_rng(run_seeds[seed])
                 
                 # Log progress
                 if not parallel:
@@ -2348,39 +979,18 @@ class TPSClusteringApp:
                     mutation_rate=mutation_rate, crossover_rate=crossover_rate,
                     distance_penalty=distance_penalty, optimize_routes=optimize_routes,
                     aco_ants=aco_ants, aco_iterations=aco_iterations,
-                    debug_mode=debug_mode
+                    debug_mode=debug_mode, route_cache=route_cache, aco_variant=aco_variant, rng=rng,
+                    time_limit_seconds=time_limit_seconds, checkpoint_path=checkpoint_path
                 )
                 execution_time = time.time() - start_time
                 
                 # Calculate metrics
                 metrics = self.calculate_solution_metrics(
-                    clusters, distance_matrix, volumes, optimize_routes
+                    clusters, distance_matrix, volumes, optimize_routes, route_cache=route_cache
                 )
                 
-                # Check feasibility
-                feasible = True
-                for cluster in clusters:
-                    cluster_vol = sum(volumes[idx] for idx in cluster)
-                    if cluster_vol > max_capacity:
-                        feasible = False
-                        break
-                
-                # Get total distance
-                total_distance_key = 'total_complete_route_distance' if 'total_complete_route_distance' in metrics else 'total_route_distance'
-                distance = metrics.get(total_distance_key, float('inf'))
-                
-                # Create full result
-                result = {
-                    'seed': seed,
-                    'clusters': clusters,
-                    'metrics': metrics,
-                    'execution_time': execution_time,
-                    'feasible': feasible,
-                    'distance': distance,
-                    'num_clusters': len(clusters),
-                    'debug_info': debug_info
-                }
-                
+                result = make_run_result(seed, clusters, debug_info, metrics, volumes, max_capacity, execution_time)
+                result.update(self.last_run_status)
                 return result
             
             if parallel and num_runs > 1:
@@ -2392,74 +1002,114 @@ class TPSClusteringApp:
                 
                 self.update_progress(10, f"Menjalankan {num_runs} run secara paralel...")
                 
-                # Determine executor based on complexity
-                executor_class = ThreadPoolExecutor  # Default 
-                executor_name = "ThreadPoolExecutor"
+                # Disimpan untuk visualisasi/ekspor (run paralel tidak memanggil ga_vns_clustering)
+                self.distance_matrix = distance_matrix
                 
-                if distance_matrix.shape[0] > 100:
-                    # For large problems, use ProcessPoolExecutor
-                    try:
-                        from concurrent.futures import ProcessPoolExecutor
-                        executor_class = ProcessPoolExecutor
-                        executor_name = "ProcessPoolExecutor"
-                    except:
-                        # Fall back to ThreadPoolExecutor if ProcessPoolExecutor is not available
-                        pass
-                
-                progress_text.insert("end", f"Menggunakan {executor_name} dengan {num_workers} workers\n\n")
-                
-                with executor_class(max_workers=num_workers) as executor:
-                    # Submit all tasks
-                    futures = {executor.submit(run_single, seed): seed for seed in range(num_runs)}
+                # Setiap run adalah proses GA-VNS headless (multi_start.run_single_start) di process
+                # terpisah; matriks jarak dan volume dibagikan sekali lewat shared memory
+                params = self._solver_params(
+                    population_size, max_iterations, mutation_rate, crossover_rate, distance_penalty,
+                    optimize_routes, aco_ants, aco_iterations, aco_variant, debug_mode, progress_text=progress_text
+                )
+                
+                progress_text.insert("end", f"Menggunakan ProcessPoolExecutor dengan {num_workers} workers\n")
+                if island_model:
+                    progress_text.insert("end", f"Island model: migrasi {params.get('migration_size', 2)} solusi terbaik " +
+                                       f"setiap {params.get('migration_interval', 10)} generasi (ring)\n")
+                progress_text.insert("end", "\n")
+                
+                # Run dikirim bertahap; stop_event menghentikan run yang berjalan/antri (adaptive stop)
+                stop_event = multiprocessing.Event()
+                parallel_runs = iter_parallel_runs(
+                    distance_matrix, volumes, min_capacity, max_capacity, params, run_seeds, num_workers, stop_event,
+                    deadline=deadline, island_model=island_model, checkpoint=checkpoint
+                )
+                
+                # Process results as they complete
+                for i, (seed, result, error) in enumerate(parallel_runs):
+                    if error is not None:
+                        progress_text.insert("end", f"Error pada run {i+1} (seed={seed}): {str(error)}\n")
+                        progress_text.see("end")
+                        self.root.update_idletasks()
+                        continue
                     
-                    # Process results as they complete
-                    for i, future in enumerate(as_completed(futures)):
-                        seed = futures[future]
-                        try:
-                            result = future.result()
-                            all_results.append(result)
-                            
-                            # Update progress
-                            progress_percentage = 10 + (85 * (i + 1) / num_runs)
-                            self.update_progress(
-                                progress_percentage,
-                                f"Selesai run {i+1}/{num_runs} (seed={seed}): {result['num_clusters']} cluster, jarak={result['distance']:.2f}"
-                            )
-                            
-                            # Update multi-start progress
-                            ms_progress_var.set((i+1) * 100 / num_runs)
-                            ms_progress_text_var.set(f"{int((i+1) * 100 / num_runs)}%")
-                            ms_status_var.set(f"Run {i+1}/{num_runs} (seed={seed}): {result['num_clusters']} cluster, jarak={result['distance']:.2f}")
-                            
-                            # Log result
-                            feasible_text = "FEASIBLE" if result['feasible'] else "TIDAK FEASIBLE"
-                            progress_text.insert("end", f"Run {i+1}/{num_runs} (seed={seed}): {result['num_clusters']} cluster, " +
-                                              f"jarak={result['distance']:.2f}, {feasible_text}, waktu={result['execution_time']:.2f}s\n")
-                            progress_text.see("end")
-                            
-                            # Update best solution
-                            if ((result['feasible'] and result['distance'] < best_distance) or 
-                                (best_solution is None and result['feasible'])):
-                                best_solution = result
-                                best_distance = result['distance']
-                                ms_best_var.set(f"Solusi terbaik: Seed {seed}, {result['num_clusters']} cluster, jarak={result['distance']:.2f}")
-                                progress_text.insert("end", f"✓ Run {i+1} (seed={seed}) menghasilkan solusi terbaik baru: {result['distance']:.2f}\n")
-                                progress_text.see("end")
-                            
-                            self.root.update_idletasks()
-                        except Exception as e:
-                            progress_text.insert("end", f"Error pada run {i+1} (seed={seed}): {str(e)}\n")
-                            progress_text.see("end")
-                            self.root.update_idletasks()
+                    all_results.append(result)
+                    
+                    # Update progress
+                    progress_percentage = 10 + (85 * (i + 1) / num_runs)
+                    self.update_progress(
+                        progress_percentage,
+                        f"Selesai run {i+1}/{num_runs} (seed={seed}): {result['num_clusters']} cluster, jarak={result['distance']:.2f}"
+                    )
+                    
+                    # Update multi-start progress
+                    ms_progress_var.set((i+1) * 100 / num_runs)
+                    ms_progress_text_var.set(f"{int((i+1) * 100 / num_runs)}%")
+                    ms_status_var.set(f"Run {i+1}/{num_runs} (seed={seed}): {result['num_clusters']} cluster, jarak={result['distance']:.2f}")
+                    
+                    # Log result
+                    feasible_text = "FEASIBLE" if result['feasible'] else "TIDAK FEASIBLE"
+                    stopped_text = " (dihentikan lebih awal)" if result.get('stopped') else ""
+                    if result.get('time_limit_hit'):
+                        time_limit_hit = True
+                        stopped_text += " (batas waktu)"
+                    if result.get('resumed'):
+                        stopped_text += " (dari checkpoint)"
+                    progress_text.insert("end", f"Run {i+1}/{num_runs} (seed={seed}): {result['num_clusters']} cluster, " +
+                                      f"jarak={result['distance']:.2f}, {feasible_text}, waktu={result['execution_time']:.2f}s{stopped_text}\n")
+                    progress_text.see("end")
+                    
+                    # Update best solution
+                    if ((result['feasible'] and result['distance'] < best_distance) or
+                        (best_solution is None and result['feasible'])):
+                        best_solution = result
+                        best_distance = result['distance']
+                        no_improvement_count = 0
+                        ms_best_var.set(f"Solusi terbaik: Seed {seed}, {result['num_clusters']} cluster, jarak={result['distance']:.2f}")
+                        progress_text.insert("end", f"✓ Run {i+1} (seed={seed}) menghasilkan solusi terbaik baru: {result['distance']:.2f}\n")
+                        progress_text.see("end")
+                    else:
+                        no_improvement_count += 1
+                    
+                    self.root.update_idletasks()
+                    
+                    # Check adaptive stopping: run yang sedang berjalan berhenti di generasi berikutnya
+                    if (adaptive_stop and not stop_event.is_set() and
+                            no_improvement_count >= max_no_improvement and i + 1 >= num_runs // 3):
+                        stop_event.set()
+                        progress_text.insert("end", f"\nADAPTIVE STOP: Berhenti setelah {no_improvement_count} run tanpa perbaikan\n")
+                        progress_text.see("end")
+                
+                if deadline is not None and time.time() >= deadline:
+                    time_limit_hit = True
             else:
                 # Run sequentially
                 for run in range(num_runs):
+                    resumed_result = completed_results.get(run)
+                    
+                    # Sisa batas waktu dibagi rata ke run yang belum dijalankan
+                    run_time_limit = None
+                    if deadline is not None and resumed_result is None:
+                        run_time_limit = split_time_budget(deadline - time.time(), num_runs - run)
+                        if run_time_limit <= 0:
+                            time_limit_hit = True
+                            progress_text.insert("end", f"\nBATAS WAKTU: Berhenti setelah {run} run\n")
+                            progress_text.see("end")
+                            break
+                    
                     # Update status
                     ms_status_var.set(f"Menjalankan run {run+1}/{num_runs} (seed={run})...")
                     
-                    # Run clustering
-                    result = run_single(run)
+                    # Run clustering (hasil run yang sudah selesai diambil dari checkpoint)
+                    if resumed_result is not None:
+                        result = dict(resumed_result, resumed=True)
+                    else:
+                        result = run_single(run, time_limit_seconds=run_time_limit,
+                                            checkpoint_path=checkpoint.run_path(run) if checkpoint else None)
+                        if checkpoint is not None:
+                            checkpoint.record_result(result)
                     all_results.append(result)
+                    time_limit_hit = time_limit_hit or result['time_limit_hit']
                     
                     # Update progress display
                     progress_percentage = 10 + (85 * (run + 1) / num_runs)
@@ -2473,8 +1123,11 @@ class TPSClusteringApp:
                     
                     # Log result
                     feasible_text = "FEASIBLE" if result['feasible'] else "TIDAK FEASIBLE"
+                    limit_text = " (batas waktu)" if result['time_limit_hit'] else ""
+                    if result.get('resumed'):
+                        limit_text += " (dari checkpoint)"
                     progress_text.insert("end", f"Run {run+1}/{num_runs} (seed={run}): {result['num_clusters']} cluster, " +
-                                      f"jarak={result['distance']:.2f}, {feasible_text}, waktu={result['execution_time']:.2f}s\n")
+                                      f"jarak={result['distance']:.2f}, {feasible_text}, waktu={result['execution_time']:.2f}s{limit_text}\n")
                     progress_text.see("end")
                     
                     # Update best solution
@@ -2502,6 +1155,10 @@ class TPSClusteringApp:
                 self.root.after_cancel(self.timer_id)
                 self.timer_id = None
             
+            # Multi-start selesai: checkpoint dihapus agar run berikutnya dihitung ulang
+            if checkpoint is not None:
+                checkpoint.clear()
+            
             # Store results for later use
             self.multi_start_results = all_results
             
@@ -2520,6 +1177,8 @@ class TPSClusteringApp:
             
             progress_text.insert("end", f"\nMulti-start selesai pada: {time.strftime('%H:%M:%S')}\n")
             progress_text.insert("end", f"Total waktu proses: {total_elapsed:.2f} detik\n")
+            if time_limit_hit:
+                progress_text.insert("end", "Batas waktu tercapai: hasil adalah solusi terbaik sejauh ini\n")
             progress_text.insert("end", "Menampilkan hasil di tab Multi-Start Results...\n")
             progress_text.see("end")
             
@@ -2547,7 +1206,9 @@ class TPSClusteringApp:
                         'num_runs': len(all_results),
                         'best_distance': best_solution['distance'],
                         'best_feasible': best_solution['feasible'],
-                        'total_process_time': total_elapsed
+                        'total_process_time': total_elapsed,
+                        'time_limit_hit': time_limit_hit,
+                        'resumed_runs': sum(1 for result in all_results if result.get('resumed'))
                     }
                 }
                 
@@ -3689,6 +2350,9 @@ class TPSClusteringApp:
                     font=("Arial", 12)).pack(anchor="w", pady=5)
             ttk.Label(summary_frame, text=f"Total Waktu Multi-Start: {ms_info.get('total_process_time', 0):.2f} detik", 
                     font=("Arial", 12)).pack(anchor="w", pady=5)
+            if ms_info.get('time_limit_hit'):
+                ttk.Label(summary_frame, text="Batas waktu tercapai (solusi terbaik sejauh ini)", 
+                        font=("Arial", 12), foreground="red").pack(anchor="w", pady=5)
         
         if 'metrics' in self.results:
             metrics = self.results['metrics']
@@ -0,0 +1,79 @@
+"""
+Cache Utils - Cache LRU berukuran terbatas dengan statistik hit/miss
+Dipakai bersama oleh cache fitness (solution_state) dan cache biaya rute (route_optimization).
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Cache LRU berukuran terbatas. Aman dipakai dari beberapa thread
+    (multi-start dengan ThreadPoolExecutor).
+    """
+
+    def __init__(self, maxsize=20000):
+        """
+        Args:
+            maxsize (int): Jumlah entri maksimum, 0 = cache nonaktif
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """Ambil nilai tersimpan (None jika tidak ada) dan tandai sebagai baru dipakai"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Simpan nilai; entri yang paling lama tidak dipakai dibuang jika penuh"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def cached(self, key, compute):
+        """Ambil nilai dari cache, atau hitung dengan compute() lalu simpan"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def hit_rate(self):
+        """Rasio cache hit terhadap seluruh pencarian"""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def stats(self):
+        """Ringkasan statistik cache"""
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate()
+        }
+
+    def clear(self):
+        """Kosongkan cache dan statistiknya"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,137 @@
+"""
+Capacitated K-Medoids - Clustering berkapasitas pada matriks jarak jalan
+Medoid awal dipilih seperti k-means++ (peluang sebanding kuadrat jarak pulang-pergi ke
+medoid terdekat), lalu bergantian: assignment greedy-regret berkapasitas dan pembaruan
+medoid (cluster_medoids). Assignment berjalan per putaran yang seluruhnya NumPy: setiap
+TPS mengusulkan cluster termurah yang masih muat, dan setiap cluster menerima usulan
+dengan regret terbesar dulu selama kapasitasnya cukup. TPS yang tidak muat di mana pun
+ditempatkan oleh repair_labels (best-fit, membuka cluster baru bila perlu), lalu
+cluster di bawah min_capacity diseimbangkan dengan balance_min_capacity.
+"""
+
+import numpy as np
+
+from solution_encoding import UNASSIGNED, balance_min_capacity, cluster_medoids, repair_labels
+
+
+def _round_trip(distance_matrix, medoids):
+    """Jarak pulang-pergi setiap TPS ke setiap medoid (n x k)"""
+    D = distance_matrix
+    return (np.asarray(D[:, medoids], dtype=float) + np.asarray(D[medoids, :], dtype=float).T)
+
+
+def init_medoids(distance_matrix, k, rng):
+    """
+    Pilih k medoid awal dengan seeding k-means++ pada jarak pulang-pergi.
+
+    Returns:
+        numpy.ndarray: Indeks TPS medoid
+    """
+    n = len(distance_matrix)
+    k = max(1, min(k, n))
+    medoids = [int(rng.integers(n))]
+    nearest = _round_trip(distance_matrix, medoids)[:, 0]
+
+    for _ in range(k - 1):
+        weights = nearest ** 2
+        total = weights.sum()
+        if total <= 0:
+            break
+        chosen = int(rng.choice(n, p=weights / total))
+        medoids.append(chosen)
+        nearest = np.minimum(nearest, _round_trip(distance_matrix, [chosen])[:, 0])
+
+    return np.asarray(medoids, dtype=np.int64)
+
+
+def regret_assignment(cost, volumes, max_capacity):
+    """
+    Assignment greedy-regret berkapasitas.
+
+    Setiap putaran: TPS yang belum masuk memilih cluster termurah yang sisa kapasitasnya
+    cukup; regret = selisih biaya cluster kedua dan pertama (tak hingga bila hanya satu
+    yang muat). Per cluster, usulan diurutkan dari regret terbesar dan diterima selama
+    kumulatif volumenya muat. Setiap putaran minimal satu TPS per cluster yang diusulkan
+    diterima, sehingga proses selalu selesai.
+
+    Args:
+        cost (numpy.ndarray): Biaya TPS ke cluster (n x k)
+        volumes (numpy.ndarray): Volume setiap TPS
+        max_capacity (float): Kapasitas maksimum cluster
+
+    Returns:
+        numpy.ndarray: Vektor label (-1 untuk TPS yang tidak muat di cluster mana pun)
+    """
+    n, k = cost.shape
+    volumes = np.asarray(volumes, dtype=float)
+    labels = np.full(n, UNASSIGNED, dtype=np.int32)
+    remaining = np.full(k, float(max_capacity))
+    pending = np.arange(n)
+
+    while len(pending) > 0 and k > 0:
+        fits = volumes[pending, None] <= remaining[None, :] + 1e-9
+        options = np.where(fits, cost[pending], np.inf)
+        choice = np.argmin(options, axis=1)
+        best = options[np.arange(len(pending)), choice]
+
+        placeable = np.isfinite(best)
+        if not placeable.any():
+            break
+        pending, options, choice, best = pending[placeable], options[placeable], choice[placeable], best[placeable]
+
+        if k > 1:
+            second = np.partition(options, 1, axis=1)[:, 1]
+            regret = second - best
+        else:
+            regret = np.zeros(len(pending))
+
+        # Urut per cluster, lalu regret terbesar (volume terbesar saat regret sama)
+        order = np.lexsort((-volumes[pending], -regret, choice))
+        pending, choice = pending[order], choice[order]
+        vol = volumes[pending]
+        cumulative = np.cumsum(vol)
+        group_start = np.ones(len(choice), dtype=bool)
+        group_start[1:] = choice[1:] != choice[:-1]
+        offset = np.maximum.accumulate(np.where(group_start, cumulative - vol, 0.0))
+        accepted = cumulative - offset <= remaining[choice] + 1e-9
+
+        labels[pending[accepted]] = choice[accepted]
+        remaining -= np.bincount(choice[accepted], weights=vol[accepted], minlength=k)
+        pending = np.sort(pending[~accepted])
+
+    return labels
+
+
+def capacitated_kmedoids(distance_matrix, volumes, k, min_capacity, max_capacity, rng, max_iterations=10):
+    """
+    Capacitated k-medoids: seeding k-means++ lalu assignment greedy-regret dan
+    pembaruan medoid bergantian sampai medoid tidak berubah, lalu penyeimbangan ke
+    min_capacity.
+
+    Args:
+        distance_matrix (numpy.ndarray): Matriks jarak jalan
+        volumes (list): Volume setiap TPS
+        k (int): Jumlah cluster awal
+        min_capacity (float): Kapasitas minimum cluster (diseimbangkan di akhir)
+        max_capacity (float): Kapasitas maksimum cluster
+        rng (numpy.random.Generator): Sumber acak seeding
+        max_iterations (int): Batas putaran assignment/pembaruan medoid
+
+    Returns:
+        numpy.ndarray: Vektor label ter-compact; setiap cluster <= max_capacity kecuali
+        TPS yang volumenya sendiri sudah melebihi
+    """
+    volumes = np.asarray(volumes, dtype=float)
+    medoids = init_medoids(distance_matrix, k, rng)
+    labels = None
+
+    for _ in range(max_iterations):
+        labels = regret_assignment(_round_trip(distance_matrix, medoids), volumes, max_capacity)
+        labels = repair_labels(labels, volumes, max_capacity, distance_matrix)
+
+        new_medoids = cluster_medoids(labels, distance_matrix)
+        if len(new_medoids) == len(medoids) and np.array_equal(np.sort(new_medoids), np.sort(medoids)):
+            break
+        medoids = new_medoids[new_medoids >= 0]
+
+    return balance_min_capacity(labels, volumes, min_capacity, max_capacity, distance_matrix)
@@ -0,0 +1,162 @@
+"""
+Checkpoint - Simpan dan lanjutkan run GA-VNS dan multi-start yang panjang
+State solver (populasi, solusi terbaik, laju adaptif, state generator acak) dan hasil
+per run multi-start ditulis berkala ke disk secara atomik (file sementara + os.replace),
+sehingga run yang terputus dapat dilanjutkan tanpa mengulang run yang sudah selesai.
+"""
+
+import hashlib
+import os
+import pickle
+
+import numpy as np
+
+
+CHECKPOINT_VERSION = 1
+MANIFEST_NAME = "multi_start.pkl"
+
+
+def save_checkpoint(path, state):
+    """
+    Tulis state ke path secara atomik (file lama tetap utuh bila proses mati saat menulis).
+
+    Args:
+        path (str): Lokasi file checkpoint
+        state (dict): State yang dapat di-pickle
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(dict(state, version=CHECKPOINT_VERSION), f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Baca checkpoint dari path.
+
+    Returns:
+        dict: State tersimpan, atau None jika file tidak ada, rusak atau versinya berbeda
+    """
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+        return None
+    return state
+
+
+def remove_checkpoint(path):
+    """Hapus file checkpoint jika ada"""
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def data_fingerprint(*arrays):
+    """
+    Hash SHA-256 dari isi array (mis. matriks jarak dan volume) untuk fingerprint
+    checkpoint, sehingga data yang berubah tidak memakai hasil run lama.
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=float)
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+class MultiStartCheckpoint:
+    """
+    Checkpoint multi-start dalam satu folder: manifest berisi seed dasar, hasil setiap
+    run yang sudah selesai (urut selesai) dan ringkasan agregat; run yang sedang berjalan
+    menulis checkpoint solvernya sendiri (run_path). Manifest hanya dipakai ulang bila
+    konfigurasinya (fingerprint) sama; jika berbeda, multi-start dimulai dari awal.
+    Setelah multi-start selesai, clear() menghapus semuanya agar run berikutnya dengan
+    konfigurasi yang sama menghitung ulang, bukan memutar ulang hasil lama.
+    """
+
+    def __init__(self, directory, fingerprint):
+        """
+        Args:
+            directory (str): Folder checkpoint
+            fingerprint (dict): Konfigurasi yang harus sama agar checkpoint dapat dilanjutkan
+                (mis. jumlah run, Garasi/TPA, kapasitas, parameter GA, data_fingerprint data)
+        """
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.seed_entropy = None
+        self.results = []
+
+        state = load_checkpoint(self.manifest_path)
+        if state is not None and state.get("fingerprint") == fingerprint:
+            self.seed_entropy = state["seed_entropy"]
+            self.results = state["results"]
+        else:
+            # Checkpoint konfigurasi lain tidak boleh tercampur dengan run baru
+            self.clear()
+
+    @property
+    def resumed(self):
+        """True jika checkpoint sebelumnya dilanjutkan"""
+        return self.seed_entropy is not None
+
+    def completed_seeds(self):
+        """Nomor run yang hasilnya sudah tersimpan"""
+        return {result['seed'] for result in self.results}
+
+    def run_path(self, seed):
+        """Lokasi checkpoint solver untuk run ke-seed"""
+        return os.path.join(self.directory, f"run_{seed:03d}.pkl")
+
+    def start(self, seed_entropy):
+        """Simpan seed dasar multi-start (wajib sebelum run pertama dimulai)"""
+        self.seed_entropy = seed_entropy
+        self._write()
+
+    def record_result(self, result):
+        """
+        Simpan hasil run yang selesai dan hapus checkpoint solvernya. Run yang dihentikan
+        lebih awal (adaptive stop, batas waktu) juga final dan tidak dilanjutkan saat resume.
+        """
+        self.results.append(result)
+        self._write()
+        remove_checkpoint(self.run_path(result['seed']))
+
+    def aggregate(self):
+        """Ringkasan agregat dari hasil yang tersimpan (run terbaik: feasible, jarak terkecil)"""
+        if not self.results:
+            return {'num_completed': 0, 'best_seed': None, 'best_distance': float('inf')}
+        distances = np.array([result['distance'] for result in self.results], dtype=float)
+        feasible = np.array([result['feasible'] for result in self.results], dtype=bool)
+        ranked = np.where(feasible, distances, np.inf) if feasible.any() else distances
+        best = self.results[int(np.argmin(ranked))]
+        return {'num_completed': len(self.results), 'best_seed': best['seed'], 'best_distance': best['distance']}
+
+    def clear(self):
+        """Hapus manifest dan checkpoint run di folder ini (multi-start selesai atau tidak cocok)"""
+        self.seed_entropy = None
+        self.results = []
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name == MANIFEST_NAME or (name.startswith("run_") and name.endswith(".pkl")):
+                os.remove(os.path.join(self.directory, name))
+
+    def _write(self):
+        save_checkpoint(self.manifest_path, {
+            'fingerprint': self.fingerprint,
+            'seed_entropy': self.seed_entropy,
+            'results': self.results,
+            'aggregate': self.aggregate()
+        })
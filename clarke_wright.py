@@ -0,0 +1,114 @@
+"""
+Clarke-Wright - Konstruksi savings untuk rute Garasi -> TPS -> TPA
+Setiap TPS mula-mula dilayani rute sendiri (Garasi -> TPS -> TPA). Menyambung ekor rute
+berakhiran i ke kepala rute berawalan j menghemat
+    s(i, j) = d(i, TPA) + d(Garasi, j) - lambda * d(i, j)
+Savings diurutkan dengan NumPy (opsional hanya untuk pasangan k tetangga terdekat), lalu
+rute digabung dengan union-find selama volume gabungan <= max_capacity. Cluster di bawah
+min_capacity diseimbangkan setelahnya dengan balance_min_capacity.
+"""
+
+import numpy as np
+
+from solution_encoding import UNASSIGNED, balance_min_capacity
+
+
+# Sampai jumlah TPS ini savings dihitung untuk semua pasangan; di atasnya hanya pasangan
+# dengan SAVINGS_NEIGHBORS tetangga terdekat (hasil hampir sama, jauh lebih cepat)
+SAVINGS_ALL_PAIRS_MAX = 500
+SAVINGS_NEIGHBORS = 40
+
+
+class _RouteSets:
+    """Union-find atas TPS dengan kepala, ekor dan volume per rute (akar)"""
+
+    def __init__(self, nodes, volumes):
+        self.parent = {node: node for node in nodes}
+        self.head = {node: node for node in nodes}
+        self.tail = {node: node for node in nodes}
+        self.volume = {node: float(volumes[node]) for node in nodes}
+
+    def find(self, node):
+        root = node
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Path compression
+        while self.parent[node] != root:
+            self.parent[node], node = root, self.parent[node]
+        return root
+
+    def join(self, i, j):
+        """Sambung rute berekor i dengan rute berkepala j (akar rute i dipertahankan)"""
+        ri, rj = self.find(i), self.find(j)
+        self.parent[rj] = ri
+        self.tail[ri] = self.tail[rj]
+        self.volume[ri] += self.volume[rj]
+
+
+def savings_pairs(distance_matrix, nodes, start_idx, end_idx, candidates=None, shape=1.0):
+    """
+    Pasangan (i, j) dengan savings positif, urut dari savings terbesar.
+
+    Args:
+        distance_matrix (numpy.ndarray): Matriks jarak
+        nodes (list): TPS yang dirutekan
+        start_idx (int): Garasi
+        end_idx (int): TPA
+        candidates (numpy.ndarray): Opsional, k tetangga terdekat per titik (lihat knn_index);
+            None = semua pasangan (O(n^2) memori)
+        shape (float): Bobot lambda pada d(i, j) (1.0 = Clarke-Wright klasik)
+
+    Returns:
+        tuple: (array i, array j)
+    """
+    D = distance_matrix
+    nodes = np.asarray(nodes, dtype=np.int64)
+    if candidates is None:
+        i = np.repeat(nodes, len(nodes))
+        j = np.tile(nodes, len(nodes))
+    else:
+        in_nodes = np.zeros(len(D), dtype=bool)
+        in_nodes[nodes] = True
+        neighbors = np.asarray(candidates)[nodes]
+        i = np.repeat(nodes, neighbors.shape[1])
+        j = neighbors.ravel()
+        keep = in_nodes[j]
+        # Kedua arah: i -> j dan j -> i
+        i, j = np.concatenate((i[keep], j[keep])), np.concatenate((j[keep], i[keep]))
+
+    keep = i != j
+    i, j = i[keep], j[keep]
+    savings = (np.asarray(D[i, end_idx], dtype=float) + np.asarray(D[start_idx, j], dtype=float) -
+               shape * np.asarray(D[i, j], dtype=float))
+    positive = savings > 0
+    i, j, savings = i[positive], j[positive], savings[positive]
+    order = np.argsort(-savings, kind='stable')
+    return i[order], j[order]
+
+
+def clarke_wright_labels(distance_matrix, volumes, nodes, start_idx, end_idx, min_capacity, max_capacity,
+                         candidates=None, shape=1.0):
+    """
+    Clarke-Wright savings berkapasitas, diikuti penyeimbangan ke min_capacity.
+    Argumen sama dengan savings_pairs, ditambah volume dan batas kapasitas.
+
+    Returns:
+        numpy.ndarray: Vektor label untuk semua titik (-1 untuk titik di luar nodes)
+    """
+    volumes = np.asarray(volumes, dtype=float)
+    n = len(distance_matrix)
+    nodes = [int(node) for node in nodes]
+    routes = _RouteSets(nodes, volumes)
+
+    for i, j in zip(*savings_pairs(distance_matrix, nodes, start_idx, end_idx, candidates, shape)):
+        i, j = int(i), int(j)
+        ri, rj = routes.find(i), routes.find(j)
+        if ri == rj or routes.tail[ri] != i or routes.head[rj] != j:
+            continue
+        if routes.volume[ri] + routes.volume[rj] > max_capacity:
+            continue
+        routes.join(i, j)
+
+    labels = np.full(n, UNASSIGNED, dtype=np.int32)
+    labels[nodes] = [routes.find(node) for node in nodes]
+    return balance_min_capacity(labels, volumes, min_capacity, max_capacity, distance_matrix)
@@ -0,0 +1,1362 @@
+"""
+GA-VNS Solver - Mesin clustering TPS tanpa antarmuka (headless)
+Berisi algoritma hybrid Genetic Algorithm + Variable Neighborhood Search dengan
+optimasi rute akhir ACO. Hanya bergantung pada NumPy, sehingga dapat dijalankan
+di worker process maupun batch server tanpa display.
+"""
+
+import math
+import time
+import numpy as np
+
+from capacitated_kmedoids import capacitated_kmedoids
+from checkpoint import load_checkpoint, remove_checkpoint, save_checkpoint
+from clarke_wright import SAVINGS_ALL_PAIRS_MAX, SAVINGS_NEIGHBORS, clarke_wright_labels
+from giant_tour import build_giant_tour, clusters_to_tour, order_crossover, split_tour
+from route_optimization import EXACT_ROUTE_MAX_SIZE, RouteCostCache
+from solution_encoding import (UNASSIGNED, check_labels, clusters_to_labels, labels_to_clusters,
+                               population_diversity, population_to_label_matrix, repair_labels)
+from solution_state import ClusterSolution, FitnessCache, SolutionEvaluator
+from vns_search import DEFAULT_KNN_SIZE, NeighborhoodSearch, knn_index
+
+
+# Bagian batas waktu yang disisihkan untuk optimasi rute akhir (ACO) setelah GA berhenti
+FINAL_ROUTE_TIME_SHARE = 0.1
+
+
+def default_solver_params():
+    """
+    Parameter bawaan solver GA-VNS.
+
+    Returns:
+        dict: Parameter solver
+    """
+    params = {
+        "population_size": 75,       # Ukuran populasi GA
+        "max_iterations": 200,       # Jumlah generasi maksimum
+        "mutation_rate": 0.2,        # Peluang mutasi awal
+        "crossover_rate": 0.8,       # Peluang crossover awal
+        "split_crossover_rate": 0.3, # Bagian crossover yang memakai giant tour (order crossover + split Prins)
+        "distance_penalty": 1.0,     # Bobot jarak rute pada fitness
+        "optimize_routes": True,     # Optimasi rute akhir dengan ACO
+        "aco_ants": 10,              # Jumlah semut ACO
+        "aco_iterations": 50,        # Jumlah iterasi ACO
+        "aco_variant": "as",         # "as" = Ant System klasik, "mmas" = MAX-MIN Ant System
+        "aco_candidate_size": 8,     # Ukuran candidate list (k tetangga terdekat) untuk MMAS
+        "aco_local_search": True,    # Perbaiki semut terbaik tiap iterasi ACO dengan 2-opt/Or-opt/swap
+        "fitness_local_search": False,  # Estimasi rute fitness: nearest neighbor + local search (lebih akurat, lebih lambat)
+        "vns_strategy": "first",     # VND: "first" = first-improvement, "best" = best-improvement
+        "knn_size": DEFAULT_KNN_SIZE,  # k tetangga terdekat per TPS untuk move granular (mutasi & VNS)
+        "vns_candidate_clusters": 3, # Maksimum cluster tujuan relocate per TPS (cluster tetangga terdekat)
+        "vns_elite_size": 2,         # Jumlah solusi elit yang diperbaiki VNS penuh tiap generasi
+        "vns_max_evaluations": 300,  # Budget evaluasi move per solusi elit
+        "vns_k_max": 3,              # Shaking maksimum (jumlah relocate acak)
+        "vns_child_evaluations": 10, # Budget VND untuk anak hasil GA
+        "route_workers": None,       # Process untuk ACO akhir per cluster, None = jumlah CPU, 1 = berurutan
+        "exact_route_max_size": EXACT_ROUTE_MAX_SIZE,  # Cluster sampai ukuran ini dirutekan eksak (Held-Karp), 0 = selalu ACO
+        "fitness_cache_size": 20000, # Jumlah partisi yang fitness-nya disimpan (LRU), 0 = nonaktif
+        "route_cache_size": 50000,   # Jumlah biaya rute per cluster yang disimpan (LRU), 0 = nonaktif
+        "debug_mode": True,          # Catat log & debug info tiap 10 iterasi
+        "seed": None,                # Seed generator acak run ini (int atau SeedSequence), None = acak
+        "time_limit_seconds": None,  # Batas waktu run (detik), None = hanya dibatasi max_iterations
+        "migration_interval": 10,    # Island model: migrasi setiap N generasi
+        "migration_size": 2,         # Island model: jumlah individu terbaik yang dikirim (top-k)
+        "checkpoint_path": None,     # File checkpoint run ini; jika sudah ada, run dilanjutkan darinya
+        "checkpoint_interval": 10,   # Simpan checkpoint setiap N generasi
+        "start_idx": None,           # Indeks titik awal rute (Garasi), None = tanpa titik tetap
+        "end_idx": None,             # Indeks titik akhir rute (TPA), None = tanpa titik tetap
+        "exclude_indices": None      # Indeks yang dibuang dari cluster akhir (mis. Garasi/TPA)
+    }
+    return params
+
+
+def find_point_index(names, query):
+    """
+    Cari indeks titik berdasarkan nama: cocok persis dulu, lalu cocok parsial
+    (tanpa membedakan huruf besar/kecil).
+
+    Returns:
+        int atau None jika tidak ditemukan
+    """
+    if query is None:
+        return None
+
+    if query in names:
+        for i, name in enumerate(names):
+            if name == query:
+                return i
+    else:
+        for i, name in enumerate(names):
+            if isinstance(name, str) and query.lower() in name.lower():
+                return i
+
+    return None
+
+
+class GAVNSSolver:
+    """
+    Hybrid GA-VNS untuk clustering TPS dengan optimasi rute.
+    Genetic Algorithm (GA) is used as the primary search method with Variable Neighborhood
+    Search (VNS) applied to refine promising solutions.
+    """
+
+    def __init__(self, distance_matrix, volumes, min_capacity, max_capacity, params=None, progress_callback=None,
+                 route_cache=None, rng=None, stop_event=None, migration=None):
+        """
+        Args:
+            distance_matrix (numpy.ndarray): Matriks jarak n x n
+            volumes (list): Volume sampah setiap TPS
+            min_capacity (float): Kapasitas minimum cluster (m³)
+            max_capacity (float): Kapasitas maksimum cluster (m³)
+            params (dict): Parameter solver, lihat default_solver_params()
+            progress_callback (callable): Opsional, dipanggil sebagai
+                progress_callback(percentage, message=None, log=None)
+            route_cache (RouteCostCache): Opsional, cache biaya rute yang dipakai bersama
+                (mis. antar run multi-start); harus berasal dari matriks jarak yang sama
+            rng (numpy.random.Generator): Opsional, sumber acak run ini; default dibuat
+                dari params["seed"]. Semua keputusan acak (inisialisasi, GA, VNS, ACO)
+                memakai generator ini, tidak ada state acak global.
+            stop_event: Opsional, objek dengan is_set() (threading/multiprocessing Event);
+                diperiksa setiap generasi untuk menghentikan run lebih awal secara kooperatif
+            migration: Opsional, kanal island model dengan exchange(emigrants) -> immigrants
+                (list vektor label, lihat multi_start.RingMigration); dipanggil setiap
+                params["migration_interval"] generasi
+        """
+        self.params = default_solver_params()
+        if params:
+            self.params.update(params)
+
+        if rng is None:
+            rng = np.random.default_rng(self.params["seed"])
+        self.rng = rng
+        self.stop_event = stop_event
+        self.migration = migration
+        self.stopped = False
+        self.deadline = None
+        self.time_limit_hit = False
+
+        self.distance_matrix = distance_matrix
+        self.volumes = np.asarray(volumes, dtype=float)
+        self.min_capacity = min_capacity
+        self.max_capacity = max_capacity
+        self.progress_callback = progress_callback
+
+        self.n_points = len(volumes)
+
+        # Explicit check for size match
+        if distance_matrix.shape[0] != self.n_points or distance_matrix.shape[1] != self.n_points:
+            raise ValueError(f"Ukuran matriks jarak ({distance_matrix.shape[0]}x{distance_matrix.shape[1]}) tidak sesuai dengan jumlah TPS ({self.n_points})")
+
+        # Calculate required number of clusters based on total volume and capacity
+        self.total_volume = float(self.volumes.sum())
+        min_clusters_needed = math.ceil(self.total_volume / max_capacity)
+        self.expected_clusters = max(min_clusters_needed, 1)
+
+        self.fitness_cache = FitnessCache(self.params["fitness_cache_size"])
+        self._giant_tour = None
+        self._giant_tour_rank = None
+        self._savings_candidates = None
+        if route_cache is None:
+            route_cache = RouteCostCache(self.params["route_cache_size"])
+        self.route_cache = route_cache
+        self.evaluator = SolutionEvaluator(
+            volumes, min_capacity, max_capacity,
+            self._cluster_route_distances, self.params["distance_penalty"],
+            fitness_cache=self.fitness_cache
+        )
+        # Neighborhood granular: move hanya antara TPS dan cluster tetangga terdekatnya
+        self.knn = knn_index(distance_matrix, self.params["knn_size"])
+        self.neighborhood_search = NeighborhoodSearch(
+            self.evaluator, self.knn, self.rng,
+            candidate_clusters=self.params["vns_candidate_clusters"],
+            strategy=self.params["vns_strategy"]
+        )
+
+        self.population_size = self.params["population_size"]
+        self.max_iterations = self.params["max_iterations"]
+        self.debug_info = []
+
+        # Search state
+        self.population = []
+        self.best_solution = None
+        self.best_fitness = float('inf')
+        self.best_distance = float('inf')
+        self.stagnation_count = 0
+        self.last_improvement = 0
+        self.iteration = 0
+        self.adaptive_mutation_rate = self.params["mutation_rate"]
+        self.adaptive_crossover_rate = self.params["crossover_rate"]
+        self.diversity_history = []
+
+    def _randint(self, low, high):
+        """Bilangan bulat acak low..high (inklusif, seperti random.randint)"""
+        return int(self.rng.integers(low, high + 1))
+
+    def _sample(self, population, k):
+        """k elemen berbeda dari population (seperti random.sample)"""
+        picks = self.rng.choice(len(population), size=k, replace=False)
+        return [population[i] for i in picks]
+
+    def _choice(self, seq):
+        """Satu elemen acak dari seq"""
+        return seq[int(self.rng.integers(len(seq)))]
+
+    def _deadline_passed(self):
+        """True (dan tandai time_limit_hit) bila batas waktu run sudah terlewati"""
+        if self.deadline is not None and time.time() >= self.deadline:
+            self.time_limit_hit = True
+            return True
+        return False
+
+    def _record_population_best(self):
+        """Catat solusi terbaik populasi saat ini (dipakai saat run dihentikan di tengah jalan)"""
+        if not self.population:
+            return
+        current_best = min(self.population, key=lambda sol: sol.fitness)
+        current_fitness, current_distance = current_best.evaluate()[:2]
+        if self.best_solution is None or current_fitness < self.best_fitness:
+            self.best_solution = current_best.to_lists()
+            self.best_fitness = current_fitness
+            self.best_distance = current_distance
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def _checkpoint_problem(self):
+        """Identitas masalah; checkpoint dari masalah lain tidak dipakai"""
+        return (self.n_points, float(self.min_capacity), float(self.max_capacity), self.population_size,
+                self.max_iterations)
+
+    def checkpoint_state(self, iteration, ga_finished=False):
+        """
+        State lengkap pencarian setelah generasi ke-iteration selesai.
+
+        Returns:
+            dict: State yang dapat di-pickle (lihat checkpoint.save_checkpoint)
+        """
+        return {
+            'problem': self._checkpoint_problem(),
+            'iteration': iteration,
+            'ga_finished': ga_finished,
+            'population': [sol.to_lists() for sol in self.population],
+            'best_solution': self.best_solution,
+            'best_fitness': self.best_fitness,
+            'best_distance': self.best_distance,
+            'stagnation_count': self.stagnation_count,
+            'last_improvement': self.last_improvement,
+            'adaptive_mutation_rate': self.adaptive_mutation_rate,
+            'adaptive_crossover_rate': self.adaptive_crossover_rate,
+            'diversity_history': self.diversity_history,
+            'debug_info': self.debug_info,
+            'rng_state': self.rng.bit_generator.state,
+            'stopped': self.stopped,
+            'time_limit_hit': self.time_limit_hit
+        }
+
+    def restore_checkpoint(self, state):
+        """
+        Pulihkan state dari checkpoint_state(); pencarian berlanjut persis seperti run
+        yang tidak terputus (generator acak ikut dipulihkan).
+
+        Returns:
+            bool: False jika checkpoint milik masalah lain (state tidak diubah)
+        """
+        if state.get('problem') != self._checkpoint_problem():
+            return False
+
+        self.population = [self.make_solution(clusters) for clusters in state['population']]
+        self.best_solution = state['best_solution']
+        self.best_fitness = state['best_fitness']
+        self.best_distance = state['best_distance']
+        self.stagnation_count = state['stagnation_count']
+        self.last_improvement = state['last_improvement']
+        self.adaptive_mutation_rate = state['adaptive_mutation_rate']
+        self.adaptive_crossover_rate = state['adaptive_crossover_rate']
+        self.diversity_history = state['diversity_history']
+        self.debug_info = state['debug_info']
+        self.rng.bit_generator.state = state['rng_state']
+        self.stopped = state['stopped']
+        self.time_limit_hit = state['time_limit_hit']
+        self.iteration = state['iteration']
+        return True
+
+    def _save_checkpoint(self, iteration, ga_finished=False):
+        path = self.params["checkpoint_path"]
+        if path:
+            save_checkpoint(path, self.checkpoint_state(iteration, ga_finished))
+
+    def _report(self, percentage=None, message=None, log=None):
+        """Teruskan progress/log ke callback jika disediakan"""
+        if self.progress_callback:
+            self.progress_callback(percentage, message, log)
+
+    # ------------------------------------------------------------------
+    # Evaluasi solusi
+    # ------------------------------------------------------------------
+
+    def is_valid_cluster(self, cluster, check_min_capacity=True):
+        """Check whether a cluster satisfies the capacity constraints"""
+        if not cluster:
+            return False
+
+        cluster_volume = sum(self.volumes[idx] for idx in cluster)
+
+        if cluster_volume > self.max_capacity:
+            return False
+
+        if check_min_capacity and cluster_volume < self.min_capacity:
+            return False
+
+        return True
+
+    def _cluster_route_distances(self, clusters):
+        """Estimated route length of each cluster (cached by cluster membership)"""
+        if self.params["optimize_routes"]:
+            # Greedy nearest neighbor Garasi -> TPS -> TPA as a quick approximation
+            # (full ACO would be too slow for every fitness evaluation)
+            if self.params["fitness_local_search"]:
+                return self.route_cache.improved_lengths(
+                    clusters, self.distance_matrix, self.params["start_idx"], self.params["end_idx"]
+                )
+            return self.route_cache.nearest_neighbor_lengths(
+                clusters, self.distance_matrix, self.params["start_idx"], self.params["end_idx"]
+            )
+
+        # If not optimizing routes, just sum all intra-cluster distances
+        return [self.route_cache.pairwise_stats(cluster, self.distance_matrix)[0] for cluster in clusters]
+
+    def make_solution(self, clusters):
+        """Wrap a list[list[int]] solution into an incrementally evaluated ClusterSolution"""
+        return ClusterSolution(clusters, self.evaluator)
+
+    def calculate_fitness(self, solution):
+        """
+        Calculate fitness of a solution (lower is better).
+        Accepts a ClusterSolution (cached, only changed clusters are re-evaluated)
+        or a plain list of clusters.
+
+        Returns:
+            tuple: (fitness, route_distance, capacity_violations, 0, missing_penalty, duplicate_penalty)
+        """
+        if not isinstance(solution, ClusterSolution):
+            solution = self.make_solution(solution)
+        return solution.evaluate()
+
+    def calculate_diversity(self, pop):
+        """
+        Keragaman populasi: rata-rata jarak partisi 1 - ARI atas semua pasangan solusi,
+        dihitung dari vektor label (lihat solution_encoding.partition_distances)
+        """
+        # Handle small populations
+        if len(pop) <= 1:
+            return 0
+
+        return population_diversity(population_to_label_matrix(pop, self.n_points))
+
+    # ------------------------------------------------------------------
+    # Solusi awal
+    # ------------------------------------------------------------------
+
+    def create_greedy_solution(self):
+        """Create an initial solution with greedy bin packing"""
+        volumes = self.volumes
+        max_capacity = self.max_capacity
+
+        # Sort TPS by volume (descending)
+        tps_indices = sorted(range(self.n_points), key=lambda i: volumes[i], reverse=True)
+
+        solution = []
+        remaining_tps = set(tps_indices)
+
+        while remaining_tps:
+            current_cluster = []
+            current_volume = 0
+
+            # Start with largest remaining TPS
+            sorted_remaining = sorted(remaining_tps, key=lambda i: volumes[i], reverse=True)
+            first_tps = sorted_remaining[0]
+            current_cluster.append(first_tps)
+            current_volume += volumes[first_tps]
+            remaining_tps.remove(first_tps)
+
+            # Process remaining TPS by distance
+            while remaining_tps and current_volume < max_capacity:
+                # Find closest remaining TPS to cluster
+                closest_tps = None
+                min_dist = float('inf')
+
+                for tps_idx in remaining_tps:
+                    # Check if adding this TPS exceeds capacity
+                    if current_volume + volumes[tps_idx] > max_capacity:
+                        continue
+
+                    # Find minimum distance to any TPS in current cluster
+                    for existing_idx in current_cluster:
+                        dist = self.distance_matrix[existing_idx, tps_idx]
+                        if dist < min_dist:
+                            min_dist = dist
+                            closest_tps = tps_idx
+
+                if closest_tps is not None:
+                    current_cluster.append(closest_tps)
+                    current_volume += volumes[closest_tps]
+                    remaining_tps.remove(closest_tps)
+
+                    # Break if we reached minimum capacity and still have TPS left
+                    if current_volume >= self.min_capacity and len(remaining_tps) > 0:
+                        break
+                else:
+                    # If we can't find any TPS to add, break
+                    break
+
+            if current_cluster:
+                solution.append(current_cluster)
+
+            # If we've formed enough clusters but still have TPS, try to add them
+            if len(solution) >= self.expected_clusters and remaining_tps:
+                for tps_idx in list(remaining_tps):
+                    added = False
+
+                    for cluster in solution:
+                        cluster_volume = sum(volumes[idx] for idx in cluster)
+
+                        if cluster_volume + volumes[tps_idx] <= max_capacity:
+                            cluster.append(tps_idx)
+                            remaining_tps.remove(tps_idx)
+                            added = True
+                            break
+
+                    if not added:
+                        # If can't add to any existing cluster, create a new one
+                        break
+
+            # Emergency break to prevent infinite loop
+            if not remaining_tps or (len(solution) > 0 and len(current_cluster) == 0):
+                break
+
+        # If we still have remaining TPS, create singleton clusters
+        for tps_idx in remaining_tps:
+            solution.append([tps_idx])
+
+        return solution
+
+    def create_random_solution(self):
+        """Create a random capacity-aware solution"""
+        volumes = self.volumes
+
+        tps_indices = list(range(self.n_points))
+        self.rng.shuffle(tps_indices)
+
+        solution = []
+        current_cluster = []
+        current_volume = 0
+
+        for tps_idx in tps_indices:
+            # Check if adding to current cluster would exceed capacity
+            if current_volume + volumes[tps_idx] <= self.max_capacity:
+                current_cluster.append(tps_idx)
+                current_volume += volumes[tps_idx]
+            else:
+                # If we can't add to current cluster, check if current cluster is valid
+                if current_cluster and current_volume >= self.min_capacity:
+                    solution.append(current_cluster)
+
+                # Start new cluster with this TPS
+                current_cluster = [tps_idx]
+                current_volume = volumes[tps_idx]
+
+        if current_cluster:
+            solution.append(current_cluster)
+
+        return solution
+
+    def _pack_by_volume(self, tps_list, clusters):
+        """Pack TPS (sorted by volume, descending) into new clusters under max capacity"""
+        volumes = self.volumes
+        remaining = sorted(tps_list, key=lambda idx: volumes[idx], reverse=True)
+
+        current_cluster = []
+        current_volume = 0
+
+        for tps_idx in remaining:
+            if current_volume + volumes[tps_idx] <= self.max_capacity:
+                current_cluster.append(tps_idx)
+                current_volume += volumes[tps_idx]
+            else:
+                # If can't add due to capacity, create a new cluster
+                if current_cluster:
+                    clusters.append(current_cluster)
+
+                current_cluster = [tps_idx]
+                current_volume = volumes[tps_idx]
+
+        # Add the last cluster if not empty
+        if current_cluster:
+            clusters.append(current_cluster)
+
+    def _assign_first_fit(self, tps_list, clusters):
+        """Add TPS to the first cluster with enough room; return the TPS that did not fit"""
+        volumes = self.volumes
+        unassigned = list(tps_list)
+
+        for tps_idx in list(unassigned):
+            for cluster in clusters:
+                cluster_volume = sum(volumes[idx] for idx in cluster)
+
+                if cluster_volume + volumes[tps_idx] <= self.max_capacity:
+                    cluster.append(tps_idx)
+                    unassigned.remove(tps_idx)
+                    break
+
+        return unassigned
+
+    def create_kmeans_solution(self, k=None):
+        """Create a k-means style solution around random centroid TPS"""
+        volumes = self.volumes
+        if k is None:
+            k = self.expected_clusters
+
+        # Choose k random centroids
+        centroids_indices = self._sample(list(range(self.n_points)), k)
+
+        # Assign each TPS to nearest centroid
+        clusters = [[] for _ in range(k)]
+
+        for i in range(self.n_points):
+            min_dist = float('inf')
+            closest_centroid = 0
+
+            for c, centroid_idx in enumerate(centroids_indices):
+                dist = self.distance_matrix[i, centroid_idx]
+                if dist < min_dist:
+                    min_dist = dist
+                    closest_centroid = c
+
+            clusters[closest_centroid].append(i)
+
+        # Fix clusters that violate capacity constraints
+        valid_clusters = []
+        unassigned_tps = []
+
+        for cluster in clusters:
+            cluster_volume = sum(volumes[idx] for idx in cluster)
+
+            if cluster_volume <= self.max_capacity:
+                valid_clusters.append(cluster)
+            else:
+                # Split cluster if it exceeds capacity
+                cluster.sort(key=lambda idx: volumes[idx], reverse=True)
+
+                current_cluster = []
+                current_volume = 0
+
+                for tps_idx in cluster:
+                    if current_volume + volumes[tps_idx] <= self.max_capacity:
+                        current_cluster.append(tps_idx)
+                        current_volume += volumes[tps_idx]
+                    else:
+                        unassigned_tps.append(tps_idx)
+
+                if current_cluster:
+                    valid_clusters.append(current_cluster)
+
+        # Handle unassigned TPS
+        if unassigned_tps:
+            unassigned_tps = self._assign_first_fit(unassigned_tps, valid_clusters)
+
+            # Create new clusters for remaining unassigned TPS
+            if unassigned_tps:
+                self._pack_by_volume(unassigned_tps, valid_clusters)
+
+        return valid_clusters
+
+    def create_kmedoids_solution(self, k=None):
+        """Create a capacitated k-medoids solution on the road distance matrix (greedy-regret assignment)"""
+        if k is None:
+            k = self.expected_clusters
+        labels = capacitated_kmedoids(self.distance_matrix, self.volumes, k, self.min_capacity, self.max_capacity,
+                                      self.rng)
+        return labels_to_clusters(labels)
+
+    def _tour_endpoints(self):
+        """Garasi/TPA untuk giant tour (hanya jika keduanya ditetapkan, sama seperti estimasi rute)"""
+        start_idx = self.params["start_idx"]
+        end_idx = self.params["end_idx"]
+        if start_idx is None or end_idx is None:
+            return None, None
+        return start_idx, end_idx
+
+    def _tour_nodes(self):
+        """TPS yang masuk giant tour (semua titik kecuali Garasi/TPA)"""
+        start_idx, end_idx = self._tour_endpoints()
+        return [i for i in range(self.n_points) if i != start_idx and i != end_idx]
+
+    def giant_tour(self):
+        """Giant tour deterministik (nearest neighbor dari Garasi + 2-opt), dihitung sekali"""
+        if self._giant_tour is None:
+            start_idx, end_idx = self._tour_endpoints()
+            self._giant_tour = build_giant_tour(self._tour_nodes(), self.distance_matrix, start_idx, end_idx)
+            self._giant_tour_rank = np.full(self.n_points, self.n_points, dtype=np.int64)
+            self._giant_tour_rank[self._giant_tour] = np.arange(len(self._giant_tour))
+        return self._giant_tour
+
+    def split_giant_tour(self, tour):
+        """
+        Potong tur menjadi cluster dengan split Prins (max_capacity keras, min_capacity
+        sebagai penalti). Garasi/TPA (volume 0) dimasukkan ke cluster pertama agar
+        solusi tetap mencakup semua titik.
+
+        Returns:
+            list: Solusi list[list[int]]
+        """
+        start_idx, end_idx = self._tour_endpoints()
+        clusters = split_tour(tour, self.distance_matrix, self.volumes, self.min_capacity, self.max_capacity,
+                              start_idx, end_idx, distance_penalty=self.params["distance_penalty"])
+        return self._attach_uncovered(clusters)
+
+    def _attach_uncovered(self, clusters):
+        """Masukkan titik yang belum ada di cluster mana pun (Garasi/TPA) ke cluster pertama"""
+        covered = np.zeros(self.n_points, dtype=bool)
+        for cluster in clusters:
+            covered[cluster] = True
+        outside = np.flatnonzero(~covered).tolist()
+        if outside:
+            if clusters:
+                clusters[0].extend(outside)
+            else:
+                clusters.append(outside)
+        return clusters
+
+    def create_giant_tour_solution(self, randomized=False):
+        """
+        Route-first cluster-second: giant tour atas semua TPS lalu split optimal.
+        Dengan randomized=True, nearest neighbor dimulai dari TPS acak (tetap diperbaiki 2-opt).
+        """
+        if not randomized:
+            return self.split_giant_tour(self.giant_tour())
+
+        nodes = self._tour_nodes()
+        if not nodes:
+            return self.split_giant_tour([])
+        start_idx, end_idx = self._tour_endpoints()
+        tour = build_giant_tour(nodes, self.distance_matrix, start_idx, end_idx, first=self._choice(nodes))
+        return self.split_giant_tour(tour)
+
+    def create_savings_solution(self, shape=1.0):
+        """
+        Clarke-Wright savings dari Garasi ke TPA (union-find di bawah max_capacity, lalu
+        diseimbangkan ke min_capacity). shape adalah bobot lambda pada d(i, j); tanpa
+        Garasi/TPA tetap, TPS paling sentral dipakai sebagai depot.
+        """
+        nodes = self._tour_nodes()
+        if not nodes:
+            return self._attach_uncovered([])
+
+        start_idx, end_idx = self._tour_endpoints()
+        if start_idx is None:
+            D = self.distance_matrix[np.ix_(nodes, nodes)]
+            start_idx = end_idx = nodes[int(np.argmin(D.sum(axis=0) + D.sum(axis=1)))]
+
+        candidates = None
+        if len(nodes) > SAVINGS_ALL_PAIRS_MAX:
+            if self._savings_candidates is None:
+                self._savings_candidates = knn_index(self.distance_matrix, SAVINGS_NEIGHBORS)
+            candidates = self._savings_candidates
+        labels = clarke_wright_labels(self.distance_matrix, self.volumes, nodes, start_idx, end_idx,
+                                      self.min_capacity, self.max_capacity, candidates=candidates, shape=shape)
+        return self._attach_uncovered(labels_to_clusters(labels))
+
+    def create_pso_solution(self):
+        """Create a PSO-inspired solution from a random particle position"""
+        volumes = self.volumes
+
+        # Encode problem as particle position (TPS to cluster assignments)
+        particle_pos = self.rng.random(self.n_points) * self.expected_clusters
+        cluster_assignments = np.floor(particle_pos).astype(int)
+
+        # Convert to solution format
+        max_cluster = max(cluster_assignments) if len(cluster_assignments) > 0 else 0
+        solution = [[] for _ in range(max_cluster + 1)]
+        for i, cluster_id in enumerate(cluster_assignments):
+            solution[cluster_id].append(i)
+
+        # Filter empty clusters
+        solution = [cluster for cluster in solution if cluster]
+
+        # Split clusters that exceed capacity
+        fixed_solution = []
+        for cluster in solution:
+            cluster_volume = sum(volumes[idx] for idx in cluster)
+            if cluster_volume <= self.max_capacity:
+                fixed_solution.append(cluster)
+            else:
+                self._pack_by_volume(cluster, fixed_solution)
+
+        return fixed_solution
+
+    def initialize_population(self):
+        """Build the initial GA population from greedy, giant tour, savings, k-means, k-medoids, random and PSO solutions"""
+        population_size = self.population_size
+        expected_clusters = self.expected_clusters
+
+        self._report(5, "Membuat populasi awal GA...")
+        population = []
+
+        # Add greedy solution (enhanced initialization for GA)
+        population.append(self.create_greedy_solution())
+        self._report(log="Membuat solusi awal dengan pendekatan greedy...\n")
+
+        # Add giant tour (route-first cluster-second) solutions
+        for randomized in (False, True):
+            try:
+                population.append(self.create_giant_tour_solution(randomized))
+            except Exception as e:
+                self._report(log=f"Warning: Gagal membuat solusi giant tour: {str(e)}\n")
+
+        self._report(log="Membuat solusi awal dengan pendekatan giant tour (split Prins)...\n")
+
+        # Add Clarke-Wright savings solutions (klasik, lalu dengan bobot lambda acak)
+        for shape in (1.0, self.rng.uniform(0.6, 1.4), self.rng.uniform(0.6, 1.4)):
+            try:
+                population.append(self.create_savings_solution(shape))
+            except Exception as e:
+                self._report(log=f"Warning: Gagal membuat solusi savings: {str(e)}\n")
+
+        self._report(log="Membuat solusi awal dengan pendekatan Clarke-Wright savings...\n")
+
+        # Add K-means solutions with different k values
+        for k in range(max(2, expected_clusters-2), expected_clusters+5):
+            try:
+                population.append(self.create_kmeans_solution(k))
+            except Exception as e:
+                self._report(log=f"Warning: Gagal membuat solusi k-means dengan k={k}: {str(e)}\n")
+
+        self._report(log="Membuat solusi awal dengan pendekatan k-means...\n")
+
+        # Add capacitated k-medoids solutions (k = kebutuhan minimum dan sedikit di atasnya)
+        for k in range(expected_clusters, expected_clusters+3):
+            try:
+                population.append(self.create_kmedoids_solution(k))
+            except Exception as e:
+                self._report(log=f"Warning: Gagal membuat solusi k-medoids dengan k={k}: {str(e)}\n")
+
+        self._report(log="Membuat solusi awal dengan pendekatan k-medoids berkapasitas...\n")
+
+        # Add random solutions
+        while len(population) < population_size * 0.5:  # Reduce number of random solutions for PSO
+            try:
+                population.append(self.create_random_solution())
+            except Exception as e:
+                self._report(log=f"Warning: Gagal membuat solusi acak: {str(e)}\n")
+
+        # Add PSO-inspired solutions
+        self._report(log="Membuat solusi awal dengan pendekatan PSO...\n")
+
+        for _ in range(min(10, population_size // 5)):
+            try:
+                population.append(self.create_pso_solution())
+            except Exception as e:
+                self._report(log=f"Warning: Gagal membuat solusi PSO: {str(e)}\n")
+
+        self._report(log="Membuat solusi awal lainnya...\n")
+
+        # Make sure we have enough solutions for GA
+        population = [self.make_solution(solution) for solution in population]
+
+        while len(population) < population_size:
+            # Clone and mutate existing solutions
+            idx = self._randint(0, len(population)-1)
+            new_solution = population[idx].copy()
+
+            if self.rng.random() < 0.5:
+                # Try to merge two clusters
+                if len(new_solution) >= 2:
+                    c1 = self._randint(0, len(new_solution)-1)
+                    c2 = self._randint(0, len(new_solution)-1)
+
+                    while c2 == c1 and len(new_solution) > 1:
+                        c2 = self._randint(0, len(new_solution)-1)
+
+                    # If merged cluster is valid, use it
+                    if c1 != c2 and new_solution.cluster_volumes[c1] + new_solution.cluster_volumes[c2] <= self.max_capacity:
+                        new_solution.merge(c1, c2)
+            else:
+                # Try to split a cluster
+                if len(new_solution) > 0:
+                    c = self._randint(0, len(new_solution)-1)
+                    if len(new_solution[c]) >= 2:
+                        new_solution.split(c, self._randint(1, len(new_solution[c])-1))
+
+            population.append(new_solution)
+
+            # Ensure we don't go into an infinite loop
+            if len(population) >= population_size * 2:
+                break
+
+        # Trim population to desired size
+        self.population = population[:population_size]
+
+        # Log initial population
+        self._report(log=f"Populasi awal GA terbentuk dengan {len(self.population)} solusi\n")
+        best_initial = min(self.population, key=lambda sol: sol.fitness)
+        initial_fitness, initial_distance, _, _, _, _ = best_initial.evaluate()
+        self._report(log=f"Solusi terbaik awal: {len(best_initial)} cluster, fitness={initial_fitness:.2f}, jarak={initial_distance:.2f}\n\n")
+
+        self._report(10, "Mulai iterasi algoritma hybrid GA-VNS...")
+
+    # ------------------------------------------------------------------
+    # Operator GA & VNS
+    # ------------------------------------------------------------------
+
+    def _tournament_select(self):
+        """Tournament selection"""
+        tournament_size = min(3, len(self.population))
+        return min(self._sample(self.population, tournament_size), key=lambda sol: sol.fitness)
+
+    def _crossover(self, parent1, parent2):
+        """Cluster-preserving crossover, repaired to cover every TPS"""
+        volumes = self.volumes
+
+        # Order clusters by their total volume
+        parent1_ordered = [parent1[c] for c in np.argsort(parent1.cluster_volumes, kind='stable')[::-1]]
+        parent2_ordered = [parent2[c] for c in np.argsort(parent2.cluster_volumes, kind='stable')[::-1]]
+
+        # Child is built directly as a label vector; TPS already taken are masked out
+        labels = np.full(self.n_points, UNASSIGNED, dtype=np.int32)
+        n_child_clusters = 0
+
+        # First, randomly select some clusters from parent1
+        for cluster in parent1_ordered:
+            if self.rng.random() < 0.5:  # 50% chance to include each cluster
+                cluster = np.asarray(cluster)
+                valid_cluster = cluster[labels[cluster] == UNASSIGNED]
+
+                if len(valid_cluster) > 0:
+                    labels[valid_cluster] = n_child_clusters
+                    n_child_clusters += 1
+
+        # Then add clusters from parent2 that don't overlap
+        for cluster in parent2_ordered:
+            cluster = np.asarray(cluster)
+            valid_cluster = cluster[labels[cluster] == UNASSIGNED]
+
+            # Check if cluster meets minimum capacity
+            if len(valid_cluster) > 0 and volumes[valid_cluster].sum() >= self.min_capacity / 2:  # Relaxed constraint
+                labels[valid_cluster] = n_child_clusters
+                n_child_clusters += 1
+
+        # Assign remaining TPS to existing clusters, or pack them into new ones
+        labels = repair_labels(labels, volumes, self.max_capacity, self.distance_matrix)
+
+        return ClusterSolution.from_labels(labels, self.evaluator)
+
+    def _parent_tour(self, parent):
+        """
+        Giant tour dari solusi induk: anggota setiap cluster diurutkan menurut posisinya
+        pada giant tour acuan, dan cluster diurutkan menurut anggota pertamanya.
+        """
+        rank = self._giant_tour_rank
+        ordered = []
+        for cluster in parent:
+            members = np.asarray(cluster, dtype=np.int64)
+            members = members[rank[members] < self.n_points]
+            if len(members) > 0:
+                ordered.append(members[np.argsort(rank[members], kind='stable')])
+        ordered.sort(key=lambda members: rank[members[0]])
+        return clusters_to_tour(ordered)
+
+    def _split_crossover(self, parent1, parent2):
+        """Giant tour crossover: order crossover pada tur kedua induk, didekode dengan split Prins"""
+        self.giant_tour()
+        child_tour = order_crossover(self._parent_tour(parent1), self._parent_tour(parent2), self.rng)
+        return self.make_solution(self.split_giant_tour(child_tour))
+
+    def _random_neighbor_pair(self, child, attempts=5):
+        """
+        TPS acak dan salah satu k tetangga terdekatnya yang berada di cluster lain.
+
+        Returns:
+            tuple: ((cluster TPS, posisi), (cluster tetangga, posisi)), atau None
+        """
+        labels = child.labels()
+        for _ in range(attempts):
+            tps = self._randint(0, self.n_points - 1)
+            neighbors = self.knn[tps]
+            neighbors = neighbors[(labels[neighbors] != labels[tps]) & (labels[neighbors] >= 0)]
+            if labels[tps] >= 0 and len(neighbors) > 0:
+                other = int(self._choice(neighbors))
+                c1, c2 = int(labels[tps]), int(labels[other])
+                return (c1, child[c1].index(tps)), (c2, child[c2].index(other))
+        return None
+
+    def _mutate(self, child):
+        """Apply one random mutation (swap, move, split or merge) in place"""
+        volumes = self.volumes
+        max_capacity = self.max_capacity
+        min_capacity = self.min_capacity
+
+        mutation_type = self._choice(['swap', 'move', 'split', 'merge'])
+
+        if mutation_type == 'swap':
+            # Swap a random TPS with one of its nearest neighbours in another cluster
+            pair = self._random_neighbor_pair(child) if len(child) >= 2 else None
+            if pair is not None:
+                (cluster1_idx, tps1_idx), (cluster2_idx, tps2_idx) = pair
+
+                tps1 = child[cluster1_idx][tps1_idx]
+                tps2 = child[cluster2_idx][tps2_idx]
+
+                # Check if swap would be valid
+                new_vol1 = child.cluster_volumes[cluster1_idx] - volumes[tps1] + volumes[tps2]
+                new_vol2 = child.cluster_volumes[cluster2_idx] - volumes[tps2] + volumes[tps1]
+
+                if new_vol1 <= max_capacity and new_vol2 <= max_capacity:
+                    child.swap(cluster1_idx, tps1_idx, cluster2_idx, tps2_idx)
+
+        elif mutation_type == 'move':
+            # Move a random TPS into the cluster of one of its nearest neighbours
+            pair = self._random_neighbor_pair(child) if len(child) >= 2 else None
+            if pair is not None:
+                (from_cluster_idx, tps_idx), (to_cluster_idx, _) = pair
+
+                # Make sure source cluster has more than one TPS
+                if len(child[from_cluster_idx]) > 1:
+                    tps = child[from_cluster_idx][tps_idx]
+
+                    new_to_vol = child.cluster_volumes[to_cluster_idx] + volumes[tps]
+                    new_from_vol = child.cluster_volumes[from_cluster_idx] - volumes[tps]
+
+                    if new_to_vol <= max_capacity and (new_from_vol >= min_capacity or len(child) > self.expected_clusters):
+                        child.move(from_cluster_idx, tps_idx, to_cluster_idx)
+
+        elif mutation_type == 'split':
+            # Split a cluster (prefer larger ones)
+            if len(child) > 0:
+                cluster_weights = np.array([len(cluster) for cluster in child], dtype=float)
+                cluster_idx = int(self.rng.choice(len(child), p=cluster_weights / cluster_weights.sum()))
+
+                if len(child[cluster_idx]) > 3:
+                    split_point = self._randint(1, len(child[cluster_idx]) - 1)
+
+                    vol1 = sum(volumes[idx] for idx in child[cluster_idx][:split_point])
+                    vol2 = child.cluster_volumes[cluster_idx] - vol1
+
+                    # If both are valid or we're below expected clusters, perform split
+                    if (vol1 >= min_capacity and vol2 >= min_capacity) or len(child) < self.expected_clusters:
+                        child.split(cluster_idx, split_point)
+
+        elif mutation_type == 'merge':
+            # Merge two clusters
+            if len(child) >= 2:
+                cluster1_idx = self._randint(0, len(child) - 1)
+                cluster2_idx = self._randint(0, len(child) - 1)
+
+                while cluster2_idx == cluster1_idx and len(child) > 1:
+                    cluster2_idx = self._randint(0, len(child) - 1)
+
+                merged_vol = child.cluster_volumes[cluster1_idx] + child.cluster_volumes[cluster2_idx]
+
+                if cluster1_idx != cluster2_idx and merged_vol <= max_capacity:
+                    child.merge(cluster1_idx, cluster2_idx)
+
+        return child
+
+    def _apply_vns(self, child):
+        """Short VND (relocate/swap with delta costs) on a GA child"""
+        return self.neighborhood_search.vnd(child, self.params["vns_child_evaluations"])
+
+    def refine_elite(self):
+        """
+        Intensifikasi: VNS penuh (shaking + VND) pada solusi elit populasi yang sudah
+        terurut, masing-masing dengan budget vns_max_evaluations evaluasi move.
+        """
+        elite_size = min(self.params["vns_elite_size"], len(self.population))
+        for i in range(elite_size):
+            if self._deadline_passed():
+                break
+            refined = self.neighborhood_search.vns(
+                self.population[i], self.params["vns_max_evaluations"], k_max=self.params["vns_k_max"]
+            )
+            if refined is not self.population[i]:
+                self.population[i] = refined
+
+    def _repair(self, child):
+        """Make sure every TPS is assigned exactly once"""
+        # Moves never change which TPS are covered; only rebuild when coverage is broken
+        if not child.missing and not child.duplicates:
+            return child
+
+        # Duplicates keep their first occurrence, missing TPS go to the nearest medoid that fits
+        labels, _ = clusters_to_labels(child.clusters, self.n_points)
+        labels = repair_labels(labels, self.volumes, self.max_capacity, self.distance_matrix)
+
+        return ClusterSolution.from_labels(labels, self.evaluator)
+
+    # ------------------------------------------------------------------
+    # Loop utama
+    # ------------------------------------------------------------------
+
+    def evolve_generation(self, iteration):
+        """
+        Run one GA-VNS generation.
+
+        Returns:
+            bool: False if the search should stop early (stagnation)
+        """
+        population_size = self.population_size
+        max_iterations = self.max_iterations
+        mutation_rate = self.params["mutation_rate"]
+
+        self.iteration = iteration
+        self._report(10 + iteration * 70 / max_iterations, f"Iterasi {iteration+1}/{max_iterations}")
+
+        # Sort population by fitness - GA approach
+        self.population.sort(key=lambda sol: sol.fitness)
+
+        # VNS pada elit sebelum seleksi, sehingga hasilnya ikut diwariskan
+        if self.params["vns_elite_size"] > 0:
+            self.refine_elite()
+            self.population.sort(key=lambda sol: sol.fitness)
+
+        current_best = self.population[0]
+        current_fitness, current_distance, cv, dv, mp, dp = current_best.evaluate()
+
+        # Calculate population diversity and adapt parameters
+        diversity = self.calculate_diversity(self.population)
+        self.diversity_history.append(diversity)
+
+        if len(self.diversity_history) >= 2:
+            diversity_change = self.diversity_history[-1] - self.diversity_history[-2]
+
+            # If diversity decreasing rapidly, increase mutation to encourage exploration
+            if diversity_change < -0.05:
+                self.adaptive_mutation_rate = min(0.9, self.adaptive_mutation_rate * 1.5)
+            # If diversity stable or increasing, gradually return to base rate
+            else:
+                self.adaptive_mutation_rate = mutation_rate + (self.adaptive_mutation_rate - mutation_rate) * 0.9
+
+            # Adjust crossover rate inversely to balance exploration/exploitation
+            self.adaptive_crossover_rate = max(0.5, min(0.95, 1.0 - self.adaptive_mutation_rate/2))
+
+        if self.params["debug_mode"] and iteration % 10 == 0:
+            log = f"Iterasi {iteration}/{max_iterations} ({(iteration*100/max_iterations):.1f}%): "
+            log += f"Fitness={current_fitness:.2f}, Jarak={current_distance:.2f}, "
+            log += f"Clusters={len(current_best)}, Diversitas={diversity:.4f}\n"
+            log += f"  MutRate={self.adaptive_mutation_rate:.4f}, CrossRate={self.adaptive_crossover_rate:.4f}\n"
+
+            if cv > 0 or dv > 0 or mp > 0 or dp > 0:
+                log += f"  Pelanggaran: Kapasitas={cv:.2f}, Jarak={dv:.2f}, TPS Hilang={mp:.2f}, TPS Duplikat={dp:.2f}\n"
+
+            self._report(log=log)
+
+            self.debug_info.append({
+                'iteration': iteration,
+                'fitness': current_fitness,
+                'distance': current_distance,
+                'num_clusters': len(current_best),
+                'diversity': diversity,
+                'mutation_rate': self.adaptive_mutation_rate,
+                'crossover_rate': self.adaptive_crossover_rate
+            })
+
+        if current_fitness < self.best_fitness:
+            self.best_solution = current_best.to_lists()
+            self.best_fitness = current_fitness
+            self.best_distance = current_distance
+            self.last_improvement = iteration
+            self.stagnation_count = 0
+
+            self._report(log=f"✓ Solusi baru terbaik: {len(self.best_solution)} cluster, fitness={self.best_fitness:.2f}, jarak={self.best_distance:.2f}\n")
+        else:
+            self.stagnation_count += 1
+
+        # Early stopping if no improvement for a while
+        if self.stagnation_count > max_iterations // 4:
+            self._report(log=f"\nBerhenti lebih awal karena tidak ada peningkatan selama {self.stagnation_count} iterasi\n")
+            return False
+
+        # Create new population using GA operations
+        new_population = [self.population[0]]  # Keep the best solution (elitism)
+
+        while len(new_population) < population_size:
+            parent1 = self._tournament_select()
+            parent2 = self._tournament_select()
+
+            if self.rng.random() < self.adaptive_crossover_rate:
+                if self.rng.random() < self.params["split_crossover_rate"]:
+                    child = self._split_crossover(parent1, parent2)
+                else:
+                    child = self._crossover(parent1, parent2)
+            else:
+                # No crossover, just copy one parent
+                if self.rng.random() < 0.5:
+                    child = parent1.copy()
+                else:
+                    child = parent2.copy()
+
+            if self.rng.random() < self.adaptive_mutation_rate:
+                child = self._mutate(child)
+
+            # Apply VNS with probability based on solution quality (higher for early solutions)
+            apply_vns_prob = 0.3 - (len(new_population) / (population_size * 3))
+            apply_vns_prob = max(0.05, min(0.5, apply_vns_prob))  # Between 5% and 50%
+
+            # Fase VNS dilewati bila batas waktu sudah habis; generasi tetap diselesaikan
+            if self.rng.random() < apply_vns_prob and not self._deadline_passed():
+                child = self._apply_vns(child)
+
+            # Clean up and validate the solution - common to both GA and VNS
+            new_population.append(self._repair(child))
+
+        # If new population is still smaller than desired, add random solutions
+        while len(new_population) < population_size:
+            try:
+                new_population.append(self.make_solution(self.create_random_solution()))
+            except Exception:
+                # Clone best solution as fallback
+                new_population.append(self.population[0].copy())
+
+        self.population = new_population[:population_size]
+        return True
+
+    def migrate(self):
+        """
+        Island model: kirim top-k populasi ke pulau tetangga dan ganti individu terburuk
+        dengan imigran yang diterima (jika ada).
+        """
+        size = min(self.params["migration_size"], len(self.population) - 1)
+        if size <= 0:
+            return
+
+        self.population.sort(key=lambda sol: sol.fitness)
+        emigrants = [sol.labels() for sol in self.population[:size]]
+        immigrants = self.migration.exchange(emigrants)
+
+        # Hanya imigran terbaru yang dipakai, paling banyak top-k
+        immigrants = [ClusterSolution.from_labels(labels, self.evaluator) for labels in immigrants[-size:]]
+        if immigrants:
+            self.population[-len(immigrants):] = immigrants
+            best_immigrant = min(sol.fitness for sol in immigrants)
+            self._report(log=f"Migrasi: {len(immigrants)} imigran diterima (fitness terbaik {best_immigrant:.2f})\n")
+
+    def optimize_final_routes(self):
+        """Optimize the route of every cluster in the best solution with ACO"""
+        self._report(85, "Melakukan optimasi rute final dengan ACO...")
+        self._report(log="\nMelakukan optimasi akhir pada rute dengan ACO...\n")
+
+        distance_matrix = self.distance_matrix
+        start_idx = self.params["start_idx"]
+        end_idx = self.params["end_idx"]
+        use_fixed_endpoints = start_idx is not None and end_idx is not None
+
+        optimized_solution = []
+        total_clusters = len(self.best_solution)
+        progress_increment = 15.0 / total_clusters if total_clusters > 0 else 0
+
+        def on_cluster_done(done, total, i):
+            self._report(85 + (done * progress_increment),
+                         f"Optimasi ACO untuk cluster {i+1}/{total_clusters} ({done}/{total} selesai)")
+
+        # Cluster independen satu sama lain: semua rute dioptimasi sekaligus (paralel)
+        to_optimize = [cluster for cluster in self.best_solution if len(cluster) >= 1]
+        optimized_routes = iter(self.route_cache.aco_routes(
+            to_optimize, distance_matrix,
+            start_idx=start_idx if use_fixed_endpoints else None,
+            end_idx=end_idx if use_fixed_endpoints else None,
+            num_ants=self.params["aco_ants"],
+            num_iterations=self.params["aco_iterations"],
+            variant=self.params["aco_variant"],
+            candidate_size=self.params["aco_candidate_size"],
+            exact_max_size=self.params["exact_route_max_size"],
+            local_search=self.params["aco_local_search"],
+            max_workers=self.params["route_workers"],
+            progress_callback=on_cluster_done,
+            rng=self.rng
+        ))
+
+        for i, cluster in enumerate(self.best_solution):
+            if len(cluster) >= 1:  # Bahkan 1 TPS perlu optimasi dengan titik awal/akhir
+                # Hitung jarak rute asli
+                original_dist = 0
+
+                if use_fixed_endpoints:
+                    original_dist += distance_matrix[start_idx][cluster[0]]
+                    for j in range(len(cluster)-1):
+                        original_dist += distance_matrix[cluster[j]][cluster[j+1]]
+                    original_dist += distance_matrix[cluster[-1]][end_idx]
+                else:
+                    for j in range(len(cluster)-1):
+                        original_dist += distance_matrix[cluster[j]][cluster[j+1]]
+
+                optimized_route, route_distance = next(optimized_routes)
+
+                improvement = original_dist - route_distance
+
+                # Gunakan rute optimal jika lebih baik atau jika titik awal/akhir diperlukan
+                if improvement > 0 or use_fixed_endpoints:
+                    optimized_solution.append(optimized_route)
+
+                    if use_fixed_endpoints:
+                        route_desc = f"Garasi → {len(cluster)} TPS → TPA"
+                    else:
+                        route_desc = f"{len(cluster)} TPS"
+
+                    self._report(log=f"Cluster {i+1} ({route_desc}): Peningkatan rute sebesar {improvement:.2f} unit\n")
+                else:
+                    optimized_solution.append(cluster)
+            else:
+                optimized_solution.append(cluster)
+
+        if optimized_solution:
+            self.best_solution = optimized_solution
+
+    def _validate_final_solution(self):
+        """Log missing/duplicate TPS and capacity violations of the final solution"""
+        clusters = self.best_solution or []
+        labels, duplicates = clusters_to_labels(clusters, self.n_points)
+        check = check_labels(labels, self.volumes, self.min_capacity, self.max_capacity)
+        missing = set(check['missing'].tolist())
+
+        if missing:
+            self._report(log=f"PERINGATAN: {len(missing)} TPS tidak masuk cluster: {missing}\n")
+
+        if duplicates:
+            self._report(log=f"PERINGATAN: {duplicates} TPS duplikat dalam cluster\n")
+
+        cluster_volumes = check['cluster_volumes']
+        for i in check['under_capacity']:
+            self._report(log=f"PERINGATAN: Cluster {i+1} di bawah kapasitas minimum: {cluster_volumes[i]:.2f} m³\n")
+        for i in check['over_capacity']:
+            self._report(log=f"PERINGATAN: Cluster {i+1} melebihi kapasitas maksimum: {cluster_volumes[i]:.2f} m³\n")
+
+    def run(self):
+        """
+        Jalankan GA-VNS lengkap: populasi awal, iterasi, optimasi rute akhir dan validasi.
+
+        Returns:
+            dict: Hasil dengan kunci 'clusters', 'debug_info', 'fitness', 'distance', 'iterations'
+        """
+        optimize_routes = self.params["optimize_routes"]
+
+        progress_log = f"Total volume: {self.total_volume:.2f} m³\n"
+        progress_log += f"Kapasitas minimum cluster: {self.min_capacity:.2f} m³\n"
+        progress_log += f"Kapasitas maksimum cluster: {self.max_capacity:.2f} m³\n"
+        progress_log += f"Perkiraan jumlah cluster: {self.expected_clusters}\n"
+        progress_log += f"Optimasi rute: {'Aktif' if optimize_routes else 'Nonaktif'}\n"
+        progress_log += f"Algoritma rute: ACO\n\n"
+        self._report(1, "Memulai clustering...", progress_log)
+
+        # Batas waktu GA; sebagian kecil disisakan untuk optimasi rute akhir
+        time_limit = self.params["time_limit_seconds"]
+        if time_limit:
+            ga_share = 1.0 - FINAL_ROUTE_TIME_SHARE if optimize_routes else 1.0
+            self.deadline = time.time() + time_limit * ga_share
+
+        # Lanjutkan dari checkpoint bila ada; generasi yang sudah selesai tidak diulang
+        checkpoint_path = self.params["checkpoint_path"]
+        checkpoint_interval = max(1, self.params["checkpoint_interval"])
+        state = load_checkpoint(checkpoint_path)
+        ga_finished = False
+        if state is not None and self.restore_checkpoint(state):
+            ga_finished = state['ga_finished']
+            first_iteration = state['iteration'] + 1
+            self._report(10, f"Melanjutkan dari checkpoint iterasi {first_iteration}...",
+                         f"Checkpoint dimuat: {checkpoint_path} (iterasi {first_iteration}, "
+                         f"fitness terbaik={self.best_fitness:.2f})\n")
+        else:
+            self.initialize_population()
+            first_iteration = 0
+
+        # Jumlah generasi yang benar-benar dievaluasi (berhenti sebelum sebuah generasi tidak dihitung)
+        generations = first_iteration
+
+        # Fase GA yang sudah selesai sebelum terputus tidak dijalankan lagi
+        end_iteration = first_iteration if ga_finished else self.max_iterations
+        for iteration in range(first_iteration, end_iteration):
+            # Permintaan berhenti dari luar (adaptive stop multi-start): kembalikan solusi terbaik saat ini
+            if self.stop_event is not None and self.stop_event.is_set():
+                self.stopped = True
+                self._report(log=f"\nRun dihentikan dari luar pada iterasi {iteration}\n")
+                break
+            if self._deadline_passed():
+                self._report(log=f"\nBatas waktu {time_limit:.1f} detik tercapai pada iterasi {iteration}\n")
+                break
+            generations = iteration + 1
+            if not self.evolve_generation(iteration):
+                break
+            if self.migration is not None and (iteration + 1) % self.params["migration_interval"] == 0:
+                self.migrate()
+            if (iteration + 1) % checkpoint_interval == 0:
+                self._save_checkpoint(iteration)
+
+        if not ga_finished:
+            if self.stopped or self.time_limit_hit:
+                self._record_population_best()
+            # Fase GA selesai (juga saat dihentikan/batas waktu: hasilnya final): resume setelah
+            # ini langsung ke optimasi rute akhir
+            self._save_checkpoint(generations - 1, ga_finished=True)
+
+        self._report(log=f"\nOptimisasi selesai setelah {generations} iterasi\n")
+        self._report(log=f"Solusi terbaik: {len(self.best_solution)} cluster dengan jarak total {self.best_distance:.2f}\n")
+        self._report(log=f"Cache fitness: {self.fitness_cache.hits} hit, {self.fitness_cache.misses} miss "
+                         f"(hit rate {self.fitness_cache.hit_rate()*100:.1f}%)\n")
+        self._report(log=f"Cache rute: {self.route_cache.hits} hit, {self.route_cache.misses} miss "
+                         f"(hit rate {self.route_cache.hit_rate()*100:.1f}%)\n")
+
+        if optimize_routes:
+            self.optimize_final_routes()
+
+        self._report(100, "Validasi solusi akhir...")
+        self._validate_final_solution()
+
+        best_solution = self.best_solution
+
+        # Filter out Garage and TPA if requested
+        exclude_indices = self.params["exclude_indices"]
+        if exclude_indices:
+            exclude = set(exclude_indices)
+            best_solution = [
+                [idx for idx in cluster if idx not in exclude]
+                for cluster in best_solution
+            ]
+            best_solution = [cluster for cluster in best_solution if cluster]
+
+        remove_checkpoint(checkpoint_path)
+
+        return {
+            'clusters': best_solution if best_solution else [list(range(self.n_points))],
+            'debug_info': self.debug_info,
+            'fitness': self.best_fitness,
+            'distance': self.best_distance,
+            'iterations': generations,
+            'fitness_cache_stats': self.fitness_cache.stats(),
+            'route_cache_stats': self.route_cache.stats(),
+            'stopped': self.stopped,
+            'time_limit_hit': self.time_limit_hit
+        }
+
+
+def solve(distance_matrix, volumes, min_capacity, max_capacity, params=None, progress_callback=None,
+          route_cache=None, rng=None, stop_event=None, migration=None):
+    """
+    Jalankan GA-VNS tanpa antarmuka.
+
+    Args:
+        distance_matrix (numpy.ndarray): Matriks jarak n x n
+        volumes (list): Volume sampah setiap TPS
+        min_capacity (float): Kapasitas minimum cluster (m³)
+        max_capacity (float): Kapasitas maksimum cluster (m³)
+        params (dict): Parameter solver, lihat default_solver_params()
+        progress_callback (callable): Opsional, progress_callback(percentage, message=None, log=None)
+        route_cache (RouteCostCache): Opsional, cache biaya rute bersama untuk matriks jarak ini
+        rng (numpy.random.Generator): Opsional, generator acak run ini (default dari params["seed"])
+        stop_event: Opsional, Event untuk menghentikan run lebih awal (diperiksa tiap generasi)
+        migration: Opsional, kanal migrasi island model (lihat GAVNSSolver)
+
+    Returns:
+        dict: Hasil solver (lihat GAVNSSolver.run)
+    """
+    solver = GAVNSSolver(distance_matrix, volumes, min_capacity, max_capacity, params, progress_callback,
+                         route_cache=route_cache, rng=rng, stop_event=stop_event, migration=migration)
+    return solver.run()
@@ -0,0 +1,153 @@
+"""
+Giant Tour - Pendekatan route-first cluster-second untuk solusi awal dan crossover
+Satu tur besar Garasi -> semua TPS -> TPA dibangun dengan nearest neighbor lalu 2-opt,
+kemudian dipotong secara optimal menjadi cluster dengan split Prins: lintasan terpendek
+pada DAG urutan tur, dengan setiap potongan dibatasi max_capacity dan kekurangan dari
+min_capacity dihitung sebagai penalti. Split yang sama dipakai sebagai decoder crossover
+(order crossover pada urutan tur dua induk).
+"""
+
+import numpy as np
+
+from route_local_search import improve_route
+from solution_state import UNDER_CAPACITY_PENALTY
+
+
+def nearest_neighbor_tour(nodes, distance_matrix, start_idx=None, first=None):
+    """
+    Tur nearest neighbor atas nodes (argmin ter-mask pada satu baris per langkah).
+
+    Args:
+        nodes (list): Indeks TPS yang harus dikunjungi
+        distance_matrix (numpy.ndarray): Matriks jarak
+        start_idx (int): Titik awal di luar nodes (Garasi)
+        first (int): TPS pertama tur (mengabaikan start_idx); default TPS terdekat dari
+            start_idx, atau TPS indeks terkecil tanpa start_idx
+
+    Returns:
+        list: Urutan TPS (tanpa start_idx)
+    """
+    nodes = np.asarray(nodes, dtype=np.int64)
+    if len(nodes) == 0:
+        return []
+
+    visited = np.zeros(len(nodes), dtype=bool)
+    if start_idx is None or first is not None:
+        pos = int(np.argmin(nodes)) if first is None else int(np.flatnonzero(nodes == first)[0])
+        visited[pos] = True
+        tour = [int(nodes[pos])]
+        current = int(nodes[pos])
+    else:
+        tour = []
+        current = start_idx
+
+    for _ in range(len(nodes) - len(tour)):
+        step_dist = np.where(visited, np.inf, distance_matrix[current, nodes])
+        pos = int(np.argmin(step_dist))
+        visited[pos] = True
+        current = int(nodes[pos])
+        tour.append(current)
+    return tour
+
+
+def build_giant_tour(nodes, distance_matrix, start_idx=None, end_idx=None, first=None, two_opt=True):
+    """
+    Giant tour atas semua TPS: nearest neighbor lalu 2-opt (ujung Garasi/TPA tetap).
+    first memberi variasi titik awal nearest neighbor untuk solusi awal yang berbeda.
+
+    Returns:
+        list: Urutan TPS (tanpa Garasi/TPA)
+    """
+    tour = nearest_neighbor_tour(nodes, distance_matrix, start_idx=start_idx, first=first)
+    if not two_opt or len(tour) < 3:
+        return tour
+
+    route = ([start_idx] if start_idx is not None else []) + tour + ([end_idx] if end_idx is not None else [])
+    route, _ = improve_route(route, distance_matrix, fixed_start=start_idx is not None,
+                             fixed_end=end_idx is not None, moves=("2opt",))
+    return [node for node in route if node != start_idx and node != end_idx]
+
+
+def split_tour(tour, distance_matrix, volumes, min_capacity, max_capacity, start_idx=None, end_idx=None,
+               distance_penalty=1.0, under_capacity_penalty=UNDER_CAPACITY_PENALTY):
+    """
+    Split Prins: potong tur menjadi ruas berurutan dengan biaya total minimum.
+    Biaya ruas t_i..t_j = distance_penalty * (Garasi -> t_i -> ... -> t_j -> TPA)
+    + under_capacity_penalty * kekurangan volume dari min_capacity. Ruas yang melebihi
+    max_capacity tidak diizinkan (kecuali satu TPS yang volumenya sendiri sudah melebihi).
+    Jendela ruas dibatasi kapasitas, sehingga kompleksitasnya O(n x panjang ruas terpanjang);
+    setiap langkah DP divektorisasi atas semua awal ruas yang mungkin.
+
+    Returns:
+        list: Cluster (list TPS) dalam urutan tur
+    """
+    tour = np.asarray(tour, dtype=np.int64)
+    m = len(tour)
+    if m == 0:
+        return []
+
+    D = distance_matrix
+    vol = np.asarray(volumes, dtype=float)[tour]
+    P = np.concatenate(([0.0], np.cumsum(vol)))
+    F = np.concatenate(([0.0], np.cumsum(D[tour[:-1], tour[1:]])))
+    enter = D[start_idx, tour] if start_idx is not None else np.zeros(m)
+    leave = D[tour, end_idx] if end_idx is not None else np.zeros(m)
+    # Bagian biaya yang hanya bergantung pada awal ruas i (dijumlah dengan V[i])
+    enter_cost = distance_penalty * (enter - F[:m])
+
+    V = np.full(m + 1, np.inf)
+    V[0] = 0.0
+    pred = np.zeros(m + 1, dtype=np.int64)
+    # Awal ruas paling kiri untuk setiap akhir j: P[j+1] - P[i] <= max_capacity
+    lowest = np.searchsorted(P, P[1:] - max_capacity - 1e-9, side='left')
+
+    for j in range(m):
+        lo = min(int(lowest[j]), j)
+        starts = np.arange(lo, j + 1)
+        load = P[j + 1] - P[starts]
+        cost = (V[starts] + enter_cost[starts] + distance_penalty * (F[j] + leave[j]) +
+                under_capacity_penalty * np.maximum(0.0, min_capacity - load))
+        best = int(np.argmin(cost))
+        V[j + 1] = cost[best]
+        pred[j + 1] = starts[best]
+
+    clusters = []
+    j = m
+    while j > 0:
+        i = int(pred[j])
+        clusters.append(tour[i:j].tolist())
+        j = i
+    clusters.reverse()
+    return clusters
+
+
+def clusters_to_tour(clusters, routes=None):
+    """
+    Giant tour dari sebuah solusi: rute setiap cluster (atau urutan anggotanya)
+    disambung sesuai urutan cluster.
+
+    Returns:
+        list: Urutan TPS
+    """
+    ordered = routes if routes is not None else clusters
+    return [int(node) for route in ordered for node in route]
+
+
+def order_crossover(tour_a, tour_b, rng):
+    """
+    Order crossover (OX): ruas acak dari tour_a dipertahankan di posisinya, sisa posisi
+    diisi TPS lain sesuai urutan kemunculannya di tour_b.
+
+    Returns:
+        list: Tur anak
+    """
+    tour_a = np.asarray(tour_a, dtype=np.int64)
+    tour_b = np.asarray(tour_b, dtype=np.int64)
+    m = len(tour_a)
+    if m < 3:
+        return tour_a.tolist()
+
+    i, j = np.sort(rng.choice(m + 1, size=2, replace=False))
+    segment = tour_a[i:j]
+    rest = tour_b[~np.isin(tour_b, segment)]
+    return np.concatenate((rest[:i], segment, rest[i:])).tolist()
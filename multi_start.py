@@ -0,0 +1,412 @@
+"""
+Multi-Start - Menjalankan banyak run GA-VNS independen (seed berbeda) tanpa tkinter
+Berisi perhitungan metrik solusi dan fungsi worker tingkat modul yang dapat di-pickle,
+sehingga setiap run dapat dijalankan di process terpisah (ProcessPoolExecutor).
+"""
+
+import math
+import multiprocessing
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from ga_vns_solver import solve
+from route_optimization import RouteCostCache
+from shared_arrays import SharedArrays, attach_shared_arrays
+from solution_encoding import check_labels, clusters_to_labels
+
+
+def solution_metrics(clusters, distance_matrix, volumes, optimize_routes=True, start_idx=None, end_idx=None,
+                     use_fixed_endpoints=None, route_cache=None):
+    """
+    Calculate metrics for a clustering solution including Garage-TPA distances
+
+    Args:
+        clusters (list): Cluster akhir (urutan TPS sesuai rute, tanpa Garasi/TPA)
+        distance_matrix (numpy.ndarray): Matriks jarak
+        volumes (list): Volume sampah setiap TPS
+        optimize_routes (bool): Jarak rute mengikuti urutan TPS (True) atau total jarak antar pasangan
+        start_idx (int): Indeks Garasi, opsional
+        end_idx (int): Indeks TPA, opsional
+        use_fixed_endpoints (bool): Default: True jika start_idx dan end_idx ada
+        route_cache (RouteCostCache): Opsional, cache statistik jarak per cluster
+
+    Returns:
+        dict: Metrik per cluster dan total solusi
+    """
+    if route_cache is None:
+        route_cache = RouteCostCache(0)
+    if use_fixed_endpoints is None:
+        use_fixed_endpoints = start_idx is not None and end_idx is not None
+
+    # Calculate total volume
+    total_volume = sum(volumes)
+
+    # Calculate cluster metrics
+    cluster_metrics = []
+    total_distance = 0
+    total_route_distance = 0
+    total_complete_route_distance = 0  # Including Garage and TPA
+
+    for i, cluster in enumerate(clusters):
+        cluster_volume = sum(volumes[idx] for idx in cluster)
+        volume_percentage = (cluster_volume / total_volume) * 100
+
+        # Calculate intra-cluster distances (cached by cluster membership)
+        sum_intra_distance, avg_intra_distance, max_intra_distance = route_cache.pairwise_stats(cluster, distance_matrix)
+        total_distance += sum_intra_distance
+
+        # Distances between consecutive nodes along the ordered cluster
+        node_distances = [float(d) for d in distance_matrix[cluster[:-1], cluster[1:]]] if len(cluster) > 1 else []
+
+        # Calculate route distance (TSP only between TPS)
+        route_distance = 0
+        if len(cluster) > 1 and optimize_routes:
+            route_distance = sum(node_distances)
+        else:
+            route_distance = sum_intra_distance
+
+        # Calculate COMPLETE route including Garage and TPA
+        complete_route_distance = route_distance
+        garage_to_first_distance = 0
+        last_to_tpa_distance = 0
+
+        if use_fixed_endpoints and start_idx is not None and end_idx is not None and len(cluster) > 0:
+            # Add distance from Garage to first TPS
+            garage_to_first_distance = distance_matrix[start_idx][cluster[0]]
+            complete_route_distance += garage_to_first_distance
+
+            # Add distance from last TPS to TPA
+            last_to_tpa_distance = distance_matrix[cluster[-1]][end_idx]
+            complete_route_distance += last_to_tpa_distance
+
+        # Add to totals
+        total_route_distance += route_distance
+        total_complete_route_distance += complete_route_distance
+
+        cluster_metrics.append({
+            'cluster_id': i+1,
+            'size': len(cluster),
+            'volume': cluster_volume,
+            'volume_percentage': volume_percentage,
+            'avg_distance': avg_intra_distance,
+            'max_distance': max_intra_distance,
+            'route_distance': route_distance,  # TPS only
+            'garage_to_first': garage_to_first_distance,  # Garage to first TPS
+            'last_to_tpa': last_to_tpa_distance,  # Last TPS to TPA
+            'complete_route_distance': complete_route_distance,  # Total including Garage & TPA
+            'node_distances': node_distances
+        })
+
+    # Calculate solution metrics
+    return {
+        'num_clusters': len(clusters),
+        'total_distance': total_distance,
+        'total_route_distance': total_route_distance,  # TPS only
+        'total_complete_route_distance': total_complete_route_distance,  # Including Garage & TPA
+        'avg_distance_per_cluster': total_distance / len(clusters) if clusters else 0,
+        'avg_route_distance_per_cluster': total_route_distance / len(clusters) if clusters else 0,
+        'avg_complete_route_distance_per_cluster': total_complete_route_distance / len(clusters) if clusters else 0,
+        'cluster_metrics': cluster_metrics,
+        'use_fixed_endpoints': use_fixed_endpoints,
+        'garage_index': start_idx,
+        'tpa_index': end_idx
+    }
+
+
+def make_run_result(seed, clusters, debug_info, metrics, volumes, max_capacity, execution_time):
+    """
+    Ringkasan satu run multi-start (format yang dipakai GUI dan agregasi multi-start).
+
+    Returns:
+        dict: seed, clusters, metrics, execution_time, feasible, distance, num_clusters, debug_info
+    """
+    # Check feasibility
+    labels, _ = clusters_to_labels(clusters, len(volumes))
+    feasible = len(check_labels(labels, volumes, 0, max_capacity)['over_capacity']) == 0
+
+    # Get total distance
+    total_distance_key = 'total_complete_route_distance' if 'total_complete_route_distance' in metrics else 'total_route_distance'
+    distance = metrics.get(total_distance_key, float('inf'))
+
+    return {
+        'seed': seed,
+        'clusters': clusters,
+        'metrics': metrics,
+        'execution_time': execution_time,
+        'feasible': feasible,
+        'distance': distance,
+        'num_clusters': len(clusters),
+        'debug_info': debug_info
+    }
+
+
+def spawn_run_seeds(num_runs, base_seed=None):
+    """
+    Seed independen untuk setiap run dari satu SeedSequence (SeedSequence.spawn), sehingga
+    aliran acak antar run tidak saling tumpang tindih dan hasil dapat diulang dari base_seed.
+
+    Returns:
+        tuple: (entropy SeedSequence dasar, list SeedSequence per run)
+    """
+    root = np.random.SeedSequence(base_seed)
+    return root.entropy, root.spawn(num_runs)
+
+
+def split_time_budget(remaining, runs_left, parallel_slots=1):
+    """
+    Bagi sisa batas waktu multi-start untuk run berikutnya. Dengan parallel_slots worker,
+    runs_left run dikerjakan dalam ceil(runs_left / parallel_slots) gelombang dan setiap
+    gelombang mendapat bagian yang sama, sehingga semua gelombang muat dalam sisa waktu.
+    Run yang dimulai bersamaan harus memakai budget yang sama (dihitung sekali per gelombang).
+
+    Args:
+        remaining (float): Sisa waktu (detik)
+        runs_left (int): Jumlah run yang belum dimulai, termasuk run ini
+        parallel_slots (int): Jumlah run yang berjalan bersamaan
+
+    Returns:
+        float: Batas waktu run ini (detik), 0 bila waktu sudah habis
+    """
+    if remaining <= 0 or runs_left <= 0:
+        return 0.0
+    return remaining / math.ceil(runs_left / max(1, parallel_slots))
+
+
+class RingMigration:
+    """
+    Kanal migrasi island model dengan topologi ring: pulau i mengirim ke antrean pulau
+    i+1 dan menerima dari antreannya sendiri. Pertukaran tidak pernah menunggu (asinkron),
+    sehingga pulau yang lebih lambat atau belum dimulai tidak menahan pulau lain.
+    """
+
+    def __init__(self, inbox, outbox):
+        """
+        Args:
+            inbox (multiprocessing.Queue): Antrean imigran untuk pulau ini
+            outbox (multiprocessing.Queue): Antrean pulau berikutnya pada ring
+        """
+        self.inbox = inbox
+        self.outbox = outbox
+
+    def exchange(self, emigrants):
+        """
+        Kirim emigran (list vektor label) dan ambil semua imigran yang sudah tiba.
+
+        Returns:
+            list: Vektor label imigran, urut dari yang paling lama tiba
+        """
+        try:
+            self.outbox.put_nowait(list(emigrants))
+        except queue.Full:
+            pass
+
+        immigrants = []
+        while True:
+            try:
+                immigrants.extend(self.inbox.get_nowait())
+            except queue.Empty:
+                break
+        return immigrants
+
+
+def make_island_queues(num_islands):
+    """Satu antrean imigran per pulau (diwariskan ke worker lewat initializer)"""
+    return [multiprocessing.Queue() for _ in range(num_islands)]
+
+
+# ----------------------------------------------------------------------
+# Worker process
+# ----------------------------------------------------------------------
+
+# Data masalah milik worker process (dipetakan dari shared memory lewat initializer)
+_worker_state = {}
+
+
+def init_multi_start_worker(shared_descriptor, stop_event=None, island_queues=None):
+    """
+    Initializer ProcessPoolExecutor: petakan distance_matrix dan volumes dari shared memory
+    (lihat shared_arrays.SharedArrays) dan siapkan cache rute per process.
+    stop_event (multiprocessing.Event) diwariskan ke worker untuk pembatalan kooperatif,
+    island_queues (lihat make_island_queues) untuk migrasi island model.
+    """
+    arrays, handles = attach_shared_arrays(shared_descriptor)
+    if island_queues:
+        # Imigran yang belum dibaca saat worker selesai boleh hilang; jangan tahan exit process
+        for island_queue in island_queues:
+            island_queue.cancel_join_thread()
+    _worker_state['stop_event'] = stop_event
+    _worker_state['island_queues'] = island_queues
+    _worker_state['shared_handles'] = handles
+    _worker_state['distance_matrix'] = arrays['distance_matrix']
+    _worker_state['volumes'] = arrays['volumes']
+    _worker_state['route_cache'] = RouteCostCache()
+
+
+def run_single_start(seed, min_capacity, max_capacity, params, seed_sequence=None, island_slot=None):
+    """
+    Jalankan satu run GA-VNS headless di worker process.
+
+    Args:
+        seed (int): Nomor/seed run ini (dipakai langsung bila seed_sequence tidak diberikan)
+        min_capacity (float): Kapasitas minimum cluster
+        max_capacity (float): Kapasitas maksimum cluster
+        params (dict): Parameter solver (lihat default_solver_params)
+        seed_sequence (numpy.random.SeedSequence): Opsional, dari spawn_run_seeds
+        island_slot (int): Opsional, posisi pulau pada ring migrasi (slot worker yang
+            menjalankan run ini, lihat iter_parallel_runs); None = tanpa island model
+
+    Returns:
+        dict: Hasil ringkas (lihat make_run_result), atau None jika multi-start sudah
+        dihentikan sebelum run ini dimulai
+    """
+    distance_matrix = _worker_state['distance_matrix']
+    volumes = _worker_state['volumes']
+    route_cache = _worker_state['route_cache']
+    stop_event = _worker_state.get('stop_event')
+
+    if stop_event is not None and stop_event.is_set():
+        return None
+
+    rng = np.random.default_rng(seed_sequence if seed_sequence is not None else seed)
+
+    migration = None
+    if island_slot is not None:
+        island_queues = _worker_state['island_queues']
+        migration = RingMigration(island_queues[island_slot],
+                                  island_queues[(island_slot + 1) % len(island_queues)])
+
+    # Worker sudah berjalan paralel; ACO akhir tidak perlu membuat process pool lagi
+    params = dict(params, route_workers=1)
+
+    start_time = time.time()
+    result = solve(distance_matrix, volumes, min_capacity, max_capacity, params, route_cache=route_cache, rng=rng,
+                   stop_event=stop_event, migration=migration)
+    execution_time = time.time() - start_time
+
+    metrics = solution_metrics(
+        result['clusters'], distance_matrix, volumes, params.get('optimize_routes', True),
+        start_idx=params.get('start_idx'), end_idx=params.get('end_idx'), route_cache=route_cache
+    )
+    run_result = make_run_result(seed, result['clusters'], result['debug_info'], metrics, volumes, max_capacity,
+                                 execution_time)
+    run_result['stopped'] = result['stopped']
+    run_result['time_limit_hit'] = result['time_limit_hit']
+    return run_result
+
+
+def iter_parallel_runs(distance_matrix, volumes, min_capacity, max_capacity, params, run_seeds, num_workers,
+                       stop_event, deadline=None, island_model=False, checkpoint=None):
+    """
+    Jalankan run multi-start di process pool dan hasilkan hasilnya sesuai urutan selesai.
+
+    Tugas dikirim secara bertahap (paling banyak num_workers sekaligus), sehingga
+    setelah stop_event di-set tidak ada run baru yang dimulai; run yang sedang berjalan
+    berhenti pada generasi berikutnya dan tetap mengembalikan solusi terbaiknya.
+    Pemanggil dapat men-set stop_event di antara hasil (mis. adaptive stop).
+
+    Dengan island_model, ring migrasi dibentuk atas slot yang berjalan bersamaan
+    (min(jumlah run, num_workers) antrean): setiap run menempati slot yang kosong saat
+    dikirim dan setiap params["migration_interval"] generasi top-k populasinya dikirim
+    ke slot berikutnya, sehingga imigran selalu sampai ke pulau yang sedang berjalan.
+    Migrasi bersifat asinkron, jadi hasil island model tidak dapat diulang persis
+    walaupun seed sama.
+
+    Dengan checkpoint (checkpoint.MultiStartCheckpoint yang sudah start()), hasil run
+    yang sudah tersimpan dihasilkan ulang lebih dulu tanpa dihitung kembali, run lain
+    menulis checkpoint solvernya sendiri dan setiap hasil baru langsung disimpan.
+
+    Args:
+        distance_matrix (numpy.ndarray): Matriks jarak (dibagikan lewat shared memory)
+        volumes (list): Volume sampah setiap TPS
+        min_capacity (float): Kapasitas minimum cluster
+        max_capacity (float): Kapasitas maksimum cluster
+        params (dict): Parameter solver
+        run_seeds (list): SeedSequence per run (lihat spawn_run_seeds)
+        num_workers (int): Jumlah worker process
+        stop_event (multiprocessing.Event): Event pembatalan bersama
+        deadline (float): Opsional, batas waktu time.time(). Sisa waktu dibagi ke setiap run
+            per gelombang run yang dikirim bersamaan (time_limit_seconds, lihat split_time_budget);
+            stop_event di-set saat terlewati
+        island_model (bool): Pertukarkan individu terbaik antar run (ring migration)
+        checkpoint (MultiStartCheckpoint): Opsional, checkpoint/resume multi-start
+
+    Yields:
+        tuple: (seed, hasil run atau None, exception atau None)
+    """
+    # Run yang sudah selesai pada sesi sebelumnya (resume) tidak dihitung ulang
+    todo_seeds = list(range(len(run_seeds)))
+    if checkpoint is not None:
+        for result in list(checkpoint.results):
+            yield result['seed'], dict(result, resumed=True), None
+        completed = checkpoint.completed_seeds()
+        todo_seeds = [seed for seed in todo_seeds if seed not in completed]
+        if not todo_seeds or stop_event.is_set():
+            return
+
+    arrays = {'distance_matrix': distance_matrix, 'volumes': np.asarray(volumes, dtype=float)}
+    num_islands = min(len(todo_seeds), num_workers)
+    island_queues = make_island_queues(num_islands) if island_model and num_islands > 1 else None
+
+    # Segmen shared memory dihapus saat keluar dari blok, juga bila ada run yang gagal
+    with SharedArrays(arrays) as shared, \
+            ProcessPoolExecutor(max_workers=num_workers, initializer=init_multi_start_worker,
+                                initargs=(shared.descriptor(), stop_event, island_queues)) as executor:
+        pending = {}
+        next_index = 0
+        free_slots = list(range(num_workers))
+        # Setiap num_workers run berturut-turut adalah satu gelombang; budget waktunya dihitung
+        # sekali di awal gelombang sehingga semua run dalam gelombang mendapat bagian yang sama
+        wave_budget = None
+        wave_end = 0
+
+        def submit_more():
+            nonlocal next_index, wave_budget, wave_end
+            while len(pending) < num_workers and next_index < len(todo_seeds) and not stop_event.is_set():
+                seed = todo_seeds[next_index]
+                run_params = params
+                if deadline is not None:
+                    if next_index >= wave_end:
+                        wave_budget = split_time_budget(deadline - time.time(), len(todo_seeds) - next_index,
+                                                        num_workers)
+                        if params.get('time_limit_seconds'):
+                            wave_budget = min(wave_budget, params['time_limit_seconds'])
+                        wave_end = next_index + num_workers
+                    run_params = dict(run_params, time_limit_seconds=max(wave_budget, 1e-3))
+                if checkpoint is not None:
+                    run_params = dict(run_params, checkpoint_path=checkpoint.run_path(seed))
+                slot = free_slots.pop(0)
+                future = executor.submit(run_single_start, seed, min_capacity, max_capacity, run_params,
+                                         run_seeds[seed], slot if island_queues is not None else None)
+                pending[future] = (seed, slot)
+                next_index += 1
+
+        try:
+            submit_more()
+            while pending:
+                if deadline is None or stop_event.is_set():
+                    timeout = None
+                else:
+                    timeout = max(deadline - time.time(), 0)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if deadline is not None and time.time() >= deadline:
+                    stop_event.set()
+
+                for future in done:
+                    seed, slot = pending.pop(future)
+                    free_slots.append(slot)
+                    try:
+                        result, error = future.result(), None
+                    except Exception as e:
+                        result, error = None, e
+                    if result is not None and checkpoint is not None:
+                        checkpoint.record_result(result)
+                    if result is not None or error is not None:
+                        yield seed, result, error
+
+                submit_more()
+        finally:
+            # Pemanggil berhenti membaca (atau terjadi error): hentikan run yang masih berjalan
+            stop_event.set()
@@ -0,0 +1,237 @@
+"""
+Route Local Search - Perbaikan rute satu cluster dengan 2-opt, Or-opt dan swap
+Titik awal/akhir (Garasi/TPA) dapat dibuat tetap. Setiap move dinilai dengan delta O(1)
+(prefix sum untuk ruas yang dibalik, sehingga jarak asimetris jaringan jalan tetap benar)
+dan hanya dicoba terhadap k tetangga terdekat setiap node (neighbour list).
+"""
+
+import numpy as np
+
+
+DEFAULT_NEIGHBOR_SIZE = 8
+OR_OPT_MAX_SEGMENT = 3
+IMPROVEMENT_EPS = 1e-9
+
+
+def route_length(route, distance_matrix):
+    """Total jarak rute (lintasan terbuka, tanpa kembali ke awal)"""
+    if len(route) < 2:
+        return 0.0
+    route = np.asarray(route)
+    return float(np.asarray(distance_matrix[route[:-1], route[1:]], dtype=float).sum())
+
+
+def improve_route(route, distance_matrix, fixed_start=True, fixed_end=True, neighbor_size=DEFAULT_NEIGHBOR_SIZE,
+                  max_passes=50, moves=("2opt", "oropt", "swap")):
+    """
+    Perbaiki urutan kunjungan dengan local search first-improvement sampai tidak ada
+    move yang memperpendek rute (atau max_passes putaran).
+
+    Args:
+        route (list): Urutan indeks node, termasuk Garasi/TPA jika ada
+        distance_matrix (numpy.ndarray): Matriks jarak (boleh asimetris)
+        fixed_start (bool): Node pertama tidak boleh dipindah
+        fixed_end (bool): Node terakhir tidak boleh dipindah
+        neighbor_size (int): Jumlah tetangga terdekat yang dicoba per node
+        max_passes (int): Batas putaran perbaikan
+        moves (tuple): Kombinasi "2opt", "oropt", "swap"
+
+    Returns:
+        tuple: (rute baru berupa indeks asli, total jarak)
+    """
+    route = list(route)
+    if len(route) < 3:
+        return route, route_length(route, distance_matrix)
+
+    # Submatriks lokal; ujung yang tidak tetap diganti node semu berjarak 0 ke semua node,
+    # sehingga semua kasus menjadi lintasan dengan kedua ujung tetap
+    nodes = np.asarray(route)
+    m = len(nodes)
+    size = m + (0 if fixed_start else 1) + (0 if fixed_end else 1)
+    local = np.zeros((size, size))
+    offset = 0 if fixed_start else 1
+    local[offset:offset+m, offset:offset+m] = np.asarray(distance_matrix[np.ix_(nodes, nodes)], dtype=float)
+
+    order = list(range(offset, offset + m))
+    if not fixed_start:
+        order.insert(0, 0)
+    if not fixed_end:
+        order.append(size - 1)
+
+    order = improve_order(order, local, neighbor_size=neighbor_size, max_passes=max_passes, moves=moves)
+
+    improved = [route[i - offset] for i in order if offset <= i < offset + m]
+    return improved, route_length(improved, distance_matrix)
+
+
+def improve_order(order, local_matrix, neighbor_size=DEFAULT_NEIGHBOR_SIZE, max_passes=50,
+                  moves=("2opt", "oropt", "swap")):
+    """
+    Inti local search pada indeks lokal: order[0] dan order[-1] selalu tetap.
+
+    Returns:
+        list: Urutan baru (indeks baris local_matrix)
+    """
+    order = list(order)
+    m = len(order)
+    if m < 4:
+        return order
+
+    D = np.asarray(local_matrix, dtype=float)
+    neighbors = neighbor_lists(D, neighbor_size)
+    search = _RouteState(order, D)
+
+    for _ in range(max_passes):
+        improved = False
+        if "2opt" in moves:
+            improved |= search.two_opt(neighbors)
+        if "oropt" in moves:
+            improved |= search.or_opt(neighbors)
+        if "swap" in moves:
+            improved |= search.swap(neighbors)
+        if not improved:
+            break
+
+    return search.order
+
+
+def neighbor_lists(local_matrix, neighbor_size=DEFAULT_NEIGHBOR_SIZE):
+    """k node terdekat (jarak keluar) untuk setiap node, dipilih dengan argpartition"""
+    n = len(local_matrix)
+    k = min(neighbor_size, n - 1)
+    distances = np.array(local_matrix, dtype=float)
+    np.fill_diagonal(distances, np.inf)
+    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    # Urutkan dari yang terdekat agar first-improvement mencoba kandidat terbaik dulu
+    ranks = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1)
+    return np.take_along_axis(nearest, ranks, axis=1).tolist()
+
+
+class _RouteState:
+    """Urutan rute beserta posisi node dan prefix sum jarak maju/mundur"""
+
+    def __init__(self, order, D):
+        self.D = D
+        self._set(order)
+
+    def _set(self, order):
+        self.order = order
+        self.m = len(order)
+        self.pos = {node: i for i, node in enumerate(order)}
+        arr = np.asarray(order)
+        forward = self.D[arr[:-1], arr[1:]]
+        backward = self.D[arr[1:], arr[:-1]]
+        # F[k] = jarak r0 -> ... -> rk, B[k] = jarak rk -> ... -> r0 (untuk ruas yang dibalik)
+        self.F = np.concatenate(([0.0], np.cumsum(forward))).tolist()
+        self.B = np.concatenate(([0.0], np.cumsum(backward))).tolist()
+
+    def _reversal_delta(self, i, j):
+        """Delta membalik posisi i+1..j (edge baru r_i->r_j dan r_(i+1)->r_(j+1))"""
+        D, r = self.D, self.order
+        a, b, c, e = r[i], r[i+1], r[j], r[j+1]
+        inner = (self.B[j] - self.B[i+1]) - (self.F[j] - self.F[i+1])
+        return D[a, c] + D[b, e] - D[a, b] - D[c, e] + inner
+
+    def two_opt(self, neighbors):
+        """2-opt: balik ruas di antara dua edge, kandidat dari neighbour list"""
+        improved = False
+        i = 0
+        while i < self.m - 2:
+            a = self.order[i]
+            applied = False
+            for c in neighbors[a]:
+                j = self.pos.get(c)
+                if j is None:
+                    continue
+                if i + 1 < j <= self.m - 2:
+                    # Edge baru a -> c
+                    lo, hi = i, j
+                elif 1 <= j and j + 1 < i:
+                    # Edge baru c -> a: balik posisi j..i-1
+                    lo, hi = j - 1, i - 1
+                else:
+                    continue
+                if self._reversal_delta(lo, hi) < -IMPROVEMENT_EPS:
+                    order = self.order
+                    self._set(order[:lo+1] + order[lo+1:hi+1][::-1] + order[hi+1:])
+                    improved = applied = True
+                    break
+            if not applied:
+                i += 1
+        return improved
+
+    def or_opt(self, neighbors):
+        """Or-opt: pindahkan ruas 1..3 node ke posisi lain (arah asli atau dibalik)"""
+        D = self.D
+        improved = False
+        s = 1
+        while s < self.m - 1:
+            applied = False
+            for length in range(1, OR_OPT_MAX_SEGMENT + 1):
+                t = s + length - 1
+                if t > self.m - 2:
+                    break
+                r = self.order
+                prev, first, last, nxt = r[s-1], r[s], r[t], r[t+1]
+                remove_gain = D[prev, first] + D[last, nxt] - D[prev, nxt]
+                inner_forward = self.F[t] - self.F[s]
+                inner_backward = self.B[t] - self.B[s]
+
+                # Sisipkan setelah/ sebelum tetangga node pertama ruas
+                for c in neighbors[first]:
+                    pc = self.pos.get(c)
+                    if pc is None:
+                        continue
+                    for p in (pc, pc - 1):
+                        if p < 0 or p >= self.m - 1 or s - 1 <= p <= t:
+                            continue
+                        u, v = r[p], r[p+1]
+                        base = remove_gain + D[u, v]
+                        delta_forward = D[u, first] + D[last, v] - base
+                        delta_reversed = D[u, last] + D[first, v] - base + inner_backward - inner_forward
+                        if min(delta_forward, delta_reversed) < -IMPROVEMENT_EPS:
+                            segment = r[s:t+1]
+                            if delta_reversed < delta_forward:
+                                segment = segment[::-1]
+                            rest = r[:s] + r[t+1:]
+                            insert_at = p + 1 if p < s else p + 1 - length
+                            self._set(rest[:insert_at] + segment + rest[insert_at:])
+                            improved = applied = True
+                            break
+                    if applied:
+                        break
+                if applied:
+                    break
+            if not applied:
+                s += 1
+        return improved
+
+    def swap(self, neighbors):
+        """Swap: tukar dua node, kandidat node yang dekat dengan pendahulu posisi i"""
+        D = self.D
+        improved = False
+        i = 1
+        while i < self.m - 1:
+            applied = False
+            for c in neighbors[self.order[i-1]]:
+                j = self.pos.get(c)
+                if j is None or j == i or j <= 0 or j >= self.m - 1:
+                    continue
+                lo, hi = min(i, j), max(i, j)
+                r = self.order
+                x, y = r[lo], r[hi]
+                if hi == lo + 1:
+                    delta = (D[r[lo-1], y] + D[y, x] + D[x, r[hi+1]] -
+                             D[r[lo-1], x] - D[x, y] - D[y, r[hi+1]])
+                else:
+                    delta = (D[r[lo-1], y] + D[y, r[lo+1]] + D[r[hi-1], x] + D[x, r[hi+1]] -
+                             D[r[lo-1], x] - D[x, r[lo+1]] - D[r[hi-1], y] - D[y, r[hi+1]])
+                if delta < -IMPROVEMENT_EPS:
+                    order = list(r)
+                    order[lo], order[hi] = y, x
+                    self._set(order)
+                    improved = applied = True
+                    break
+            if not applied:
+                i += 1
+        return improved
@@ -0,0 +1,650 @@
+"""
+Optimasi Rute - Algoritma penentuan urutan kunjungan TPS dalam satu cluster
+Dipakai oleh solver GA-VNS maupun aplikasi GUI; tidak bergantung pada tkinter.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from cache_utils import LRUCache
+from route_local_search import improve_route
+from shared_arrays import SharedArrays, attach_shared_arrays
+
+
+# Ukuran cluster terbesar yang diselesaikan eksak dengan Held-Karp (O(2^n * n^2))
+EXACT_ROUTE_MAX_SIZE = 13
+
+# Parameter MAX-MIN Ant System
+MMAS_EVAPORATION_RATE = 0.02
+MMAS_P_BEST = 0.05            # Peluang membangun ulang rute terbaik saat konvergen (menentukan tau_min)
+MMAS_GLOBAL_BEST_EVERY = 5    # Setiap N iterasi yang menambah feromon adalah semut terbaik global
+
+
+def _mmas_limits(best_length, route_size, evaporation_rate):
+    """Batas feromon MMAS (tau_max, tau_min) untuk panjang rute terbaik saat ini"""
+    if best_length <= 0:
+        return 1.0, 1.0 / max(route_size, 2)
+    tau_max = 1.0 / (evaporation_rate * best_length)
+    n = max(route_size, 2)
+    p_root = MMAS_P_BEST ** (1.0 / n)
+    tau_min = tau_max * (1 - p_root) / ((n / 2.0 - 1) * p_root) if n > 2 else tau_max / (2 * n)
+    return tau_max, min(tau_min, tau_max)
+
+
+def _candidate_mask(sub_matrix, candidate_size, use_fixed_points):
+    """
+    Mask (node x node) berisi True untuk candidate_size tetangga terdekat setiap node,
+    dipilih dengan argpartition pada submatriks jarak.
+    """
+    route_size = len(sub_matrix)
+    distances = sub_matrix.astype(float).copy()
+    np.fill_diagonal(distances, np.inf)
+    if use_fixed_points:
+        # Titik awal tidak pernah menjadi tujuan, titik akhir ditambahkan terpisah
+        distances[:, 0] = np.inf
+        distances[:, route_size-1] = np.inf
+
+    mask = np.zeros((route_size, route_size), dtype=bool)
+    k = min(candidate_size, route_size - 1) if candidate_size else 0
+    if k <= 0:
+        return None
+    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    mask[np.arange(route_size)[:, None], nearest] = True
+    return mask & np.isfinite(distances)
+
+
+def optimize_route_aco(cluster, distance_matrix, start_idx=None, end_idx=None, num_ants=10, num_iterations=50, alpha=1.0, beta=5.0, update_progress=None,
+                       variant="as", candidate_size=8, exact_max_size=None, local_search=False, rng=None):
+    """
+    Optimize route using Ant Colony Optimization with optional fixed start and end points.
+    All ants of an iteration are built in lockstep with NumPy: the heuristic matrix
+    eta^beta is computed once, the next node of every ant is sampled together from the
+    cumulative transition weights and pheromone is deposited with np.add.at.
+
+    variant="as" is the classic Ant System (every ant deposits). variant="mmas" runs the
+    MAX-MIN Ant System: only the iteration-best ant (global-best ant every
+    MMAS_GLOBAL_BEST_EVERY iterations) deposits, pheromone is kept in [tau_min, tau_max]
+    and each step only considers the candidate_size nearest nodes of the current node
+    (falling back to all unvisited nodes once every candidate has been visited).
+
+    Clusters with at most exact_max_size TPS are solved exactly with Held-Karp
+    (held_karp_route) instead; None disables the exact solver.
+
+    With local_search=True the best ant of every iteration is improved with
+    2-opt/Or-opt/swap (route_local_search) before the pheromone update.
+
+    rng is the numpy Generator used for every random choice (a fresh one if None).
+    """
+    # Handle special cases of empty or very small clusters
+    if len(cluster) == 0:
+        if start_idx is not None and end_idx is not None:
+            # Jika tidak ada TPS, cukup rute dari Garasi ke TPA
+            return [start_idx, end_idx], distance_matrix[start_idx][end_idx]
+        return cluster, 0
+    elif len(cluster) == 1:
+        if start_idx is not None and end_idx is not None:
+            # Jika hanya ada 1 TPS, buat rute Garasi -> TPS -> TPA
+            tps_idx = cluster[0]
+            route = [start_idx, tps_idx, end_idx]
+            distance = distance_matrix[start_idx][tps_idx] + distance_matrix[tps_idx][end_idx]
+            return route, distance
+        return cluster, 0
+    elif len(cluster) == 2:
+        if start_idx is not None and end_idx is not None:
+            # Jika ada 2 TPS, coba 2 kemungkinan urutan dan pilih yang terbaik
+            tps1, tps2 = cluster
+            route1 = [start_idx, tps1, tps2, end_idx]
+            dist1 = (distance_matrix[start_idx][tps1] + 
+                    distance_matrix[tps1][tps2] + 
+                    distance_matrix[tps2][end_idx])
+                    
+            route2 = [start_idx, tps2, tps1, end_idx]
+            dist2 = (distance_matrix[start_idx][tps2] + 
+                    distance_matrix[tps2][tps1] + 
+                    distance_matrix[tps1][end_idx])
+                    
+            return route1 if dist1 <= dist2 else route2, min(dist1, dist2)
+        else:
+            # Tanpa titik awal/akhir, hanya optimasi 2 TPS
+            dist = distance_matrix[cluster[0]][cluster[1]]
+            return cluster, dist
+    
+    # Cluster kecil: solusi eksak dengan Held-Karp lebih cepat dan optimal
+    if exact_max_size and len(cluster) <= exact_max_size:
+        route, distance = held_karp_route(cluster, distance_matrix, start_idx, end_idx)
+        if update_progress:
+            update_progress(100.0, "Rute eksak (Held-Karp)")
+        return route, distance
+    
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # Flag untuk menandakan apakah menggunakan titik awal/akhir
+    use_fixed_points = start_idx is not None and end_idx is not None
+    
+    # Susun node untuk optimasi
+    if use_fixed_points:
+        # Jika menggunakan titik awal/akhir, tambahkan ke dalam nodes
+        all_nodes = [start_idx] + list(cluster) + [end_idx]
+    else:
+        # Jika tidak, hanya gunakan TPS saja
+        all_nodes = list(cluster)
+    
+    # Ekstrak submatriks jarak untuk nodes yang relevan
+    route_size = len(all_nodes)
+    nodes = np.asarray(all_nodes)
+    sub_matrix = np.asarray(distance_matrix[np.ix_(nodes, nodes)], dtype=float)
+    
+    # Informasi heuristik (inverse jarak)^beta cukup dihitung sekali
+    with np.errstate(divide='ignore'):
+        heuristic = np.where(sub_matrix > 0, (1.0 / sub_matrix) ** beta, 0.0)
+    
+    use_mmas = variant == "mmas"
+    
+    # Parameter ACO
+    if use_mmas:
+        evaporation_rate = MMAS_EVAPORATION_RATE
+        Q = 1.0
+    else:
+        evaporation_rate = 0.1
+        Q = 100  # Pheromone deposit factor
+    
+    # Variabel untuk melacak solusi terbaik
+    best_route_indices = list(range(route_size))
+    best_distance = float('inf')
+    
+    if use_mmas:
+        # Batas feromon dari panjang rute nearest neighbor (tau_max = 1 / (rho * L))
+        reference_length = nearest_neighbor_route_length(list(cluster), distance_matrix, start_idx, end_idx)
+        tau_max, tau_min = _mmas_limits(reference_length, route_size, evaporation_rate)
+        pheromone = np.full((route_size, route_size), tau_max)
+        
+        # Candidate list: k tetangga terdekat setiap node (tanpa dirinya sendiri dan titik awal)
+        candidate_mask = _candidate_mask(sub_matrix, candidate_size, use_fixed_points)
+    else:
+        # Inisialisasi matriks feromon
+        pheromone = np.ones((route_size, route_size))
+        candidate_mask = None
+    
+    # Progress tracking
+    progress_increment = 100.0 / num_iterations if num_iterations > 0 else 0
+    
+    ant_rows = np.arange(num_ants)
+    
+    # Loop utama ACO
+    for iteration in range(num_iterations):
+        # Bobot transisi tau^alpha * eta^beta tetap selama satu iterasi
+        transition = (pheromone ** alpha) * heuristic
+        
+        # Semua semut membangun rute serentak (satu baris per semut)
+        routes = np.empty((num_ants, route_size), dtype=np.int64)
+        visited = np.zeros((num_ants, route_size), dtype=bool)
+        
+        if use_fixed_points:
+            # Selalu mulai dari titik awal (Garasi, indeks 0); TPA (indeks terakhir) hanya di akhir
+            current = np.zeros(num_ants, dtype=np.int64)
+            visited[:, route_size-1] = True
+            n_steps = route_size - 2
+        else:
+            # Tanpa fixed points, mulai dari TPS acak
+            current = rng.integers(0, route_size, size=num_ants)
+            n_steps = route_size - 1
+        
+        visited[ant_rows, current] = True
+        routes[:, 0] = current
+        total_distance = np.zeros(num_ants)
+        
+        for step in range(1, n_steps + 1):
+            # Hitung bobot transisi ke node yang belum dikunjungi
+            weights = np.where(visited, 0.0, transition[current])
+            if candidate_mask is not None:
+                # Batasi ke candidate list; semut yang kandidatnya habis memakai semua node
+                restricted = np.where(candidate_mask[current], weights, 0.0)
+                has_candidate = restricted.sum(axis=1) > 0
+                weights[has_candidate] = restricted[has_candidate]
+            cumulative = np.cumsum(weights, axis=1)
+            totals = cumulative[:, -1]
+            
+            # Jika semua bobot 0, pilih seragam dari node yang belum dikunjungi
+            no_weight = totals <= 0
+            if no_weight.any():
+                cumulative[no_weight] = np.cumsum(~visited[no_weight], axis=1)
+                totals = cumulative[:, -1]
+            
+            # Roulette wheel untuk semua semut sekaligus (searchsorted per baris)
+            threshold = rng.random(num_ants) * totals
+            next_idx = (cumulative <= threshold[:, None]).sum(axis=1)
+            
+            total_distance += sub_matrix[current, next_idx]
+            current = next_idx
+            visited[ant_rows, current] = True
+            routes[:, step] = current
+        
+        # Jika menggunakan fixed endpoints, tambahkan titik akhir (TPA)
+        if use_fixed_points:
+            routes[:, route_size-1] = route_size - 1
+            total_distance += sub_matrix[current, route_size-1]
+        
+        # Update solusi terbaik
+        best_ant = int(np.argmin(total_distance))
+        if local_search:
+            # Perbaiki rute semut terbaik iterasi; feromon ikut memakai rute yang diperbaiki
+            improved_route, improved_distance = improve_route(
+                routes[best_ant], sub_matrix, fixed_start=use_fixed_points, fixed_end=use_fixed_points
+            )
+            routes[best_ant] = improved_route
+            total_distance[best_ant] = improved_distance
+        if total_distance[best_ant] < best_distance:
+            best_route_indices = routes[best_ant].tolist()
+            best_distance = float(total_distance[best_ant])
+            if use_mmas:
+                tau_max, tau_min = _mmas_limits(best_distance, route_size, evaporation_rate)
+        
+        # Evaporasi feromon
+        pheromone *= (1 - evaporation_rate)
+        
+        if use_mmas:
+            # Hanya semut terbaik iterasi (atau terbaik global secara berkala) yang menambah feromon
+            if (iteration + 1) % MMAS_GLOBAL_BEST_EVERY == 0:
+                deposit_route = np.asarray(best_route_indices)
+                deposit_distance = best_distance
+            else:
+                deposit_route = routes[best_ant]
+                deposit_distance = float(total_distance[best_ant])
+            if deposit_distance > 0:
+                pheromone[deposit_route[:-1], deposit_route[1:]] += Q / deposit_distance
+            np.clip(pheromone, tau_min, tau_max, out=pheromone)
+        else:
+            # Update feromon berdasarkan rute-rute yang dibangun
+            deposit = np.divide(Q, total_distance, out=np.zeros(num_ants), where=total_distance > 0)
+            np.add.at(pheromone, (routes[:, :-1], routes[:, 1:]), deposit[:, None])
+        
+        # Update progress jika callback disediakan
+        if update_progress:
+            current_progress = (iteration + 1) * progress_increment
+            update_progress(current_progress, f"ACO Iterasi {iteration+1}/{num_iterations}")
+    
+    # Konversi indeks rute ke indeks node asli
+    best_route = [all_nodes[i] for i in best_route_indices]
+    
+    return best_route, best_distance
+
+
+# Matriks jarak milik worker process: dipetakan dari shared memory sekali per worker,
+# bukan di-pickle ulang untuk setiap cluster
+_worker_distance_matrix = None
+_worker_shared_handles = None
+
+
+def _init_route_worker(shared_descriptor):
+    global _worker_distance_matrix, _worker_shared_handles
+    arrays, _worker_shared_handles = attach_shared_arrays(shared_descriptor)
+    _worker_distance_matrix = arrays['distance_matrix']
+
+
+def _route_worker_task(cluster, start_idx, end_idx, aco_kwargs, rng):
+    return optimize_route_aco(cluster, _worker_distance_matrix, start_idx=start_idx, end_idx=end_idx, rng=rng,
+                              **aco_kwargs)
+
+
+def optimize_routes_parallel(clusters, distance_matrix, start_idx=None, end_idx=None, max_workers=None,
+                             progress_callback=None, rng=None, **aco_kwargs):
+    """
+    Jalankan optimize_route_aco untuk banyak cluster sekaligus di process pool.
+    Cluster saling independen, jadi fase ini selesai kira-kira sepanjang cluster terlama.
+
+    Args:
+        clusters (list): Daftar cluster (list indeks TPS)
+        distance_matrix (numpy.ndarray): Matriks jarak
+        start_idx (int): Indeks titik awal (Garasi), opsional
+        end_idx (int): Indeks titik akhir (TPA), opsional
+        max_workers (int): Jumlah process; None = jumlah CPU, 1 = berurutan di process ini
+        progress_callback (callable): progress_callback(selesai, total, indeks_cluster)
+        rng (numpy.random.Generator): Opsional; setiap cluster mendapat generator turunan
+            (rng.spawn) sehingga hasilnya sama baik dijalankan paralel maupun berurutan
+        **aco_kwargs: Parameter tambahan optimize_route_aco (num_ants, num_iterations, ...)
+
+    Returns:
+        list: (rute, jarak) untuk setiap cluster, urutan sama dengan clusters
+    """
+    total = len(clusters)
+    results = [None] * total
+    if rng is None:
+        rng = np.random.default_rng()
+    cluster_rngs = rng.spawn(total)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, total)
+
+    done = 0
+    if max_workers > 1:
+        try:
+            with SharedArrays({'distance_matrix': distance_matrix}) as shared, \
+                    ProcessPoolExecutor(max_workers=max_workers, initializer=_init_route_worker,
+                                        initargs=(shared.descriptor(),)) as executor:
+                futures = {
+                    executor.submit(_route_worker_task, list(cluster), start_idx, end_idx, aco_kwargs, cluster_rngs[i]): i
+                    for i, cluster in enumerate(clusters)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total, i)
+        except (OSError, BrokenProcessPool):
+            # Process pool tidak tersedia: selesaikan sisa cluster secara berurutan
+            pass
+
+    for i, cluster in enumerate(clusters):
+        if results[i] is None:
+            results[i] = optimize_route_aco(list(cluster), distance_matrix, start_idx=start_idx, end_idx=end_idx,
+                                            rng=cluster_rngs[i], **aco_kwargs)
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, i)
+
+    return results
+
+
+def held_karp_route(cluster, distance_matrix, start_idx=None, end_idx=None):
+    """
+    Rute optimal (eksak) satu cluster dengan dynamic programming Held-Karp.
+
+    Dengan titik awal/akhir dicari lintasan terpendek Garasi -> semua TPS -> TPA;
+    tanpa titik tetap dicari lintasan terbuka terpendek (awal dan akhir bebas).
+    Tabel dp[mask, j] = jarak terpendek yang mengunjungi himpunan TPS mask dan berakhir
+    di TPS j. Tabel diisi per lapis jumlah bit: semua mask dengan jumlah TPS yang sama
+    diperluas sekaligus dengan operasi NumPy. Memori dan waktu O(2^n * n^2), jadi hanya
+    untuk cluster kecil (lihat EXACT_ROUTE_MAX_SIZE).
+
+    Returns:
+        tuple: (rute berupa indeks asli, total jarak)
+    """
+    use_fixed_points = start_idx is not None and end_idx is not None
+    members = list(cluster)
+    m = len(members)
+    if m == 0:
+        if use_fixed_points:
+            return [start_idx, end_idx], float(distance_matrix[start_idx][end_idx])
+        return [], 0
+    if m == 1 and not use_fixed_points:
+        return members, 0
+
+    nodes = np.asarray(members)
+    sub_matrix = np.asarray(distance_matrix[np.ix_(nodes, nodes)], dtype=float)
+
+    n_masks = 1 << m
+    bits = 1 << np.arange(m)
+    dp = np.full((n_masks, m), np.inf)
+    parent = np.full((n_masks, m), -1, dtype=np.int16)
+
+    # Lapis pertama: rute yang baru mengunjungi satu TPS
+    if use_fixed_points:
+        dp[bits, np.arange(m)] = np.asarray(distance_matrix[start_idx, nodes], dtype=float)
+    else:
+        dp[bits, np.arange(m)] = 0.0
+
+    masks = np.arange(n_masks)
+    membership = ((masks[:, None] >> np.arange(m)) & 1).astype(bool)
+    popcount = membership.sum(axis=1)
+
+    for size in range(1, m):
+        layer = masks[popcount == size]
+        # candidate[i, j, k] = dp[mask_i, j] + d[j, k]; ambil j terbaik untuk setiap k
+        candidate = dp[layer][:, :, None] + sub_matrix[None, :, :]
+        best_prev = np.argmin(candidate, axis=1)
+        best_value = np.take_along_axis(candidate, best_prev[:, None, :], axis=1)[:, 0, :]
+
+        # Perluas hanya ke TPS k yang belum ada di mask (setiap mask baru punya satu asal)
+        rows, ks = np.nonzero(~membership[layer])
+        new_masks = layer[rows] | bits[ks]
+        dp[new_masks, ks] = best_value[rows, ks]
+        parent[new_masks, ks] = best_prev[rows, ks]
+
+    full_mask = n_masks - 1
+    final = dp[full_mask].copy()
+    if use_fixed_points:
+        final += np.asarray(distance_matrix[nodes, end_idx], dtype=float)
+    last = int(np.argmin(final))
+    best_distance = float(final[last])
+
+    # Telusuri balik urutan TPS dari tabel parent
+    order = []
+    mask = full_mask
+    while last >= 0:
+        order.append(members[last])
+        previous = int(parent[mask, last])
+        mask ^= 1 << last
+        last = previous
+    order.reverse()
+
+    if use_fixed_points:
+        return [start_idx] + order + [end_idx], best_distance
+    return order, best_distance
+
+
+def nearest_neighbor_route_lengths(clusters, distance_matrix, start_idx=None, end_idx=None, return_routes=False):
+    """
+    Panjang rute greedy nearest neighbor untuk banyak cluster sekaligus.
+    Semua cluster dijalankan serentak: setiap langkah memilih TPS terdekat yang belum
+    dikunjungi dengan argmin ter-mask pada array (jumlah cluster x ukuran cluster terbesar).
+
+    Dengan titik awal/akhir, rute dihitung Garasi -> TPS -> TPA (sama seperti yang
+    dioptimasi ACO). Tanpa titik tetap, rute dimulai dari TPS dengan indeks terkecil
+    agar hasilnya hanya bergantung pada anggota cluster.
+
+    Returns:
+        numpy.ndarray: Panjang rute setiap cluster; dengan return_routes=True juga
+        list urutan TPS setiap cluster (tanpa Garasi/TPA)
+    """
+    n_clusters = len(clusters)
+    lengths = np.zeros(n_clusters)
+    if n_clusters == 0:
+        return (lengths, []) if return_routes else lengths
+
+    use_fixed_points = start_idx is not None and end_idx is not None
+    sizes = np.array([len(cluster) for cluster in clusters])
+    max_size = int(sizes.max())
+
+    # Anggota tiap cluster (urut naik), dipadatkan ke kiri; slot kosong = padding
+    nodes = np.zeros((n_clusters, max(max_size, 1)), dtype=np.int64)
+    valid = np.arange(nodes.shape[1])[None, :] < sizes[:, None]
+    if max_size > 0:
+        nodes[valid] = np.concatenate([np.sort(np.asarray(cluster, dtype=np.int64)) for cluster in clusters if len(cluster) > 0])
+
+    rows = np.arange(n_clusters)
+    visited = ~valid
+    nonempty = sizes > 0
+
+    if use_fixed_points:
+        current = np.full(n_clusters, start_idx, dtype=np.int64)
+        steps = max_size
+    else:
+        current = nodes[:, 0].copy()
+        visited[:, 0] = True
+        steps = max_size - 1
+
+    visit_order = [nodes[:, 0].copy()] if not use_fixed_points else []
+    for _ in range(steps):
+        step_dist = np.where(visited, np.inf, distance_matrix[current[:, None], nodes])
+        next_pos = np.argmin(step_dist, axis=1)
+        best = step_dist[rows, next_pos]
+
+        # Cluster yang sudah selesai tidak punya kandidat (semua inf)
+        active = np.isfinite(best)
+        lengths[active] += best[active]
+        current[active] = nodes[rows[active], next_pos[active]]
+        visited[rows[active], next_pos[active]] = True
+        visit_order.append(current.copy())
+
+    if use_fixed_points:
+        lengths[nonempty] += distance_matrix[current[nonempty], end_idx]
+        lengths[~nonempty] = distance_matrix[start_idx, end_idx]
+
+    if return_routes:
+        # Kolom ke-t = TPS yang dikunjungi pada langkah t; ambil sebanyak ukuran cluster
+        order = np.column_stack(visit_order) if visit_order else np.zeros((n_clusters, 0), dtype=np.int64)
+        return lengths, [order[c, :sizes[c]].tolist() for c in range(n_clusters)]
+    return lengths
+
+
+def nearest_neighbor_route_length(cluster, distance_matrix, start_idx=None, end_idx=None):
+    """
+    Panjang rute greedy nearest neighbor satu cluster, dipakai sebagai estimasi cepat
+    pada fitness (ACO penuh terlalu lambat). Lihat nearest_neighbor_route_lengths.
+    """
+    if len(cluster) <= 1 and (start_idx is None or end_idx is None):
+        return 0
+    return float(nearest_neighbor_route_lengths([cluster], distance_matrix, start_idx, end_idx)[0])
+
+
+def pairwise_distance_stats(cluster, distance_matrix):
+    """
+    Statistik jarak antar pasangan TPS dalam cluster (pasangan i < j, urutan indeks naik).
+
+    Returns:
+        tuple: (total, rata-rata, maksimum); (0, 0, 0) untuk cluster < 2 TPS
+    """
+    if len(cluster) < 2:
+        return 0, 0, 0
+
+    members = np.sort(np.asarray(cluster))
+    rows, cols = np.triu_indices(len(members), k=1)
+    distances = distance_matrix[members[rows], members[cols]]
+    return float(distances.sum()), float(distances.mean()), float(distances.max())
+
+
+class RouteCostCache(LRUCache):
+    """
+    Cache biaya rute per cluster dengan kunci kanonik (jenis, frozenset TPS, ...).
+    Satu objek dipakai bersama oleh estimasi rute di fitness, optimasi ACO akhir dan
+    perhitungan metrik solusi, selama matriks jaraknya sama. Hanya hasil deterministik
+    yang disimpan: rute ACO bergantung pada generator acak run, sehingga menyimpannya
+    membuat hasil sebuah seed bergantung pada run lain yang memakai cache yang sama.
+    """
+
+    def __init__(self, maxsize=50000):
+        super().__init__(maxsize)
+
+    @staticmethod
+    def key(kind, cluster, *extra):
+        """Kunci cache: jenis biaya, anggota cluster (tanpa urutan) dan parameter tambahan"""
+        return (kind, frozenset(cluster)) + extra
+
+    def nearest_neighbor_lengths(self, clusters, distance_matrix, start_idx=None, end_idx=None):
+        """
+        nearest_neighbor_route_lengths dengan cache: cluster yang belum tersimpan
+        dihitung bersama dalam satu batch.
+        """
+        lengths = [None] * len(clusters)
+        missing = []
+        for i, cluster in enumerate(clusters):
+            lengths[i] = self.get(self.key('nn', cluster, start_idx, end_idx))
+            if lengths[i] is None:
+                missing.append(i)
+
+        if missing:
+            computed = nearest_neighbor_route_lengths(
+                [clusters[i] for i in missing], distance_matrix, start_idx, end_idx
+            )
+            for i, length in zip(missing, computed):
+                lengths[i] = float(length)
+                self.put(self.key('nn', clusters[i], start_idx, end_idx), lengths[i])
+
+        return lengths
+
+    def improved_lengths(self, clusters, distance_matrix, start_idx=None, end_idx=None):
+        """
+        Panjang rute nearest neighbor yang diperbaiki dengan local search (2-opt, Or-opt,
+        swap); lebih akurat dari nearest_neighbor_lengths namun lebih mahal.
+        """
+        lengths = [None] * len(clusters)
+        missing = []
+        for i, cluster in enumerate(clusters):
+            lengths[i] = self.get(self.key('nn_ls', cluster, start_idx, end_idx))
+            if lengths[i] is None:
+                missing.append(i)
+
+        if missing:
+            use_fixed_points = start_idx is not None and end_idx is not None
+            _, routes = nearest_neighbor_route_lengths(
+                [clusters[i] for i in missing], distance_matrix, start_idx, end_idx, return_routes=True
+            )
+            for i, route in zip(missing, routes):
+                if use_fixed_points:
+                    route = [start_idx] + route + [end_idx]
+                _, length = improve_route(route, distance_matrix, fixed_start=use_fixed_points,
+                                          fixed_end=use_fixed_points)
+                lengths[i] = float(length)
+                self.put(self.key('nn_ls', clusters[i], start_idx, end_idx), lengths[i])
+
+        return lengths
+
+    def pairwise_stats(self, cluster, distance_matrix):
+        """pairwise_distance_stats dengan cache"""
+        if len(cluster) < 2:
+            return 0, 0, 0
+        return self.cached(
+            self.key('pairwise', cluster),
+            lambda: pairwise_distance_stats(cluster, distance_matrix)
+        )
+
+    @staticmethod
+    def _is_deterministic_route(cluster, exact_max_size):
+        """Rute trivial (<= 2 TPS) dan rute eksak (Held-Karp) tidak bergantung pada generator acak"""
+        return len(cluster) <= max(2, exact_max_size or 0)
+
+    def aco_routes(self, clusters, distance_matrix, start_idx=None, end_idx=None, num_ants=10, num_iterations=50,
+                   variant="as", candidate_size=8, exact_max_size=None, local_search=False, max_workers=1,
+                   progress_callback=None, rng=None):
+        """
+        optimize_route_aco untuk banyak cluster. Rute eksak/trivial diambil dari cache
+        (tidak bergantung pada parameter ACO, cukup satu entri per cluster); cluster yang
+        membutuhkan ACO selalu dihitung dengan rng run ini, paralel dengan
+        optimize_routes_parallel, dan tidak disimpan. progress_callback(selesai, total,
+        indeks) dipanggil sekali per cluster.
+
+        Returns:
+            list: (rute, jarak) per cluster, urutan sama dengan clusters
+        """
+        aco_kwargs = {
+            'num_ants': num_ants, 'num_iterations': num_iterations, 'variant': variant,
+            'candidate_size': candidate_size, 'exact_max_size': exact_max_size, 'local_search': local_search
+        }
+        total = len(clusters)
+        results = [None] * total
+        done = 0
+
+        # Cluster kecil (trivial/eksak) cukup dihitung langsung di process ini
+        heavy = []
+        for i, cluster in enumerate(clusters):
+            if not self._is_deterministic_route(cluster, exact_max_size):
+                heavy.append(i)
+                continue
+            key = self.key('exact', cluster, start_idx, end_idx)
+            results[i] = self.get(key)
+            if results[i] is None:
+                results[i] = optimize_route_aco(list(cluster), distance_matrix, start_idx=start_idx,
+                                                end_idx=end_idx, **aco_kwargs)
+                self.put(key, results[i])
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, i)
+
+        if heavy:
+            def on_cluster_done(heavy_done, heavy_total, j):
+                if progress_callback:
+                    progress_callback(done + heavy_done, total, heavy[j])
+
+            computed = optimize_routes_parallel(
+                [clusters[i] for i in heavy], distance_matrix, start_idx, end_idx,
+                max_workers=max_workers, progress_callback=on_cluster_done, rng=rng, **aco_kwargs
+            )
+            for i, result in zip(heavy, computed):
+                results[i] = result
+
+        return [(list(route), distance) for route, distance in results]
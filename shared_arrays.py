@@ -0,0 +1,96 @@
+"""
+Shared Arrays - Berbagi array NumPy besar (matriks jarak, volume) antar process
+Process utama menyalin array sekali ke multiprocessing.shared_memory; worker hanya
+menerima deskriptor kecil (nama segmen, shape, dtype) lalu memetakan segmen yang sama
+tanpa salinan. Segmen selalu di-unlink oleh pemiliknya, termasuk saat run gagal.
+"""
+
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedArrays:
+    """
+    Pemilik segmen shared memory untuk sekumpulan array bernama.
+
+    Dipakai sebagai context manager: segmen dibuat saat masuk dan dibersihkan saat
+    keluar, juga bila terjadi exception. weakref.finalize menjadi cadangan bila objek
+    dibuang tanpa close(); pada POSIX resource tracker Python membersihkan segmen
+    yang tertinggal bila process utama mati mendadak.
+    """
+
+    def __init__(self, arrays):
+        """
+        Args:
+            arrays (dict): nama -> array (disalin sekali ke shared memory)
+        """
+        self._segments = []
+        self._descriptor = {}
+        self.arrays = {}
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._segments.append(segment)
+
+                shared = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+                shared[...] = array
+                self.arrays[name] = shared
+                self._descriptor[name] = (segment.name, array.shape, array.dtype.str)
+        except Exception:
+            _release_segments(self._segments, unlink=True)
+            raise
+
+        self._finalizer = weakref.finalize(self, _release_segments, self._segments, True)
+
+    def descriptor(self):
+        """Deskriptor yang dapat di-pickle untuk attach_shared_arrays di worker"""
+        return dict(self._descriptor)
+
+    def close(self):
+        """Lepas dan hapus semua segmen (aman dipanggil berulang kali)"""
+        self.arrays = {}
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _release_segments(segments, unlink):
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            # Masih ada view NumPy yang hidup; unlink tetap menghapus nama segmen
+            pass
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+    segments.clear()
+
+
+def attach_shared_arrays(descriptor):
+    """
+    Petakan segmen dari SharedArrays.descriptor() di worker process (tanpa salinan).
+
+    Returns:
+        tuple: (dict nama -> numpy.ndarray read-only, list handle segmen). Handle harus
+        disimpan selama array dipakai; worker tidak pernah meng-unlink segmen.
+    """
+    arrays = {}
+    handles = []
+    for name, (segment_name, shape, dtype) in descriptor.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        handles.append(segment)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+        array.flags.writeable = False
+        arrays[name] = array
+    return arrays, handles
@@ -0,0 +1,369 @@
+"""
+Solution Encoding - Representasi solusi sebagai vektor label (assignment vector)
+labels[i] = nomor cluster TPS i (int32), -1 berarti TPS belum masuk cluster.
+Semua pemeriksaan cakupan, kapasitas dan perbaikan solusi dilakukan dengan NumPy,
+sehingga tetap cepat untuk ribuan titik pengumpulan.
+"""
+
+import numpy as np
+
+
+UNASSIGNED = -1
+
+
+def clusters_to_labels(clusters, n_points):
+    """
+    Ubah list[list[int]] menjadi vektor label.
+    TPS yang muncul lebih dari sekali tetap berada di cluster kemunculan pertamanya.
+
+    Returns:
+        tuple: (labels, duplicates) dengan duplicates = jumlah kemunculan ganda yang dibuang
+    """
+    labels = np.full(n_points, UNASSIGNED, dtype=np.int32)
+    if not clusters:
+        return labels, 0
+
+    members = np.concatenate([np.asarray(cluster, dtype=np.int64) for cluster in clusters])
+    owners = np.repeat(np.arange(len(clusters), dtype=np.int32), [len(cluster) for cluster in clusters])
+
+    # np.unique mengembalikan indeks kemunculan pertama setiap TPS
+    unique_members, first_pos = np.unique(members, return_index=True)
+    labels[unique_members] = owners[first_pos]
+
+    return labels, len(members) - len(unique_members)
+
+
+def compact_labels(labels):
+    """Nomori ulang cluster menjadi 0..k-1 tanpa celah (TPS belum masuk tetap -1)"""
+    labels = np.asarray(labels, dtype=np.int32)
+    compact = np.full(len(labels), UNASSIGNED, dtype=np.int32)
+    assigned = labels >= 0
+    if assigned.any():
+        _, compact[assigned] = np.unique(labels[assigned], return_inverse=True)
+    return compact
+
+
+def labels_to_clusters(labels):
+    """Ubah vektor label menjadi list[list[int]] (cluster kosong dan TPS -1 diabaikan)"""
+    labels = compact_labels(labels)
+    assigned = np.flatnonzero(labels >= 0)
+    if len(assigned) == 0:
+        return []
+
+    order = assigned[np.argsort(labels[assigned], kind='stable')]
+    sizes = np.bincount(labels[assigned])
+    return [chunk.tolist() for chunk in np.split(order, np.cumsum(sizes)[:-1])]
+
+
+def cluster_volume_sums(labels, volumes, n_clusters=None):
+    """Total volume per cluster dengan np.bincount"""
+    labels = np.asarray(labels)
+    assigned = labels >= 0
+    if n_clusters is None:
+        n_clusters = int(labels.max()) + 1 if assigned.any() else 0
+    return np.bincount(labels[assigned], weights=np.asarray(volumes, dtype=float)[assigned],
+                       minlength=n_clusters)
+
+
+def check_labels(labels, volumes, min_capacity, max_capacity):
+    """
+    Periksa cakupan dan kapasitas sebuah vektor label.
+
+    Returns:
+        dict: missing (indeks TPS tanpa cluster), cluster_volumes, under_capacity
+              dan over_capacity (indeks cluster yang melanggar)
+    """
+    cluster_volumes = cluster_volume_sums(labels, volumes)
+    return {
+        'missing': np.flatnonzero(np.asarray(labels) < 0),
+        'cluster_volumes': cluster_volumes,
+        'under_capacity': np.flatnonzero(cluster_volumes < min_capacity),
+        'over_capacity': np.flatnonzero(cluster_volumes > max_capacity)
+    }
+
+
+def cluster_medoids(labels, distance_matrix, n_clusters=None):
+    """
+    Medoid setiap cluster: anggota dengan total jarak (pergi + pulang) terkecil ke
+    anggota lain. Untuk banyak cluster kecil, total jarak dihitung dari semua pasangan
+    sesama anggota (jumlah ukuran cluster kuadrat) dengan np.bincount; untuk sedikit
+    cluster besar, dengan perkalian matriks terhadap matriks keanggotaan one-hot (n x k).
+
+    Returns:
+        numpy.ndarray: Indeks TPS medoid per cluster (-1 untuk cluster kosong)
+    """
+    labels = np.asarray(labels)
+    assigned = np.flatnonzero(labels >= 0)
+    if n_clusters is None:
+        n_clusters = int(labels.max()) + 1 if len(assigned) else 0
+
+    medoids = np.full(n_clusters, UNASSIGNED, dtype=np.int64)
+    if len(assigned) == 0:
+        return medoids
+
+    D = np.asarray(distance_matrix, dtype=float)
+    sizes = np.bincount(labels[assigned], minlength=n_clusters)
+    if int((sizes ** 2).sum()) <= len(labels) * n_clusters:
+        to_own = _pairwise_to_own(labels[assigned], assigned, sizes, D)
+    else:
+        membership = np.zeros((len(labels), n_clusters))
+        membership[assigned, labels[assigned]] = 1.0
+        to_own = ((D[assigned] @ membership) + (membership.T @ D[:, assigned]).T)[np.arange(len(assigned)),
+                                                                                 labels[assigned]]
+
+    # Urutkan per cluster lalu per total jarak: elemen pertama setiap cluster adalah medoidnya
+    order = np.lexsort((to_own, labels[assigned]))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = labels[assigned][order][1:] != labels[assigned][order][:-1]
+    medoids[labels[assigned][order][first]] = assigned[order][first]
+    return medoids
+
+
+def _pairwise_to_own(assigned_labels, assigned, sizes, D):
+    """Total jarak pergi + pulang setiap TPS ke sesama anggota cluster, lewat daftar pasangan"""
+    order = np.argsort(assigned_labels, kind='stable')
+    members = assigned[order]
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    # Pasangan (TPS, anggota lain di cluster yang sama) untuk setiap TPS, urut per cluster
+    group_sizes = sizes[assigned_labels[order]]
+    rows = np.repeat(np.arange(len(members)), group_sizes)
+    within = np.arange(len(rows)) - np.repeat(np.cumsum(group_sizes) - group_sizes, group_sizes)
+    cols = starts[assigned_labels[order]][rows] + within
+
+    a, b = members[rows], members[cols]
+    totals = np.bincount(rows, weights=D[a, b] + D[b, a], minlength=len(members))
+    to_own = np.empty(len(members))
+    to_own[order] = totals
+    return to_own
+
+
+def repair_labels(labels, volumes, max_capacity, distance_matrix=None):
+    """
+    Masukkan setiap TPS tanpa cluster (-1) ke cluster yang masih muat.
+
+    Tanpa distance_matrix: first-fit ke cluster pertama yang muat; sisanya dikemas
+    menjadi cluster baru, diurutkan dari volume terbesar.
+    Dengan distance_matrix: best-fit, TPS (volume terbesar dulu) masuk ke cluster dengan
+    medoid terdekat di antara cluster yang masih muat (cek kapasitas semua cluster
+    sekaligus); bila tidak ada yang muat, TPS membuka cluster baru sebagai medoidnya.
+
+    Returns:
+        numpy.ndarray: Vektor label baru (ter-compact)
+    """
+    labels = compact_labels(labels)
+    volumes = np.asarray(volumes, dtype=float)
+    missing = np.flatnonzero(labels < 0)
+    if len(missing) == 0:
+        return labels
+
+    n_clusters = int(labels.max()) + 1 if len(missing) < len(labels) else 0
+    cluster_volumes = cluster_volume_sums(labels, volumes, n_clusters)
+
+    if distance_matrix is not None:
+        return _repair_best_fit(labels, volumes, max_capacity, distance_matrix, missing, cluster_volumes)
+
+    # First-fit ke cluster yang ada: pengecekan kapasitas seluruh cluster sekaligus
+    leftover = []
+    for tps in missing:
+        fits = np.flatnonzero(cluster_volumes + volumes[tps] <= max_capacity)
+        if len(fits) > 0:
+            labels[tps] = fits[0]
+            cluster_volumes[fits[0]] += volumes[tps]
+        else:
+            leftover.append(tps)
+
+    # Create new clusters for remaining TPS, sorted by volume for better packing
+    if leftover:
+        leftover = np.asarray(leftover)
+        leftover = leftover[np.argsort(-volumes[leftover], kind='stable')]
+
+        current_label = n_clusters
+        current_volume = 0.0
+        for i, tps in enumerate(leftover):
+            if i > 0 and current_volume + volumes[tps] > max_capacity:
+                current_label += 1
+                current_volume = 0.0
+            labels[tps] = current_label
+            current_volume += volumes[tps]
+
+    return labels
+
+
+def _repair_best_fit(labels, volumes, max_capacity, distance_matrix, missing, cluster_volumes):
+    """Best-fit berdasarkan jarak ke medoid (lihat repair_labels)"""
+    n_clusters = len(cluster_volumes)
+    medoids = cluster_medoids(labels, distance_matrix, n_clusters)
+
+    # Kapasitas cadangan untuk cluster baru yang mungkin dibuka (paling banyak satu per TPS)
+    medoids = np.concatenate([medoids, np.full(len(missing), UNASSIGNED, dtype=np.int64)])
+    cluster_volumes = np.concatenate([cluster_volumes, np.zeros(len(missing))])
+
+    # Jarak setiap TPS yang hilang ke medoid cluster yang sudah ada, sekali untuk semua
+    distances = np.full((len(missing), len(medoids)), np.inf)
+    existing = np.flatnonzero(medoids[:n_clusters] >= 0)
+    if len(existing):
+        to_medoid = np.asarray(distance_matrix[np.ix_(missing, medoids[existing])], dtype=float)
+        from_medoid = np.asarray(distance_matrix[np.ix_(medoids[existing], missing)], dtype=float)
+        distances[:, existing] = to_medoid + from_medoid.T
+
+    # Volume terbesar dulu (paling sulit ditempatkan); urutan sort stabil -> hasil deterministik
+    for row in np.argsort(-volumes[missing], kind='stable'):
+        tps = missing[row]
+        costs = np.where(cluster_volumes + volumes[tps] <= max_capacity, distances[row], np.inf)
+        target = int(np.argmin(costs))
+        if not np.isfinite(costs[target]):
+            # Tidak ada cluster yang muat: buka cluster baru dengan TPS ini sebagai medoid
+            target = n_clusters
+            n_clusters += 1
+            medoids[target] = tps
+            distances[:, target] = (np.asarray(distance_matrix[missing, tps], dtype=float) +
+                                    np.asarray(distance_matrix[tps, missing], dtype=float))
+        labels[tps] = target
+        cluster_volumes[target] += volumes[tps]
+
+    return labels
+
+
+def balance_min_capacity(labels, volumes, min_capacity, max_capacity, distance_matrix):
+    """
+    Geser TPS ke cluster yang volumenya di bawah min_capacity, cluster dengan kekurangan
+    terbesar dulu. Setiap langkah menarik TPS terdekat (jarak pulang-pergi ke medoid
+    cluster tujuan) dari cluster lain yang tetap >= min_capacity setelah melepasnya,
+    tanpa melewati max_capacity. Cluster yang tetap kurang dibubarkan bila semua
+    anggotanya muat di cluster lain (cluster dengan medoid terdekat dulu).
+
+    Returns:
+        numpy.ndarray: Vektor label baru (ter-compact)
+    """
+    labels = compact_labels(labels)
+    volumes = np.asarray(volumes, dtype=float)
+    if not (labels >= 0).any():
+        return labels
+
+    D = np.asarray(distance_matrix, dtype=float)
+    n_clusters = int(labels.max()) + 1
+    cluster_volumes = cluster_volume_sums(labels, volumes, n_clusters)
+    medoids = cluster_medoids(labels, D, n_clusters)
+
+    for c in np.argsort(cluster_volumes, kind='stable'):
+        if cluster_volumes[c] >= min_capacity or medoids[c] < 0:
+            continue
+        distances = D[:, medoids[c]] + D[medoids[c], :]
+
+        while cluster_volumes[c] < min_capacity:
+            donors = np.where(labels >= 0, cluster_volumes[np.maximum(labels, 0)], 0.0)
+            movable = ((labels >= 0) & (labels != c) & (donors - volumes >= min_capacity) &
+                       (cluster_volumes[c] + volumes <= max_capacity))
+            if not movable.any():
+                break
+            tps = int(np.argmin(np.where(movable, distances, np.inf)))
+            cluster_volumes[labels[tps]] -= volumes[tps]
+            cluster_volumes[c] += volumes[tps]
+            labels[tps] = c
+
+        if cluster_volumes[c] >= min_capacity:
+            continue
+
+        # Bubarkan cluster: setiap anggota ke medoid terdekat yang masih muat
+        members = np.flatnonzero(labels == c)
+        others = np.flatnonzero((np.arange(n_clusters) != c) & (cluster_volumes > 0) & (medoids >= 0))
+        if len(others) == 0:
+            continue
+        trial = cluster_volumes.copy()
+        targets = []
+        costs = D[np.ix_(members, medoids[others])] + D[np.ix_(medoids[others], members)].T
+        for row in np.argsort(-volumes[members], kind='stable'):
+            options = np.where(trial[others] + volumes[members[row]] <= max_capacity, costs[row], np.inf)
+            best = int(np.argmin(options))
+            if not np.isfinite(options[best]):
+                targets = None
+                break
+            trial[others[best]] += volumes[members[row]]
+            targets.append((members[row], others[best]))
+        if targets is not None:
+            for tps, target in targets:
+                labels[tps] = target
+            trial[c] = 0.0
+            cluster_volumes = trial
+
+    return compact_labels(labels)
+
+
+def population_to_label_matrix(population, n_points):
+    """Susun label seluruh populasi menjadi matriks int32 (ukuran populasi x n_points)"""
+    matrix = np.empty((len(population), n_points), dtype=np.int32)
+    for row, solution in enumerate(population):
+        if hasattr(solution, 'labels'):
+            matrix[row] = solution.labels()
+        else:
+            matrix[row] = clusters_to_labels(solution, n_points)[0]
+    return matrix
+
+
+def partition_distances(label_matrix, max_bins=1 << 20):
+    """
+    Jarak antar partisi 1 - ARI (adjusted Rand index) untuk setiap pasangan baris
+    matriks label. ARI dihitung dari tabel kontingensi setiap pasangan, sehingga nomor
+    cluster dan urutan TPS tidak berpengaruh: 0 = partisi identik, sekitar 1 = tidak
+    lebih mirip daripada partisi acak. Sel kontingensi dihitung jarang (sort kode sel
+    per pasangan, O(n log n)); tabel k x k padat (np.bincount) hanya dipakai bila
+    k^2 <= n_points, sehingga biaya tidak tumbuh dengan kuadrat jumlah cluster.
+
+    Args:
+        label_matrix (numpy.ndarray): Matriks label (jumlah solusi x n_points)
+        max_bins (int): Batas elemen kerja per blok pasangan (membatasi memori)
+
+    Returns:
+        numpy.ndarray: Jarak untuk pasangan (i, j), i < j, urut seperti np.triu_indices
+    """
+    labels = np.asarray(label_matrix, dtype=np.int64) + 1  # TPS -1 menjadi kelompok sendiri
+    n_solutions, n_points = labels.shape
+    rows_i, rows_j = np.triu_indices(n_solutions, k=1)
+    if len(rows_i) == 0 or n_points < 2:
+        return np.zeros(len(rows_i))
+
+    k = int(labels.max()) + 1
+    total_pairs = n_points * (n_points - 1) / 2
+
+    # Pasangan TPS yang satu cluster di masing-masing solusi: sum C(ukuran cluster, 2)
+    sizes = np.bincount((np.arange(n_solutions)[:, None] * k + labels).ravel(),
+                        minlength=n_solutions * k).reshape(n_solutions, k)
+    same_a = (sizes * (sizes - 1) / 2).sum(axis=1)
+
+    # Pasangan TPS yang satu cluster di kedua solusi: sum C(n_ij, 2) dari tabel kontingensi
+    same_both = np.empty(len(rows_i))
+    dense = k * k <= n_points
+    block = max(1, max_bins // (k * k if dense else n_points))
+    positions = np.arange(n_points)
+    for start in range(0, len(rows_i), block):
+        bi, bj = rows_i[start:start+block], rows_j[start:start+block]
+        codes = labels[bi] * k + labels[bj]
+        if dense:
+            offsets = np.arange(len(bi))[:, None] * (k * k)
+            counts = np.bincount((offsets + codes).ravel(), minlength=len(bi) * k * k)
+            same_both[start:start+block] = (counts * (counts - 1) / 2).reshape(len(bi), -1).sum(axis=1)
+        else:
+            # Kode sel terurut per baris; TPS ke-r dalam run kode yang sama membentuk r pasangan
+            # baru, sehingga jumlah posisi-dalam-run = sum C(n_ij, 2)
+            codes.sort(axis=1)
+            run_start = np.ones(codes.shape, dtype=bool)
+            run_start[:, 1:] = codes[:, 1:] != codes[:, :-1]
+            first = np.maximum.accumulate(np.where(run_start, positions, 0), axis=1)
+            same_both[start:start+block] = (positions - first).sum(axis=1)
+
+    a, b = same_a[rows_i], same_a[rows_j]
+    expected = a * b / total_pairs
+    maximum = (a + b) / 2
+    denominator = maximum - expected
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ari = np.where(denominator > 0, (same_both - expected) / denominator, 1.0)
+    # Dua partisi trivial (semua satu cluster / semua terpisah) identik bila pasangannya sama
+    ari = np.where((denominator <= 0) & (a != b), 0.0, ari)
+    return np.clip(1.0 - ari, 0.0, 1.0)
+
+
+def population_diversity(label_matrix):
+    """Rata-rata jarak partisi (1 - ARI) seluruh pasangan solusi dalam populasi"""
+    distances = partition_distances(label_matrix)
+    return float(distances.mean()) if len(distances) else 0.0
@@ -0,0 +1,268 @@
+"""
+Solution State - Representasi solusi clustering dengan evaluasi inkremental
+Setiap solusi menyimpan volume dan panjang rute per cluster. Operator GA/VNS
+(swap, move, split, merge) hanya menandai cluster yang tersentuh,
+sehingga evaluasi ulang cukup menghitung rute cluster tersebut.
+"""
+
+import numpy as np
+
+from cache_utils import LRUCache
+from solution_encoding import clusters_to_labels, labels_to_clusters
+
+
+# Bobot penalti fitness
+MISSING_PENALTY = 1000000
+DUPLICATE_PENALTY = 1000000
+UNDER_CAPACITY_PENALTY = 10000
+OVER_CAPACITY_PENALTY = 100000
+
+
+class FitnessCache(LRUCache):
+    """
+    Cache LRU untuk hasil fitness, dengan kunci partisi kanonik
+    (frozenset dari frozenset TPS) sehingga urutan cluster/TPS tidak berpengaruh.
+    """
+
+
+class SolutionEvaluator:
+    """
+    Data masalah yang dibutuhkan untuk menilai solusi: volume, batas kapasitas,
+    bobot jarak dan fungsi panjang rute per cluster.
+    """
+
+    def __init__(self, volumes, min_capacity, max_capacity, route_lengths, distance_penalty=1.0,
+                 fitness_cache=None):
+        """
+        Args:
+            volumes (list): Volume sampah setiap TPS
+            min_capacity (float): Kapasitas minimum cluster
+            max_capacity (float): Kapasitas maksimum cluster
+            route_lengths (callable): route_lengths(clusters) -> panjang rute setiap cluster
+            distance_penalty (float): Bobot jarak rute pada fitness
+            fitness_cache (FitnessCache): Opsional, cache fitness per partisi
+        """
+        self.volumes = np.asarray(volumes, dtype=float)
+        self.n_points = len(self.volumes)
+        self.min_capacity = min_capacity
+        self.max_capacity = max_capacity
+        self.route_lengths = route_lengths
+        self.distance_penalty = distance_penalty
+        self.fitness_cache = fitness_cache
+
+    def capacity_penalty(self, cluster_volume):
+        """Penalti kapasitas untuk satu cluster"""
+        penalty = 0
+        if cluster_volume < self.min_capacity:
+            penalty += (self.min_capacity - cluster_volume) * UNDER_CAPACITY_PENALTY
+        if cluster_volume > self.max_capacity:
+            penalty += (cluster_volume - self.max_capacity) * OVER_CAPACITY_PENALTY
+        return penalty
+
+
+class ClusterSolution:
+    """
+    Solusi clustering (daftar cluster berisi indeks TPS) dengan cache per cluster.
+
+    Daftar TPS dalam cluster tidak pernah diubah di tempat: setiap move membuat list
+    baru untuk cluster yang tersentuh, sehingga copy() cukup menyalin daftar luar dan
+    cluster yang tidak berubah dapat dipakai bersama antar solusi. Fitness disimpan
+    pada objek dan hanya dihitung ulang setelah ada move.
+    """
+
+    def __init__(self, clusters, evaluator):
+        self.evaluator = evaluator
+        self.clusters = [list(cluster) for cluster in clusters if cluster]
+
+        volumes = evaluator.volumes
+        self.cluster_volumes = [float(volumes[cluster].sum()) for cluster in self.clusters]
+        self.route_lengths = [None] * len(self.clusters)
+        self.cluster_keys = [None] * len(self.clusters)
+
+        # Cakupan TPS tidak berubah oleh move, cukup dihitung sekali
+        if self.clusters:
+            counts = np.bincount(np.concatenate(self.clusters), minlength=evaluator.n_points)
+        else:
+            counts = np.zeros(evaluator.n_points, dtype=int)
+        self.missing = int(np.count_nonzero(counts == 0))
+        self.duplicates = int(np.maximum(counts - 1, 0).sum())
+
+        self._fitness = None
+        self._labels = None
+
+    @classmethod
+    def from_labels(cls, labels, evaluator):
+        """Bangun solusi dari vektor label (lihat solution_encoding)"""
+        return cls(labels_to_clusters(labels), evaluator)
+
+    def copy(self):
+        """Salin solusi; cluster dan cache-nya dipakai bersama sampai diubah"""
+        new = ClusterSolution.__new__(ClusterSolution)
+        new.evaluator = self.evaluator
+        new.clusters = list(self.clusters)
+        new.cluster_volumes = list(self.cluster_volumes)
+        new.route_lengths = list(self.route_lengths)
+        new.cluster_keys = list(self.cluster_keys)
+        new.missing = self.missing
+        new.duplicates = self.duplicates
+        new._fitness = self._fitness
+        new._labels = self._labels
+        return new
+
+    def __len__(self):
+        return len(self.clusters)
+
+    def __iter__(self):
+        return iter(self.clusters)
+
+    def __getitem__(self, idx):
+        return self.clusters[idx]
+
+    def to_lists(self):
+        """Kembalikan solusi sebagai list[list[int]] baru"""
+        return [list(cluster) for cluster in self.clusters]
+
+    def labels(self):
+        """Vektor label int32 (dibangun sekali sampai ada move berikutnya, jangan diubah)"""
+        if self._labels is None:
+            self._labels, _ = clusters_to_labels(self.clusters, self.evaluator.n_points)
+        return self._labels
+
+    # ------------------------------------------------------------------
+    # Move inkremental
+    # ------------------------------------------------------------------
+
+    def _set_cluster(self, c, members, volume=None):
+        """Ganti isi cluster c dan tandai rutenya untuk dihitung ulang"""
+        self.clusters[c] = members
+        if volume is None:
+            volume = float(self.evaluator.volumes[members].sum()) if members else 0.0
+        self.cluster_volumes[c] = volume
+        self.route_lengths[c] = None
+        self.cluster_keys[c] = None
+        self._fitness = None
+        self._labels = None
+
+    def _remove_cluster(self, c):
+        self.clusters.pop(c)
+        self.cluster_volumes.pop(c)
+        self.route_lengths.pop(c)
+        self.cluster_keys.pop(c)
+        self._fitness = None
+        self._labels = None
+
+    def _append_cluster(self, members, volume=None):
+        self.clusters.append([])
+        self.cluster_volumes.append(0.0)
+        self.route_lengths.append(None)
+        self.cluster_keys.append(None)
+        self._set_cluster(len(self.clusters) - 1, members, volume)
+
+    def swap(self, c1, pos1, c2, pos2):
+        """Tukar TPS pada posisi pos1 di cluster c1 dengan TPS pada posisi pos2 di cluster c2"""
+        volumes = self.evaluator.volumes
+        tps1 = self.clusters[c1][pos1]
+        tps2 = self.clusters[c2][pos2]
+        delta = volumes[tps2] - volumes[tps1]
+
+        new1 = list(self.clusters[c1])
+        new2 = list(self.clusters[c2])
+        new1[pos1] = tps2
+        new2[pos2] = tps1
+
+        self._set_cluster(c1, new1, self.cluster_volumes[c1] + delta)
+        self._set_cluster(c2, new2, self.cluster_volumes[c2] - delta)
+
+    def move(self, c_from, pos, c_to):
+        """Pindahkan TPS pada posisi pos dari cluster c_from ke akhir cluster c_to"""
+        tps = self.clusters[c_from][pos]
+        volume = self.evaluator.volumes[tps]
+
+        new_from = self.clusters[c_from][:pos] + self.clusters[c_from][pos+1:]
+        self._set_cluster(c_to, self.clusters[c_to] + [tps], self.cluster_volumes[c_to] + volume)
+        self._set_cluster(c_from, new_from, self.cluster_volumes[c_from] - volume)
+
+        # Remove empty clusters
+        if not new_from:
+            self._remove_cluster(c_from)
+
+    def split(self, c, split_point):
+        """Pecah cluster c menjadi [:split_point] dan [split_point:] (bagian kedua di akhir)"""
+        cluster = self.clusters[c]
+        part1 = cluster[:split_point]
+        part2 = cluster[split_point:]
+        self._set_cluster(c, part1)
+        self._append_cluster(part2)
+
+    def merge(self, c1, c2):
+        """Gabungkan cluster c2 ke dalam cluster c1"""
+        merged = self.clusters[c1] + self.clusters[c2]
+        self._set_cluster(c1, merged, self.cluster_volumes[c1] + self.cluster_volumes[c2])
+        self._remove_cluster(c2)
+
+    # ------------------------------------------------------------------
+    # Evaluasi
+    # ------------------------------------------------------------------
+
+    def partition_key(self):
+        """
+        Kunci kanonik partisi: frozenset dari frozenset TPS per cluster.
+        Kunci per cluster disimpan, jadi hanya cluster yang berubah yang dibangun ulang.
+        """
+        for c, key in enumerate(self.cluster_keys):
+            if key is None:
+                self.cluster_keys[c] = frozenset(self.clusters[c])
+        return frozenset(self.cluster_keys)
+
+    def ensure_route_lengths(self):
+        """Hitung panjang rute cluster yang berubah, bersama dalam satu batch"""
+        dirty = [c for c, length in enumerate(self.route_lengths) if length is None]
+        if dirty:
+            lengths = self.evaluator.route_lengths([self.clusters[c] for c in dirty])
+            for c, length in zip(dirty, lengths):
+                self.route_lengths[c] = length
+
+    def evaluate(self):
+        """
+        Hitung fitness, hanya menghitung ulang rute cluster yang berubah.
+
+        Returns:
+            tuple: (fitness, route_distance, capacity_violations, 0, missing_penalty, duplicate_penalty)
+        """
+        if self._fitness is not None:
+            return self._fitness
+
+        evaluator = self.evaluator
+
+        # Partisi identik (elit, klon) cukup dinilai sekali. Solusi dengan TPS hilang/duplikat
+        # tidak bisa diwakili frozenset secara utuh sehingga tidak disimpan di cache.
+        cache = evaluator.fitness_cache
+        key = None
+        if cache is not None and not self.missing and not self.duplicates:
+            key = self.partition_key()
+            cached = cache.get(key)
+            if cached is not None:
+                self._fitness = cached
+                return cached
+
+        self.ensure_route_lengths()
+
+        capacity_violations = sum(evaluator.capacity_penalty(volume) for volume in self.cluster_volumes)
+        total_route_distance = sum(self.route_lengths)
+        missing_penalty = self.missing * MISSING_PENALTY
+        duplicate_penalty = self.duplicates * DUPLICATE_PENALTY
+
+        total_fitness = (total_route_distance * evaluator.distance_penalty + capacity_violations +
+                         missing_penalty + duplicate_penalty)
+
+        self._fitness = (total_fitness, total_route_distance, capacity_violations, 0, missing_penalty, duplicate_penalty)
+        if key is not None:
+            cache.put(key, self._fitness)
+        return self._fitness
+
+    @property
+    def fitness(self):
+        """Nilai fitness (lebih kecil lebih baik)"""
+        if self._fitness is None:
+            self.evaluate()
+        return self._fitness[0]
@@ -0,0 +1,266 @@
+"""
+VNS Search - Variable Neighborhood Descent/Search untuk memperbaiki solusi clustering
+Neighborhood relocate (pindahkan satu TPS) dan swap (tukar dua TPS) dinilai dengan
+delta fitness: hanya dua cluster yang tersentuh yang dihitung ulang (cache rute per
+keanggotaan). Neighborhood bersifat granular: move hanya diusulkan antara TPS dan
+cluster yang berisi salah satu k tetangga terdekatnya (knn_index), sehingga scan
+tumbuh linear terhadap jumlah TPS. Mendukung first-improvement dan best-improvement,
+shaking dengan k bertambah, serta batas jumlah evaluasi move per panggilan.
+"""
+
+import numpy as np
+
+
+IMPROVEMENT_EPS = 1e-9
+DEFAULT_KNN_SIZE = 10
+KNN_BLOCK_ROWS = 1024
+
+
+def knn_index(distance_matrix, k=DEFAULT_KNN_SIZE):
+    """
+    k TPS terdekat untuk setiap TPS berdasarkan jarak pulang-pergi (d[i,j] + d[j,i]),
+    dipilih dengan argpartition per baris. Dihitung per blok baris agar memori tetap
+    O(blok x n) untuk ribuan titik.
+
+    Returns:
+        numpy.ndarray: Indeks tetangga (n x k), urut dari yang terdekat
+    """
+    D = np.asarray(distance_matrix, dtype=float)
+    n = len(D)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int64)
+
+    index = np.empty((n, k), dtype=np.int64)
+    for start in range(0, n, KNN_BLOCK_ROWS):
+        rows = np.arange(start, min(start + KNN_BLOCK_ROWS, n))
+        block = D[rows] + D[:, rows].T
+        block[np.arange(len(rows)), rows] = np.inf
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        ranks = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1, kind='stable')
+        index[rows] = np.take_along_axis(nearest, ranks, axis=1)
+    return index
+
+
+class NeighborhoodSearch:
+    """
+    Mesin VND/VNS untuk ClusterSolution. Solusi masukan tidak pernah diubah;
+    setiap perbaikan dilakukan pada salinan.
+    """
+
+    def __init__(self, evaluator, knn, rng, candidate_clusters=3, swap_candidates=3, strategy="first"):
+        """
+        Args:
+            evaluator (SolutionEvaluator): Penilai solusi (volume, kapasitas, panjang rute)
+            knn (numpy.ndarray): Indeks k tetangga terdekat per TPS (lihat knn_index)
+            rng (numpy.random.Generator): Sumber acak (urutan scan dan shaking)
+            candidate_clusters (int): Maksimum cluster tujuan per TPS (cluster tetangga terdekat dulu)
+            swap_candidates (int): Maksimum tetangga di cluster lain yang dicoba untuk swap
+            strategy (str): "first" (first-improvement) atau "best" (best-improvement)
+        """
+        if strategy not in ("first", "best"):
+            raise ValueError(f"Strategi VNS tidak dikenal: {strategy}")
+        self.evaluator = evaluator
+        self.knn = knn
+        self.rng = rng
+        self.candidate_clusters = candidate_clusters
+        self.swap_candidates = swap_candidates
+        self.strategy = strategy
+        self.evaluations = 0
+        self._budget = 0
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def vnd(self, solution, max_evaluations):
+        """
+        Variable Neighborhood Descent: relocate lalu swap; setiap perbaikan kembali ke
+        neighborhood pertama, berhenti di local optimum atau saat budget habis.
+
+        Returns:
+            ClusterSolution: Solusi terbaik (objek masukan jika tidak ada perbaikan)
+        """
+        self._budget = max_evaluations
+        improved = self._descend(solution.copy())
+        return improved if improved.fitness < solution.fitness - IMPROVEMENT_EPS else solution
+
+    def vns(self, solution, max_evaluations, k_max=3):
+        """
+        Basic VNS: VND pada solusi awal, lalu shaking k relocate acak (k = 1..k_max) diikuti
+        VND; k kembali ke 1 setiap ada perbaikan. Berhenti setelah satu putaran k tanpa
+        perbaikan atau saat budget evaluasi habis.
+
+        Returns:
+            ClusterSolution: Solusi terbaik (objek masukan jika tidak ada perbaikan)
+        """
+        self._budget = max_evaluations
+        best = self._descend(solution.copy())
+
+        k = 1
+        while k <= k_max and self._budget > 0:
+            candidate = self._descend(self._shake(best, k))
+            if candidate.fitness < best.fitness - IMPROVEMENT_EPS:
+                best = candidate
+                k = 1
+            else:
+                k += 1
+
+        return best if best.fitness < solution.fitness - IMPROVEMENT_EPS else solution
+
+    # ------------------------------------------------------------------
+    # Descent
+    # ------------------------------------------------------------------
+
+    def _descend(self, solution):
+        neighborhoods = (self._relocate_pass, self._swap_pass)
+        k = 0
+        while k < len(neighborhoods) and self._budget > 0:
+            if neighborhoods[k](solution):
+                k = 0
+            else:
+                k += 1
+        return solution
+
+    def _foreign_neighbors(self, labels, t):
+        """Tetangga terdekat t yang berada di cluster lain (urut dari yang terdekat)"""
+        neighbors = self.knn[t]
+        neighbor_labels = labels[neighbors]
+        keep = (neighbor_labels != labels[t]) & (neighbor_labels >= 0)
+        return neighbors[keep], neighbor_labels[keep]
+
+    def _candidate_clusters(self, labels, t):
+        """Cluster yang berisi tetangga terdekat t, urut dari tetangga terdekat"""
+        _, neighbor_labels = self._foreign_neighbors(labels, t)
+        _, first = np.unique(neighbor_labels, return_index=True)
+        return neighbor_labels[np.sort(first)][:self.candidate_clusters]
+
+    def _move_deltas(self, solution, pairs, new_clusters):
+        """
+        Delta fitness untuk sekumpulan move dua-cluster.
+
+        Args:
+            pairs (list): (cluster a, cluster b) per move
+            new_clusters (list): (anggota baru a, anggota baru b) per move
+
+        Returns:
+            numpy.ndarray: Delta fitness setiap move (negatif = lebih baik)
+        """
+        evaluator = self.evaluator
+        volumes = evaluator.volumes
+        flat = [members for move in new_clusters for members in move if members]
+        lengths = iter(evaluator.route_lengths(flat)) if flat else iter(())
+
+        deltas = np.empty(len(pairs))
+        for i, ((a, b), move) in enumerate(zip(pairs, new_clusters)):
+            old = (evaluator.distance_penalty * (solution.route_lengths[a] + solution.route_lengths[b]) +
+                   evaluator.capacity_penalty(solution.cluster_volumes[a]) +
+                   evaluator.capacity_penalty(solution.cluster_volumes[b]))
+            new = 0.0
+            for members in move:
+                if members:
+                    new += (evaluator.distance_penalty * next(lengths) +
+                            evaluator.capacity_penalty(float(volumes[members].sum())))
+            deltas[i] = new - old
+
+        self._budget -= len(pairs)
+        self.evaluations += len(pairs)
+        return deltas
+
+    def _relocate_pass(self, solution):
+        """Relocate: pindahkan satu TPS ke salah satu cluster terdekat"""
+        solution.ensure_route_lengths()
+        labels = solution.labels()
+        best = None
+
+        for t in self.rng.permutation(len(labels)):
+            if self._budget <= 0:
+                break
+            a = int(labels[t])
+            candidates = self._candidate_clusters(labels, t)
+            if a < 0 or len(candidates) == 0:
+                continue
+
+            cluster_a = solution.clusters[a]
+            new_a = [x for x in cluster_a if x != t]
+            pairs = [(a, int(b)) for b in candidates]
+            moves = [(new_a, solution.clusters[b] + [t]) for _, b in pairs]
+            deltas = self._move_deltas(solution, pairs, moves)
+
+            i = int(np.argmin(deltas))
+            if deltas[i] < -IMPROVEMENT_EPS and (best is None or deltas[i] < best[0]):
+                best = (deltas[i], a, cluster_a.index(t), pairs[i][1])
+                if self.strategy == "first":
+                    break
+
+        if best is None:
+            return False
+        _, a, pos, b = best
+        solution.move(a, pos, b)
+        return True
+
+    def _swap_pass(self, solution):
+        """Swap: tukar TPS dengan salah satu tetangga terdekatnya yang berada di cluster lain"""
+        solution.ensure_route_lengths()
+        labels = solution.labels()
+        best = None
+
+        for t in self.rng.permutation(len(labels)):
+            if self._budget <= 0:
+                break
+            a = int(labels[t])
+            neighbors, neighbor_labels = self._foreign_neighbors(labels, t)
+            if a < 0 or len(neighbors) == 0:
+                continue
+
+            cluster_a = solution.clusters[a]
+            pos_t = cluster_a.index(t)
+            pairs, moves, positions = [], [], []
+            limit = self.swap_candidates
+            for u, b in zip(neighbors[:limit].tolist(), neighbor_labels[:limit].tolist()):
+                cluster_b = solution.clusters[b]
+                pos_u = cluster_b.index(u)
+                new_a = list(cluster_a)
+                new_b = list(cluster_b)
+                new_a[pos_t] = u
+                new_b[pos_u] = t
+                pairs.append((a, b))
+                moves.append((new_a, new_b))
+                positions.append(pos_u)
+            deltas = self._move_deltas(solution, pairs, moves)
+
+            i = int(np.argmin(deltas))
+            if deltas[i] < -IMPROVEMENT_EPS and (best is None or deltas[i] < best[0]):
+                best = (deltas[i], a, pos_t, pairs[i][1], positions[i])
+                if self.strategy == "first":
+                    break
+
+        if best is None:
+            return False
+        _, a, pos_t, b, pos_u = best
+        solution.swap(a, pos_t, b, pos_u)
+        return True
+
+    # ------------------------------------------------------------------
+    # Shaking
+    # ------------------------------------------------------------------
+
+    def _shake(self, solution, k):
+        """k relocate acak ke cluster tetangga yang masih muat (tanpa evaluasi)"""
+        shaken = solution.copy()
+        max_capacity = self.evaluator.max_capacity
+        volumes = self.evaluator.volumes
+
+        for _ in range(k):
+            labels = shaken.labels()
+            t = int(self.rng.integers(len(labels)))
+            a = int(labels[t])
+            candidates = self._candidate_clusters(labels, t)
+            if a < 0 or len(candidates) == 0 or len(shaken.clusters[a]) <= 1:
+                continue
+            b = int(candidates[int(self.rng.integers(len(candidates)))])
+            if shaken.cluster_volumes[b] + volumes[t] <= max_capacity:
+                shaken.move(a, shaken.clusters[a].index(t), b)
+
+        shaken.evaluate()
+        return shaken